@@ -11,7 +11,9 @@ Users just use file 'sell.py' (python sell.py QUESTION_FILE.txt)
 """
 
 
+import base64
 import subprocess
+import zlib
 
 print("pySELL builder - 2024 by Andreas Schwenk")
 
@@ -71,13 +73,19 @@ if __name__ == "__main__":
             skip = False
             # begin HTML
             py += "# @begin(html)\n"
-            # insert HTML as byte-strings
-            py += "HTML: str = b''\n"
-            html_bytes = html.encode("utf-8")
-            while len(html_bytes) > 0:
-                py += "HTML += " + str(html_bytes[:60]) + "\n"
-                html_bytes = html_bytes[60:]
-            py += "HTML = HTML.decode('utf-8')\n"
+            # insert HTML as ONE zlib compressed and base64 encoded
+            # byte-string. Adjacent literals are merged by the Python
+            # compiler, so there is no concatenation at import. The
+            # decompressed bytes are written to the output files without
+            # decoding.
+            py += "HTML: bytes = zlib.decompress(\n"
+            py += "    base64.b64decode(\n"
+            html_b64 = base64.b64encode(zlib.compress(html.encode("utf-8"), 9))
+            while len(html_b64) > 0:
+                py += "        " + str(html_b64[:76]) + "\n"
+                html_b64 = html_b64[76:]
+            py += "    )\n"
+            py += ")\n"
             # end HTML
             py += "# @end(html)\n"
         elif skip is False:
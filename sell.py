@@ -17,8 +17,11 @@ DOCS    Refer to https://github.com/andreas-schwenk/pysell and read the
 
 USAGE   Only file 'sell.py' is required to compile question files
         
-        COMMAND    python3 [-J] sell.py PATH
-        ARGUMENTS  -J is optional and generates a JSON output file for debugging        
+        COMMAND    python3 [-J] [-C] [-R] sell.py PATH
+        ARGUMENTS  -J is optional and generates a JSON output file for debugging
+                   -C is optional and reuses the compilation of an unchanged
+                      input file (random variables are NOT redrawn!)
+                   -R is optional and skips the debug output (*_DEBUG.html)
         EXAMPLE    python3 sell.py examples/ex1.txt
         OUTPUT     examples/ex1.html, examples/ex1_DEBUG.html
 
@@ -35,23 +38,49 @@ FAQ
 
 import base64
 import datetime
+import hashlib
 import io
 import json
+import mmap
 import os
 import re
 import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from types import CodeType
 from typing import Self
 
+try:
+    import orjson  # optional; serializes JSON considerably faster
+except ImportError:
+    orjson = None
+
 
 class SellError(Exception):
     """exception"""
 
 
+# The delimiters of the lexer, i.e. characters that end a token.
+lexer_delimiters = frozenset("`^'\"%#*$()[]{}\\,.:;+-*/_!<>\t\n =?|&")
+
+# A token of the lexer is either a quote ("..." or `...`, extending to the end
+# of the input if not terminated), a sequence of non-delimiters, or a single
+# delimiter. The scanning is done by the (C-coded) regular expression engine.
+lexer_token_re = re.compile(
+    '"[^"]*"?|`[^`]*`?|[^'
+    + "".join(re.escape(ch) for ch in sorted(lexer_delimiters))
+    + "]+|.",
+    re.DOTALL,
+)
+
+
 # pylint: disable-next=too-few-public-methods
 class Lexer:
     """Scanner that takes a string input and returns a sequence of tokens;
     one at a time."""
 
+    __slots__ = ("src", "token", "pos")
+
     def __init__(self, src: str) -> None:
         """sets the source to be scanned"""
         # the source code
@@ -65,37 +94,17 @@ class Lexer:
 
     def next(self) -> None:
         """gets the next token"""
-        # start with a fresh token
-        self.token = ""
-        # loop up to the next special character
-        stop = False
-        while not stop and self.pos < len(self.src):
-            # get the next character from the input
-            ch = self.src[self.pos]
-            # in case that we get a special character (a.k.a delimiter),
-            # we stop
-            if ch in "`^'\"%#*$()[]{}\\,.:;+-*/_!<>\t\n =?|&":
-                # if the current token is not empty, return it for now and
-                # keep the delimiter to the next call of next()
-                if len(self.token) > 0:
-                    return
-                # a delimiter stops further advancing in the input
-                stop = True
-                # keep quotes as a single token. Supported quote types are
-                # double quotes ("...") and accent grave quotes (`...`)
-                if ch in '"`':
-                    kind = ch  # " or `
-                    self.token += ch
-                    self.pos += 1
-                    # advance to the quotation end
-                    while self.pos < len(self.src):
-                        if self.src[self.pos] == kind:
-                            break
-                        self.token += self.src[self.pos]
-                        self.pos += 1
-            # add the current character to the token
-            self.token += ch
-            self.pos += 1
+        match = lexer_token_re.match(self.src, self.pos)
+        if match is None:
+            # end of input
+            self.token = ""
+            return
+        self.token = match.group()
+        self.pos = match.end()
+        # an unterminated quote is closed implicitly at the end of the input
+        kind = self.token[0]
+        if kind in '"`' and (len(self.token) == 1 or self.token[-1] != kind):
+            self.token += kind
 
 
 # # lexer tests
@@ -120,43 +129,96 @@ int_types = [
 ]
 float_types = ["<class 'float'>"]
 
-# The following list contains all of Pythons basic keywords. These are used
+# Maps the string representation of types of local variables to a kind, which
+# determines the conversion for the JSON output. String representations are
+# used, since the libraries (e.g. numpy) are imported by the questions' code
+# only. Types that are not listed are of kind "term".
+variable_kinds_by_type_str = {
+    **{t: "bool" for t in boolean_types},
+    **{t: "int" for t in int_types},
+    **{t: "float" for t in float_types},
+    "<class 'complex'>": "complex",
+    "<class 'list'>": "vector",
+    "<class 'set'>": "set",
+    "<class 'sympy.matrices.dense.MutableDenseMatrix'>": "sympy_matrix",
+    "<class 'numpy.matrix'>": "numpy_matrix",
+    "<class 'numpy.ndarray'>": "numpy_matrix",
+    "<class 'str'>": "string",
+    "<class 'module'>": "skip",
+    "<class 'function'>": "skip",
+}
+
+# The following set contains all of Pythons basic keywords. These are used
 # in syntax highlighting in "*_DEBUG.html" files.
-python_kws = [
-    "and",
-    "as",
-    "assert",
-    "break",
-    "class",
-    "continue",
-    "def",
-    "del",
-    "elif",
-    "else",
-    "except",
-    "False",
-    "finally",
-    "for",
-    "from",
-    "global",
-    "if",
-    "import",
-    "in",
-    "is",
-    "lambda",
-    "None",
-    "nonlocal",
-    "not",
-    "or",
-    "pass",
-    "raise",
-    "return",
-    "True",
-    "try",
-    "while",
-    "with",
-    "yield",
-]
+python_kws = frozenset(
+    (
+        "and",
+        "as",
+        "assert",
+        "break",
+        "class",
+        "continue",
+        "def",
+        "del",
+        "elif",
+        "else",
+        "except",
+        "False",
+        "finally",
+        "for",
+        "from",
+        "global",
+        "if",
+        "import",
+        "in",
+        "is",
+        "lambda",
+        "None",
+        "nonlocal",
+        "not",
+        "or",
+        "pass",
+        "raise",
+        "return",
+        "True",
+        "try",
+        "while",
+        "with",
+        "yield",
+    )
+)
+
+# Class of the first character of a token, indexed by its character code.
+# It is used to speed up syntax highlighting of Python code:
+# 0 := other, 1 := digit, 2 := letter or underscore
+first_char_class = bytes(
+    (
+        1
+        if 0x30 <= c <= 0x39
+        else 2 if 0x41 <= c <= 0x5A or 0x61 <= c <= 0x7A or c == 0x5F else 0
+    )
+    for c in range(256)
+)
+
+# File extensions of the supported image types
+image_types = ("svg", "png", "jpg", "jpeg")
+
+# HTML templates of highlighted numbers and keywords in Python code
+python_number_html = '<span style="color:green; font-weight:bold">%s</span>'
+python_keyword_html = '<span style="color:#FF5733; font-weight:bold">%s</span>'
+
+# Matches sequences of spaces. It is used to normalize the string
+# representation of numpy matrices.
+spaces_re = re.compile(" +")
+
+# Matches spaces directly after "[" or directly before "]" in the string
+# representation of numpy matrices. These spaces are removed.
+matrix_bracket_spaces_re = re.compile(r"(?<=\[) +| +(?=\])")
+
+# Translation tables for the string representation of vectors and sets:
+# brackets and spaces are removed; in sets, the imaginary unit "j" becomes "i".
+vector_translation = str.maketrans("", "", "[] ")
+set_translation = str.maketrans("j", "i", "{} ")
 
 # The following list of identifiers may be in locals of Python source that
 # uses "sympy". These identifiers must be skipped in the JSON output.
@@ -215,6 +277,8 @@ def rangeZ(*a):
 class TextNode:
     """Tree structure for the question text"""
 
+    __slots__ = ("type", "data", "children")
+
     def __init__(self, type_: str, data: str = "") -> None:
         self.type: str = type_
         self.data: str = data
@@ -224,25 +288,28 @@ class TextNode:
     def parse(self) -> None:
         """parses text recursively"""
         if self.type == "root":
-            self.children = [TextNode(" ", "")]
+            last = TextNode(" ", "")
+            children = self.children = [last]
             lines = self.data.split("\n")
             self.data = ""
             for line in lines:
                 line = line.strip()
-                if len(line) == 0:
+                if not line:
                     continue
                 type_ = line[0]  # refer to "types" below
                 if type_ not in "[(-!":
                     type_ = " "
-                if type_ != self.children[-1].type:
-                    self.children.append(TextNode(type_, ""))
-                self.children[-1].type = type_
-                self.children[-1].data += line + "\n"
-                if line.endswith("\\\\"):
+                if type_ != last.type:
+                    last = TextNode(type_, "")
+                    children.append(last)
+                if line[-2:] == "\\\\":
                     # line break
                     # TODO: this is NOT allowed, if we are within math mode!!
-                    self.children[-1].data = self.children[-1].data[:-3] + "\n"
-                    self.children.append(TextNode(" ", ""))
+                    last.data += line[:-2] + "\n"
+                    last = TextNode(" ", "")
+                    children.append(last)
+                else:
+                    last.data += line + "\n"
             types = {
                 " ": "paragraph",
                 "(": "single-choice",
@@ -272,7 +339,7 @@ class TextNode:
                     node.children.append(TextNode("var", var_id))
                 else:
                     # statically set option
-                    correct = option.startswith("[x]") or option.startswith("(x)")
+                    correct = option[:3] in ("[x]", "(x)")
                     node.children.append(
                         TextNode("bool", "true" if correct else "false")
                     )
@@ -334,19 +401,15 @@ class TextNode:
             span.children.append(self.parse_item(lex))
         return span
 
-    # pylint: disable-next=too-many-return-statements
     def parse_item(self, lex: Lexer, math_mode=False) -> Self:
         """parses a single item of a span/paragraph"""
-        if not math_mode and lex.token == "*":
-            return self.parse_bold_italic(lex)
-        if lex.token == "$":
-            return self.parse_math(lex)
-        if not math_mode and lex.token == "%":
-            return self.parse_input(lex)
-        if not math_mode and lex.token == "&":
-            return self.parse_string_var(lex)
-        if math_mode and lex.token == "+":
-            n = TextNode("text", lex.token)
+        token = lex.token
+        parsers = math_item_parsers if math_mode else text_item_parsers
+        parser = parsers.get(token)
+        if parser is not None:
+            return parser(self, lex)
+        if math_mode and token == "+":
+            n = TextNode("text", token)
             lex.next()
             if lex.token == "-":
                 # "+-" automatically chooses "+" or "-",
@@ -356,12 +419,12 @@ class TextNode:
                 n.type = "plus_minus"
                 lex.next()
             return n
-        if not math_mode and lex.token == "\\":
+        if not math_mode and token == "\\":
             lex.next()
             if lex.token == "\\":
                 lex.next()
             return TextNode("text", "<br/>")
-        n = TextNode("text", lex.token)
+        n = TextNode("text", token)
         lex.next()
         return n
 
@@ -419,23 +482,20 @@ class TextNode:
         return sv
 
     def optimize(self) -> Self:
-        """optimizes the current text node recursively. E.g. multiple pure
-        text items are concatenated into a single text node."""
+        """optimizes the current text node. E.g. multiple pure text items are
+        concatenated into a single text node. Children are NOT optimized,
+        i.e. they must be optimized before (refer to post_process_text)."""
         children_opt = []
-        for c in self.children:
-            opt = c.optimize()
-            if (
-                opt.type == "text"
-                and opt.data.startswith('"') is False
-                and opt.data.startswith("`") is False
-                and len(children_opt) > 0
-                and children_opt[-1].type == "text"
-                and children_opt[-1].data.startswith('"') is False
-                and children_opt[-1].data.startswith("`") is False
-            ):
+        # true, if the last item of children_opt is pure text, i.e. text that
+        # is not quoted by " or `. (Appending pure text does not change this.)
+        prev_is_pure_text = False
+        for opt in self.children:
+            is_pure_text = opt.type == "text" and opt.data[:1] not in ('"', "`")
+            if is_pure_text and prev_is_pure_text:
                 children_opt[-1].data += opt.data
             else:
                 children_opt.append(opt)
+                prev_is_pure_text = is_pure_text
         self.children = children_opt
         return self
 
@@ -445,31 +505,79 @@ class TextNode:
         return {
             "t": self.type,
             "d": self.data,
-            "c": list(map(lambda o: o.to_dict(), self.children)),
+            "c": [c.to_dict() for c in self.children],
         }
 
 
+# Parsers of TextNode.parse_item for tokens that start a nested element,
+# outside of math mode and within math mode, respectively.
+text_item_parsers = {
+    "*": TextNode.parse_bold_italic,
+    "$": TextNode.parse_math,
+    "%": TextNode.parse_input,
+    "&": TextNode.parse_string_var,
+}
+math_item_parsers = {
+    "$": TextNode.parse_math,
+}
+
+
 # pylint: disable-next=too-many-instance-attributes
 class Question:
     """Question of the quiz"""
 
+    __slots__ = (
+        "input_dirname",
+        "src_line_no",
+        "title",
+        "python_src",
+        "python_code",
+        "is_ode",
+        "is_random",
+        "uses_matplotlib",
+        "variables",
+        "variable_kinds",
+        "instances",
+        "text_src",
+        "text",
+        "error",
+        "python_src_tokens",
+        "python_src_buf",
+        "text_src_buf",
+    )
+
     def __init__(self, input_dirname: str, src_line_no: int) -> None:
         self.input_dirname: str = input_dirname
         self.src_line_no: int = src_line_no
         self.title: str = ""
         self.python_src: str = ""
+        # compiled python_src; it is compiled once and run for every instance
+        self.python_code: CodeType | None = None
+        # properties of python_src; determined once in analyze_python_code
+        self.is_ode: bool = False  # contains an Ordinary Differential Equation
+        self.is_random: bool = False
+        self.uses_matplotlib: bool = False
         self.variables: set[str] = set()
+        # cached kinds of the types of variables (see variable_kinds_by_type_str);
+        # it is per question, so types defined by the code are not kept alive
+        self.variable_kinds: dict[type, str] = {}
         self.instances: list[dict] = []
         self.text_src: str = ""
         self.text: TextNode = None
         self.error: str = ""
         self.python_src_tokens: set[str] = set()
+        # buffers to collect the sources line by line while reading the input
+        self.python_src_buf: io.StringIO = io.StringIO()
+        self.text_src_buf: io.StringIO = io.StringIO()
 
     def build(self) -> None:
         """builds a question from text and Python sources"""
+        # (each tab is replaced by four spaces, in one pass over the source)
+        self.python_src = self.python_src_buf.getvalue().replace("\t", "    ")
+        self.text_src = self.text_src_buf.getvalue()
         if len(self.python_src) > 0:
             self.analyze_python_code()
-            instances_str = []
+            instances_str: set[str] = set()
             if len(self.error) == 0:
                 for _ in range(0, 5):
                     # try to generate instances distinct to prior once
@@ -482,10 +590,10 @@ class Question:
                         instance_str = str(instance)
                         if instance_str not in instances_str:
                             break
-                    instances_str.append(instance_str)
+                    instances_str.add(instance_str)
                     self.instances.append(instance)
                     # if there is no randomization in the input, then one instance is enough
-                    if "rand" not in self.python_src:
+                    if not self.is_random:
                         break
                 if "No module named" in self.error:
                     print("!!! " + self.error)
@@ -493,7 +601,6 @@ class Question:
         self.text.parse()
         var_occurrences: set[str] = set()
         self.post_process_text(self.text, False, var_occurrences)
-        self.text.optimize()
 
     # pylint: disable-next=too-many-branches
     def post_process_text(
@@ -501,13 +608,15 @@ class Question:
     ) -> None:
         """post processes the textual part. For example, a semantical check
         for the existing of referenced variables is applied. Also images
-        are loaded and stringified."""
+        are loaded and stringified. Finally, each node is optimized."""
         for c in node.children:
             self.post_process_text(
                 c,
                 math or node.type == "math" or node.type == "display-math",
                 var_occurrences,
             )
+        # (children are post processed, so they can be merged now)
+        node.optimize()
         if node.type == "input":
             if node.data.startswith('"'):
                 # gap question
@@ -533,40 +642,39 @@ class Question:
             if var_id not in self.variables:
                 self.error += f"Unknown string variable '{var_id}'. "
         elif node.type == "text":
-            if (
-                math
-                and len(node.data) >= 2
-                and node.data.startswith('"')
-                and node.data.endswith('"')
-            ):
-                node.data = node.data[1:-1]
-            elif math and (node.data in self.variables):
+            data = node.data
+            # (the cheapest tests are done first)
+            if math and data[:1] == '"' and len(data) >= 2 and data[-1] == '"':
+                node.data = data[1:-1]
+            elif math and (data in self.variables):
                 node.type = "var"
-            elif (
-                not math
-                and len(node.data) >= 2
-                and node.data.startswith("`")
-                and node.data.endswith("`")
-            ):
+            elif not math and data[:1] == "`" and len(data) >= 2 and data[-1] == "`":
                 node.type = "code"
-                node.data = node.data[1:-1]
+                node.data = data[1:-1]
         elif node.type == "image":
             # TODO: warning, if file size is (too) large
             path = os.path.join(self.input_dirname, node.data)
             img_type = os.path.splitext(path)[1][1:]
-            supported_img_types = ["svg", "png", "jpg", "jpeg"]
-            if img_type not in supported_img_types:
+            if img_type not in image_types:
                 self.error += f"ERROR: image type '{img_type}' is not supported. "
-                self.error += f"Use one of {', '.join(supported_img_types)}"
-            elif os.path.isfile(path) is False:
-                self.error += "ERROR: cannot find image at path '" + path + '"'
+                self.error += f"Use one of {', '.join(image_types)}"
             else:
-                # load image
-                f = open(path, "rb")
-                data = f.read()
-                f.close()
-                b64 = base64.b64encode(data)
-                node.children.append(TextNode("data", b64.decode("utf-8")))
+                # load image (memory mapped, to avoid copying the file data;
+                # empty files cannot be mapped). The file is opened without
+                # testing for its existence before, which would stat it twice.
+                try:
+                    f = open(path, "rb")  # pylint: disable=consider-using-with
+                except OSError:
+                    self.error += "ERROR: cannot find image at path '" + path + '"'
+                else:
+                    with f:
+                        b64 = b""
+                        if os.fstat(f.fileno()).st_size > 0:
+                            with mmap.mmap(
+                                f.fileno(), 0, access=mmap.ACCESS_READ
+                            ) as mm:
+                                b64 = base64.b64encode(mm)
+                    node.children.append(TextNode("data", b64.decode("ascii")))
 
     def float_to_str(self, v: float) -> str:
         """Converts float to string and cuts '.0' if applicable"""
@@ -583,17 +691,20 @@ class Question:
         the right-hand side of statements. As a side effect, irrelevant symbols
         of packages are also filtered out (e.g. 'mod', is populated to the
         locals, when using 'sage.all.power_mod')"""
-        lines = self.python_src.split("\n")
-        for line in lines:
-            if "=" not in line:
+        src = self.python_src
+        self.is_ode = "dsolve" in src
+        self.is_random = "rand" in src
+        self.uses_matplotlib = "matplotlib" in src
+        tokens = self.python_src_tokens
+        for line in src.split("\n"):
+            lhs, assignment, _ = line.partition("=")
+            if not assignment:
                 continue
-            lhs = line.split("=")[0]
-            lex = Lexer(lhs)
-            while len(lex.token) > 0:
-                self.python_src_tokens.add(lex.token)
-                lex.next()
+            # the tokens of the lexer, except that unterminated quotes are not
+            # closed (this is irrelevant, since quotes are never identifiers)
+            tokens.update(lexer_token_re.findall(lhs))
         # check for forbidden code
-        if "matplotlib" in self.python_src and "show(" in self.python_src:
+        if self.uses_matplotlib and "show(" in src:
             self.error += "Remove the call show(), "
             self.error += "since this would result in MANY open windows :-)"
 
@@ -602,10 +713,11 @@ class Question:
         """Runs the questions python code and gathers all local variables."""
         local_variables = {}
         res = {}
-        src = self.python_src
         try:
+            if self.python_code is None:
+                self.python_code = compile(self.python_src, "<string>", "exec")
             # pylint: disable-next=exec-used
-            exec(src, globals(), local_variables)
+            exec(self.python_code, globals(), local_variables)
         # pylint: disable-next=broad-exception-caught
         except Exception as e:
             # print(e)
@@ -614,54 +726,49 @@ class Question:
         for local_id, value in local_variables.items():
             if local_id in skipVariables or (local_id not in self.python_src_tokens):
                 continue
-            type_str = str(type(value))
-            if type_str in ("<class 'module'>", "<class 'function'>"):
+            value_type = type(value)
+            kind = self.variable_kinds.get(value_type)
+            if kind is None:
+                kind = variable_kinds_by_type_str.get(str(value_type), "term")
+                self.variable_kinds[value_type] = kind
+            if kind == "skip":
                 continue
             self.variables.add(local_id)
             t = ""  # type
             v = ""  # value
-            if type_str in boolean_types:
+            if kind == "bool":
                 t = "bool"
                 v = str(value).lower()
-            elif type_str in int_types:
+            elif kind == "int":
                 t = "int"
                 v = str(value)
-            elif type_str in float_types:
+            elif kind == "float":
                 t = "float"
                 v = self.float_to_str(value)
-            elif type_str == "<class 'complex'>":
+            elif kind == "complex":
                 t = "complex"
                 # convert "-0" to "0"
                 real = 0 if value.real == 0 else value.real
                 imag = 0 if value.imag == 0 else value.imag
                 v = self.float_to_str(real) + "," + self.float_to_str(imag)
-            elif type_str == "<class 'list'>":
+            elif kind == "vector":
                 t = "vector"
-                v = str(value).replace("[", "").replace("]", "").replace(" ", "")
-            elif type_str == "<class 'set'>":
+                v = str(value).translate(vector_translation)
+            elif kind == "set":
                 t = "set"
-                v = (
-                    str(value)
-                    .replace("{", "")
-                    .replace("}", "")
-                    .replace(" ", "")
-                    .replace("j", "i")
-                )
-            elif type_str == "<class 'sympy.matrices.dense.MutableDenseMatrix'>":
+                v = str(value).translate(set_translation)
+            elif kind == "sympy_matrix":
                 # e.g. 'Matrix([[-1, 0, -2], [-1, 5*sin(x)*cos(x)/7, 2], [-1, 2, 0]])'
                 t = "matrix"
                 v = str(value)[7:-1]
-            elif (
-                type_str == "<class 'numpy.matrix'>"
-                or type_str == "<class 'numpy.ndarray'>"
-            ):
+            elif kind == "numpy_matrix":
                 # e.g. '[[ -6 -13 -12]\n [-17  -3 -20]\n [-14  -8 -16]\n [ -7 -15  -8]]'
                 t = "matrix"
-                v = re.sub(" +", " ", str(value))  # remove double spaces
-                v = re.sub(r"\[ ", "[", v)  # remove space(s) after "["
-                v = re.sub(r" \]", "]", v)  # remove space(s) before "]"
-                v = v.replace(" ", ",").replace("\n", "")
-            elif type_str == "<class 'str'>":
+                # remove space(s) after "[" and before "]"
+                v = matrix_bracket_spaces_re.sub("", str(value))
+                # the remaining space sequences separate the elements
+                v = spaces_re.sub(",", v).replace("\n", "")
+            elif kind == "string":
                 t = "string"
                 v = value
             else:
@@ -670,7 +777,7 @@ class Question:
                 # in case that an ODE is contained in the question
                 # and only one constant ("C1") is present, then substitute
                 # "C1" by "C"
-                if "dsolve" in self.python_src:
+                if self.is_ode:
                     if "C2" not in v:
                         v = v.replace("C1", "C")
             # t := type, v := value
@@ -680,7 +787,7 @@ class Question:
             self.error += "ERROR: Wrong usage of Python imports. Refer to pySELL docs!"
             # TODO: write the docs...
 
-        if "matplotlib" in self.python_src and "plt" in local_variables:
+        if self.uses_matplotlib and "plt" in local_variables:
             plt = local_variables["plt"]
             buf = io.BytesIO()
             plt.savefig(buf, format="svg", transparent=True)
@@ -696,8 +803,7 @@ class Question:
         return {
             "title": self.title,
             "error": self.error,
-            "is_ode": "dsolve"  # contains an Ordinary Differential Equation
-            in self.python_src,
+            "is_ode": self.is_ode,
             "variables": list(self.variables),
             "instances": self.instances,
             "text": self.text.to_dict(),
@@ -713,7 +819,8 @@ class Question:
     def syntax_highlight_text_line(self, src: str) -> str:
         """syntax highlights a single questions text line and returns the
         formatted code in HTML format"""
-        html = ""
+        html: list[str] = []
+        append = html.append
         math = False
         code = False
         bold = False
@@ -723,31 +830,31 @@ class Question:
         while i < n:
             ch = src[i]
             if ch == " ":
-                html += "&nbsp;"
+                append("&nbsp;")
             elif not math and ch == "%":
-                html += '<span style="color:green; font-weight: bold;">'
-                html += ch
+                append('<span style="color:green; font-weight: bold;">')
+                append(ch)
                 if i + 1 < n and src[i + 1] == "!":
-                    html += src[i + 1]
+                    append(src[i + 1])
                     i += 1
-                html += "</span>"
+                append("</span>")
             elif ch == "*" and i + 1 < n and src[i + 1] == "*":
                 i += 1
                 bold = not bold
                 if bold:
-                    html += '<span style="font-weight: bold;">'
-                    html += "**"
+                    append('<span style="font-weight: bold;">')
+                    append("**")
                 else:
-                    html += "**"
-                    html += "</span>"
+                    append("**")
+                    append("</span>")
             elif ch == "*":
                 italic = not italic
                 if italic:
-                    html += '<span style="font-style: italic;">'
-                    html += "*"
+                    append('<span style="font-style: italic;">')
+                    append("*")
                 else:
-                    html += "*"
-                    html += "</span>"
+                    append("*")
+                    append("</span>")
             elif ch == "$":
                 display_style = False
                 if i + 1 < n and src[i + 1] == "$":
@@ -755,35 +862,35 @@ class Question:
                     i += 1
                 math = not math
                 if math:
-                    html += '<span style="color:#FF5733; font-weight: bold;">'
-                    html += ch
+                    append('<span style="color:#FF5733; font-weight: bold;">')
+                    append(ch)
                     if display_style:
-                        html += ch
+                        append(ch)
                 else:
-                    html += ch
+                    append(ch)
                     if display_style:
-                        html += ch
-                    html += "</span>"
+                        append(ch)
+                    append("</span>")
             elif ch == "`":
                 code = not code
                 if code:
-                    html += '<span style="color:#33A5FF; font-weight: bold;">'
-                    html += ch
+                    append('<span style="color:#33A5FF; font-weight: bold;">')
+                    append(ch)
                 else:
-                    html += ch
-                    html += "</span>"
+                    append(ch)
+                    append("</span>")
             else:
-                html += ch
+                append(ch)
             i += 1
         if math:
-            html += "</span>"
+            append("</span>")
         if code:
-            html += "</span>"
+            append("</span>")
         if italic:
-            html += "</span>"
+            append("</span>")
         if bold:
-            html += "</bold>"
-        return html
+            append("</bold>")
+        return "".join(html)
 
     def red_colored_span(self, inner_html: str) -> str:
         """embeds HTML code into a red colored span"""
@@ -792,75 +899,77 @@ class Question:
     def syntax_highlight_text(self, src: str) -> str:
         """syntax highlights a questions text and returns the formatted code in
         HTML format"""
-        html = ""
+        html: list[str] = []
+        append = html.append
         lines = src.split("\n")
         for line in lines:
             if len(line.strip()) == 0:
                 continue
             if line.startswith("-"):
-                html += self.red_colored_span("-")
+                append(self.red_colored_span("-"))
                 line = line[1:].replace(" ", "&nbsp;")
             elif line.startswith("["):
                 l1 = line.split("]")[0] + "]".replace(" ", "&nbsp;")
-                html += self.red_colored_span(l1)
+                append(self.red_colored_span(l1))
                 line = "]".join(line.split("]")[1:]).replace(" ", "&nbsp;")
             elif line.startswith("("):
                 l1 = line.split(")")[0] + ")".replace(" ", "&nbsp;")
-                html += self.red_colored_span(l1)
+                append(self.red_colored_span(l1))
                 line = ")".join(line.split(")")[1:]).replace(" ", "&nbsp;")
-            html += self.syntax_highlight_text_line(line)
-            html += "<br/>"
-        return html
+            append(self.syntax_highlight_text_line(line))
+            append("<br/>")
+        return "".join(html)
 
     def syntax_highlight_python(self, src: str) -> str:
         """syntax highlights a questions python code and returns the formatted
         code in HTML format"""
-        lines = src.split("\n")
-        html = ""
-        for line in lines:
+        html: list[str] = []
+        append = html.append
+        for line in src.split("\n"):
             if len(line.strip()) == 0:
                 continue
             lex = Lexer(line)
-            while len(lex.token) > 0:
-                if len(lex.token) > 0 and lex.token[0] >= "0" and lex.token[0] <= "9":
-                    html += '<span style="color:green; font-weight:bold">'
-                    html += lex.token + "</span>"
-                elif lex.token in python_kws:
-                    html += '<span style="color:#FF5733; font-weight:bold">'
-                    html += lex.token + "</span>"
+            next_token = lex.next  # bound method, looked up only once
+            token = lex.token
+            while len(token) > 0:
+                code = ord(token[0])
+                char_class = first_char_class[code] if code < 256 else 0
+                if char_class == 1:
+                    append(python_number_html % token)
+                elif char_class == 2 and token in python_kws:
+                    append(python_keyword_html % token)
                 else:
-                    html += lex.token.replace(" ", "&nbsp;")
-                lex.next()
-            html += "<br/>"
-        return html
+                    append(token.replace(" ", "&nbsp;"))
+                next_token()
+                token = lex.token
+            append("<br/>")
+        return "".join(html)
+
+
+# keywords of input files, indexed by their (distinct) initial letters
+INPUT_KEYWORDS = {k[0]: k for k in ("LANG", "TITLE", "AUTHOR", "INFO", "QUESTION")}
 
 
 def compile_input_file(input_dirname: str, src: str) -> dict:
     """compiles a SELL input file to JSON"""
-    lang = "en"
-    title = ""
-    author = ""
-    info = ""
+    # quiz meta data; keyword -> value
+    header = {"LANG": "en", "TITLE": "", "AUTHOR": "", "INFO": ""}
     questions = []
     question = None
     parsing_python = False
-    lines = src.split("\n")
-    for line_no, line in enumerate(lines):
-        line = line.split("#")[0]  # remove comments
-        line_not_stripped = line
-        line = line.strip()
+    # lines are read one by one, without materializing a list of all lines
+    for line_no, src_line in enumerate(io.StringIO(src), 1):
+        line = src_line.partition("#")[0].strip()  # remove comments
         if len(line) == 0:
             continue
-        if line.startswith("LANG"):
-            lang = line[4:].strip()
-        elif line.startswith("TITLE"):
-            title = line[5:].strip()
-        elif line.startswith("AUTHOR"):
-            author = line[6:].strip()
-        elif line.startswith("INFO"):
-            info = line[4:].strip()
-        elif line.startswith("QUESTION"):
-            question = Question(input_dirname, line_no + 1)
+        # keywords are matched as prefixes (e.g. "QUESTION: Title")
+        keyword = INPUT_KEYWORDS.get(line[0], "")
+        if not line.startswith(keyword):
+            keyword = ""
+        if keyword in header:
+            header[keyword] = line[len(keyword) :].strip()
+        elif keyword == "QUESTION":
+            question = Question(input_dirname, line_no)
             questions.append(question)
             question.title = line[8:].strip()
             parsing_python = False
@@ -869,721 +978,499 @@ def compile_input_file(input_dirname: str, src: str) -> dict:
                 parsing_python = not parsing_python
             else:
                 if parsing_python:
-                    question.python_src += (
-                        line_not_stripped.replace("\t", "    ") + "\n"
+                    # indentation is relevant, so the unstripped line is used
+                    # (tabs are replaced in Question.build)
+                    question.python_src_buf.write(
+                        src_line.partition("#")[0].rstrip("\n")
                     )
+                    question.python_src_buf.write("\n")
                 else:
-                    question.text_src += line + "\n"
+                    question.text_src_buf.write(line)
+                    question.text_src_buf.write("\n")
     for question in questions:
         question.build()
     return {
-        "lang": lang,
-        "title": title,
-        "author": author,
-        "date": datetime.datetime.today().strftime("%Y-%m-%d"),
-        "info": info,
-        "questions": list(map(lambda o: o.to_dict(), questions)),
+        "lang": header["LANG"],
+        "title": header["TITLE"],
+        "author": header["AUTHOR"],
+        "date": datetime.date.today().isoformat(),
+        "info": header["INFO"],
+        "questions": [question.to_dict() for question in questions],
     }
 
 
 # the following code is automatically generated and updated by file "build.py"
 # @begin(html)
-HTML: str = b''
-HTML += b'<!DOCTYPE html> <html> <head> <meta charset="UTF-8" /> <titl'
-HTML += b'e>pySELL Quiz</title> <meta name="viewport" content="width=d'
-HTML += b'evice-width, initial-scale=1.0" /> <link rel="icon" type="im'
-HTML += b'age/x-icon" href="data:image/x-icon;base64,AAABAAEAEBAAAAEAI'
-HTML += b'ABoBAAAFgAAACgAAAAQAAAAIAAAAAEAIAAAAAAAAAQAAAAAAAAAAAAAAAAAA'
-HTML += b'AAAAACqqqr/PDw8/0VFRf/V1dX////////////09Pb/trbO/3t7q/9wcLH/c'
-HTML += b'XG0/3NzqP+iosH/5OTr////////////j4+P/wAAAP8KCgr/x8fH///////k5'
-HTML += b'Or/bGym/y4ukP8kJJD/IiKR/yIikv8jI5H/KCiP/1BQnP/Jydz//////5CQk'
-HTML += b'P8BAQH/DAwM/8jIyP/7+/v/cHCo/yIij/8lJZP/KSmR/z4+lf9AQJH/Li6Q/'
-HTML += b'yUlkv8jI5H/TEya/9/f6P+QkJD/AQEB/wwMDP/Ly8r/ycna/y4ujv8lJZP/N'
-HTML += b'DSU/5+fw//j4+v/5+fs/76+0v9LS5f/JSWS/yYmkP+Skrr/kJCQ/wAAAP8MD'
-HTML += b'Az/zc3L/5aWvP8iIo//ISGQ/39/sf////7/////////////////n5+7/yMjj'
-HTML += b'P8kJJH/bm6p/5CQkP8BAQH/CgoK/6SkpP+Skp//XV2N/1dXi//Hx9X//////'
-HTML += b'///////////9fX1/39/rP8kJI7/JCSR/25upP+QkJD/AQEB/wEBAf8ODg7/F'
-HTML += b'BQT/xUVE/8hIR//XV1c/8vL0P/IyNv/lZW7/1panP8rK5D/JiaT/ycnjv+bm'
-HTML += b'7v/kJCQ/wEBAf8AAAD/AAAA/wAAAP8AAAD/AAAH/wAAK/8aGmv/LCyO/yQkj'
-HTML += b'/8jI5L/JSWT/yIikP9dXZ//6enu/5CQkP8BAQH/BQUF/0xMTP9lZWT/Pz9N/'
-HTML += b'wUFVP8AAGz/AABu/xYWhf8jI5L/JCSP/zY2k/92dq7/4ODo//////+QkJD/A'
-HTML += b'QEB/wwMDP/IyMj//Pz9/2lppf8ZGYf/AgJw/wAAZ/8cHHL/Zmak/5ubv//X1'
-HTML += b'+T//v7+////////////kJCQ/wEBAf8MDAz/ycnJ/9/f6f85OZT/IyOR/wcHZ'
-HTML += b'P8AAB7/UVFZ//n5+P//////0dHd/7i4yf++vs7/7e3z/5CQkP8AAAD/DAwM/'
-HTML += b'87Ozf/Y2OP/MjKQ/x8fjv8EBEr/AAAA/1xcWv//////6ent/0tLlf8kJIn/M'
-HTML += b'jKL/8fH2v+QkJD/AQEB/wcHB/98fHv/jo6T/yUlc/8JCXj/AABi/wAAK/9eX'
-HTML += b'nj/trbS/2xspv8nJ5H/IyOT/0pKm//m5uz/kJCQ/wEBAf8AAAD/AAAA/wAAA'
-HTML += b'P8AACH/AABk/wAAbf8EBHD/IyOM/ykpkv8jI5H/IyOS/ysrjP+kpMP//////'
-HTML += b'5GRkf8CAgL/AQEB/wEBAf8BAQH/AgIE/woKK/8ZGWj/IyOG/ycnj/8nJ4//M'
-HTML += b'DCS/0xMmf+lpcP/+vr6///////Pz8//kZGR/5CQkP+QkJD/kJCQ/5OTk/+ws'
-HTML += b'K//zs7V/8LC2f+goL3/oaG+/8PD2P/n5+z/////////////////AAAAAAAAA'
-HTML += b'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA'
-HTML += b'AAAAAAAAAAAAAAAAA==" sizes="16x16" /> <link rel="stylesheet"'
-HTML += b' href="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.'
-HTML += b'min.css" integrity="sha384-n8MVd4RsNIU0tAv4ct0nTaAbDJwPJzDEa'
-HTML += b'qSD1odI+WdtXRGWt2kTvGFasHpSy3SV" crossorigin="anonymous" /> '
-HTML += b'<script src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/'
-HTML += b'katex.min.js" integrity="sha384-XjKyOOlGwcjNTAIQHIpgOno0Hl1Y'
-HTML += b'QqzUOEleOLALmuqehneUG+vnGctmUb0ZY0l8" crossorigin="anonymous'
-HTML += b'" ></script> <style> html { font-family: Arial, Helvetica, s'
-HTML += b'ans-serif; } body { max-width: 1024px; margin-left: auto; ma'
-HTML += b'rgin-right: auto; padding-left: 5px; padding-right: 5px; } h'
-HTML += b'1 { text-align: center; font-size: 28pt; word-wrap: break-wo'
-HTML += b'rd; } img { width: 100%; display: block; margin-left: auto; '
-HTML += b'margin-right: auto; } .author { text-align: center; font-siz'
-HTML += b'e: 18pt; } .courseInfo { font-size: 14pt; font-style: italic'
-HTML += b'; /*margin-bottom: 24px;*/ text-align: center; } .question {'
-HTML += b' position: relative; /* required for feedback overlays */ co'
-HTML += b'lor: black; background-color: white; border-style: solid; bo'
-HTML += b'rder-radius: 5px; border-width: 3px; border-color: black; pa'
-HTML += b'dding: 8px; margin-top: 20px; margin-bottom: 20px; -webkit-b'
-HTML += b'ox-shadow: 4px 6px 8px -1px rgba(0, 0, 0, 0.93); box-shadow:'
-HTML += b' 4px 6px 8px -1px rgba(0, 0, 0, 0.1); overflow-x: auto; } .q'
-HTML += b'uestionFeedback { z-index: 10; display: none; position: abso'
-HTML += b'lute; pointer-events: none; left: 10%; top: 33%; width: 80%;'
-HTML += b' /*height: 100%;*/ text-align: center; font-size: 24pt; text'
-HTML += b'-shadow: 0px 0px 18px rgba(0, 0, 0, 0.33); background-color:'
-HTML += b' rgba(255, 255, 255, 1); padding-top: 20px; padding-bottom: '
-HTML += b'20px; /*border-style: solid; border-width: 4px; border-color'
-HTML += b': rgb(200, 200, 200);*/ border-radius: 16px; -webkit-box-sha'
-HTML += b'dow: 0px 0px 18px 5px rgba(0, 0, 0, 0.66); box-shadow: 0px 0'
-HTML += b'px 18px 5px rgba(0, 0, 0, 0.66); } .questionTitle { font-siz'
-HTML += b'e: 24pt; } .code { font-family: "Courier New", Courier, mono'
-HTML += b'space; color: black; background-color: rgb(235, 235, 235); p'
-HTML += b'adding: 2px 5px; border-radius: 5px; margin: 1px 2px; } .deb'
-HTML += b'ugCode { font-family: "Courier New", Courier, monospace; pad'
-HTML += b'ding: 4px; margin-bottom: 5px; background-color: black; colo'
-HTML += b'r: white; border-radius: 5px; opacity: 0.85; overflow-x: scr'
-HTML += b'oll; } .debugInfo { text-align: end; font-size: 10pt; margin'
-HTML += b'-top: 2px; color: rgb(64, 64, 64); } ul { margin-top: 0; mar'
-HTML += b'gin-left: 0px; padding-left: 20px; } .inputField { position:'
-HTML += b' relative; width: 32px; height: 24px; font-size: 14pt; borde'
-HTML += b'r-style: solid; border-color: black; border-radius: 5px; bor'
-HTML += b'der-width: 0.2; padding-left: 5px; padding-right: 5px; outli'
-HTML += b'ne-color: black; background-color: transparent; margin: 1px;'
-HTML += b' } .inputField:focus { outline-color: maroon; } .equationPre'
-HTML += b'view { position: absolute; top: 120%; left: 0%; padding-left'
-HTML += b': 8px; padding-right: 8px; padding-top: 4px; padding-bottom:'
-HTML += b' 4px; background-color: rgb(128, 0, 0); border-radius: 5px; '
-HTML += b'font-size: 12pt; color: white; text-align: start; z-index: 2'
-HTML += b'0; opacity: 0.95; } .button { padding-left: 8px; padding-rig'
-HTML += b'ht: 8px; padding-top: 5px; padding-bottom: 5px; font-size: 1'
-HTML += b'2pt; background-color: rgb(0, 150, 0); color: white; border-'
-HTML += b'style: none; border-radius: 4px; height: 36px; cursor: point'
-HTML += b'er; } .buttonRow { display: flex; align-items: baseline; mar'
-HTML += b'gin-top: 12px; } .matrixResizeButton { width: 20px; backgrou'
-HTML += b'nd-color: black; color: #fff; text-align: center; border-rad'
-HTML += b'ius: 3px; position: absolute; z-index: 1; height: 20px; curs'
-HTML += b'or: pointer; margin-bottom: 3px; } a { color: black; text-de'
-HTML += b'coration: underline; } </style> </head> <body> <h1 id="title'
-HTML += b'"></h1> <div class="author" id="author"></div> <p id="course'
-HTML += b'Info1" class="courseInfo"></p> <p id="courseInfo2" class="co'
-HTML += b'urseInfo"></p> <h1 id="debug" class="debugCode" style="displ'
-HTML += b'ay: none">DEBUG VERSION</h1> <div id="questions"></div> <p s'
-HTML += b'tyle="font-size: 8pt; font-style: italic; text-align: center'
-HTML += b'"> This quiz was created using <a href="https://github.com/a'
-HTML += b'ndreas-schwenk/pysell">pySELL</a>, the <i>Python-based Simpl'
-HTML += b'e E-Learning Language</i>, written by Andreas Schwenk, GPLv3'
-HTML += b'<br /> last update on <span id="date"></span> </p> <script>l'
-HTML += b'et debug = false; let quizSrc = {};var sell=(()=>{var B=Obje'
-HTML += b'ct.defineProperty;var re=Object.getOwnPropertyDescriptor;var'
-HTML += b' ne=Object.getOwnPropertyNames;var ae=Object.prototype.hasOw'
-HTML += b'nProperty;var le=(r,e)=>{for(var t in e)B(r,t,{get:e[t],enum'
-HTML += b'erable:!0})},oe=(r,e,t,i)=>{if(e&&typeof e=="object"||typeof'
-HTML += b' e=="function")for(let s of ne(e))!ae.call(r,s)&&s!==t&&B(r,'
-HTML += b's,{get:()=>e[s],enumerable:!(i=re(e,s))||i.enumerable});retu'
-HTML += b'rn r};var he=r=>oe(B({},"__esModule",{value:!0}),r);var de={'
-HTML += b'};le(de,{init:()=>pe});function b(r=[]){let e=document.creat'
-HTML += b'eElement("div");return e.append(...r),e}function z(r=[]){let'
-HTML += b' e=document.createElement("ul");return e.append(...r),e}func'
-HTML += b'tion U(r){let e=document.createElement("li");return e.append'
-HTML += b'Child(r),e}function R(r){let e=document.createElement("input'
-HTML += b'");return e.spellcheck=!1,e.type="text",e.classList.add("inp'
-HTML += b'utField"),e.style.width=r+"px",e}function j(){let r=document'
-HTML += b'.createElement("button");return r.type="button",r.classList.'
-HTML += b'add("button"),r}function v(r,e=[]){let t=document.createElem'
-HTML += b'ent("span");return e.length>0?t.append(...e):t.innerHTML=r,t'
-HTML += b'}function W(r,e,t=!1){katex.render(e,r,{throwOnError:!1,disp'
-HTML += b'layMode:t,macros:{"\\\\RR":"\\\\mathbb{R}","\\\\NN":"\\\\mathbb{N}",'
-HTML += b'"\\\\QQ":"\\\\mathbb{Q}","\\\\ZZ":"\\\\mathbb{Z}","\\\\CC":"\\\\mathbb{C'
-HTML += b'}"}})}function T(r,e=!1){let t=document.createElement("span"'
-HTML += b');return W(t,r,e),t}var O={en:"This page runs in your browse'
-HTML += b'r and does not store any data on servers.",de:"Diese Seite w'
-HTML += b'ird in Ihrem Browser ausgef\\xFChrt und speichert keine Daten'
-HTML += b' auf Servern.",es:"Esta p\\xE1gina se ejecuta en su navegador'
-HTML += b' y no almacena ning\\xFAn dato en los servidores.",it:"Questa'
-HTML += b' pagina viene eseguita nel browser e non memorizza alcun dat'
-HTML += b'o sui server.",fr:"Cette page fonctionne dans votre navigate'
-HTML += b'ur et ne stocke aucune donn\\xE9e sur des serveurs."},F={en:"'
-HTML += b'You can * this page in order to get new randomized tasks.",d'
-HTML += b'e:"Sie k\\xF6nnen diese Seite *, um neue randomisierte Aufgab'
-HTML += b'en zu erhalten.",es:"Puedes * esta p\\xE1gina para obtener nu'
-HTML += b'evas tareas aleatorias.",it:"\\xC8 possibile * questa pagina '
-HTML += b'per ottenere nuovi compiti randomizzati",fr:"Vous pouvez * c'
-HTML += b'ette page pour obtenir de nouvelles t\\xE2ches al\\xE9atoires"'
-HTML += b'},K={en:"reload",de:"aktualisieren",es:"recargar",it:"ricari'
-HTML += b'care",fr:"recharger"},X={en:["awesome","great","well done","'
-HTML += b'nice","you got it","good"],de:["super","gut gemacht","weiter'
-HTML += b' so","richtig"],es:["impresionante","genial","correcto","bie'
-HTML += b'n hecho"],it:["fantastico","grande","corretto","ben fatto"],'
-HTML += b'fr:["g\\xE9nial","super","correct","bien fait"]},Z={en:["fill'
-HTML += b' all fields"],de:["bitte alles ausf\\xFCllen"],es:["por favor'
-HTML += b', rellene todo"],it:["compilare tutto"],fr:["remplis tout s\''
-HTML += b'il te plait"]},q={en:["try again","still some mistakes","wro'
-HTML += b'ng answer","no"],de:["leider falsch","nicht richtig","versuc'
-HTML += b'h\'s nochmal"],es:["int\\xE9ntalo de nuevo","todav\\xEDa alguno'
-HTML += b's errores","respuesta incorrecta"],it:["riprova","ancora qua'
-HTML += b'lche errore","risposta sbagliata"],fr:["r\\xE9essayer","encor'
-HTML += b'e des erreurs","mauvaise r\\xE9ponse"]};function Y(r,e){let t'
-HTML += b'=Array(e.length+1).fill(null).map(()=>Array(r.length+1).fill'
-HTML += b'(null));for(let i=0;i<=r.length;i+=1)t[0][i]=i;for(let i=0;i'
-HTML += b'<=e.length;i+=1)t[i][0]=i;for(let i=1;i<=e.length;i+=1)for(l'
-HTML += b'et s=1;s<=r.length;s+=1){let l=r[s-1]===e[i-1]?0:1;t[i][s]=M'
-HTML += b'ath.min(t[i][s-1]+1,t[i-1][s]+1,t[i-1][s-1]+l)}return t[e.le'
-HTML += b'ngth][r.length]}var G=\'<svg xmlns="http://www.w3.org/2000/sv'
-HTML += b'g" height="28" viewBox="0 0 448 512"><path d="M384 80c8.8 0 '
-HTML += b'16 7.2 16 16V416c0 8.8-7.2 16-16 16H64c-8.8 0-16-7.2-16-16V9'
-HTML += b'6c0-8.8 7.2-16 16-16H384zM64 32C28.7 32 0 60.7 0 96V416c0 35'
-HTML += b'.3 28.7 64 64 64H384c35.3 0 64-28.7 64-64V96c0-35.3-28.7-64-'
-HTML += b'64-64H64z"/></svg>\',J=\'<svg xmlns="http://www.w3.org/2000/sv'
-HTML += b'g" height="28" viewBox="0 0 448 512"><path d="M64 80c-8.8 0-'
-HTML += b'16 7.2-16 16V416c0 8.8 7.2 16 16 16H384c8.8 0 16-7.2 16-16V9'
-HTML += b'6c0-8.8-7.2-16-16-16H64zM0 96C0 60.7 28.7 32 64 32H384c35.3 '
-HTML += b'0 64 28.7 64 64V416c0 35.3-28.7 64-64 64H64c-35.3 0-64-28.7-'
-HTML += b'64-64V96zM337 209L209 337c-9.4 9.4-24.6 9.4-33.9 0l-64-64c-9'
-HTML += b'.4-9.4-9.4-24.6 0-33.9s24.6-9.4 33.9 0l47 47L303 175c9.4-9.4'
-HTML += b' 24.6-9.4 33.9 0s9.4 24.6 0 33.9z"/>\',$=\'<svg xmlns="http://'
-HTML += b'www.w3.org/2000/svg" height="28" viewBox="0 0 512 512"><path'
-HTML += b' d="M464 256A208 208 0 1 0 48 256a208 208 0 1 0 416 0zM0 256'
-HTML += b'a256 256 0 1 1 512 0A256 256 0 1 1 0 256z"/></svg>\',ee=\'<svg'
-HTML += b' xmlns="http://www.w3.org/2000/svg" height="28" viewBox="0 0'
-HTML += b' 512 512"><path d="M256 48a208 208 0 1 1 0 416 208 208 0 1 1'
-HTML += b' 0-416zm0 464A256 256 0 1 0 256 0a256 256 0 1 0 0 512zM369 2'
-HTML += b'09c9.4-9.4 9.4-24.6 0-33.9s-24.6-9.4-33.9 0l-111 111-47-47c-'
-HTML += b'9.4-9.4-24.6-9.4-33.9 0s-9.4 24.6 0 33.9l64 64c9.4 9.4 24.6 '
-HTML += b'9.4 33.9 0L369 209z"/></svg>\',I=\'<svg xmlns="http://www.w3.o'
-HTML += b'rg/2000/svg" height="25" viewBox="0 0 384 512" fill="white">'
-HTML += b'<path d="M73 39c-14.8-9.1-33.4-9.4-48.5-.9S0 62.6 0 80V432c0'
-HTML += b' 17.4 9.4 33.4 24.5 41.9s33.7 8.1 48.5-.9L361 297c14.3-8.7 2'
-HTML += b'3-24.2 23-41s-8.7-32.2-23-41L73 39z"/></svg>\',te=\'<svg xmlns'
-HTML += b'="http://www.w3.org/2000/svg" height="25" viewBox="0 0 512 5'
-HTML += b'12" fill="white"><path d="M0 224c0 17.7 14.3 32 32 32s32-14.'
-HTML += b'3 32-32c0-53 43-96 96-96H320v32c0 12.9 7.8 24.6 19.8 29.6s25'
-HTML += b'.7 2.2 34.9-6.9l64-64c12.5-12.5 12.5-32.8 0-45.3l-64-64c-9.2'
-HTML += b'-9.2-22.9-11.9-34.9-6.9S320 19.1 320 32V64H160C71.6 64 0 135'
-HTML += b'.6 0 224zm512 64c0-17.7-14.3-32-32-32s-32 14.3-32 32c0 53-43'
-HTML += b' 96-96 96H192V352c0-12.9-7.8-24.6-19.8-29.6s-25.7-2.2-34.9 6'
-HTML += b'.9l-64 64c-12.5 12.5-12.5 32.8 0 45.3l64 64c9.2 9.2 22.9 11.'
-HTML += b'9 34.9 6.9s19.8-16.6 19.8-29.6V448H352c88.4 0 160-71.6 160-1'
-HTML += b'60z"/></svg>\';function P(r,e=!1){let t=new Array(r);for(let '
-HTML += b'i=0;i<r;i++)t[i]=i;if(e)for(let i=0;i<r;i++){let s=Math.floo'
-HTML += b'r(Math.random()*r),l=Math.floor(Math.random()*r),a=t[s];t[s]'
-HTML += b'=t[l],t[l]=a}return t}function _(r,e,t=-1){if(t<0&&(t=r.leng'
-HTML += b'th),t==1){e.push([...r]);return}for(let i=0;i<t;i++){_(r,e,t'
-HTML += b'-1);let s=t%2==0?i:0,l=r[s];r[s]=r[t-1],r[t-1]=l}}var E=clas'
-HTML += b's r{constructor(e,t){this.m=e,this.n=t,this.v=new Array(e*t)'
-HTML += b'.fill("0")}getElement(e,t){return e<0||e>=this.m||t<0||t>=th'
-HTML += b'is.n?"":this.v[e*this.n+t]}resize(e,t,i){if(e<1||e>50||t<1||'
-HTML += b't>50)return!1;let s=new r(e,t);s.v.fill(i);for(let l=0;l<s.m'
-HTML += b';l++)for(let a=0;a<s.n;a++)s.v[l*s.n+a]=this.getElement(l,a)'
-HTML += b';return this.fromMatrix(s),!0}fromMatrix(e){this.m=e.m,this.'
-HTML += b'n=e.n,this.v=[...e.v]}fromString(e){this.m=e.split("],").len'
-HTML += b'gth,this.v=e.replaceAll("[","").replaceAll("]","").split(","'
-HTML += b').map(t=>t.trim()),this.n=this.v.length/this.m}getMaxCellStr'
-HTML += b'len(){let e=0;for(let t of this.v)t.length>e&&(e=t.length);r'
-HTML += b'eturn e}toTeXString(e=!1,t=!0){let i="";t?i+=e?"\\\\left[\\\\beg'
-HTML += b'in{array}":"\\\\begin{bmatrix}":i+=e?"\\\\left(\\\\begin{array}":"'
-HTML += b'\\\\begin{pmatrix}",e&&(i+="{"+"c".repeat(this.n-1)+"|c}");for'
-HTML += b'(let s=0;s<this.m;s++){for(let l=0;l<this.n;l++){l>0&&(i+="&'
-HTML += b'");let a=this.getElement(s,l);try{a=k.parse(a).toTexString()'
-HTML += b'}catch{}i+=a}i+="\\\\\\\\"}return t?i+=e?"\\\\end{array}\\\\right]":'
-HTML += b'"\\\\end{bmatrix}":i+=e?"\\\\end{array}\\\\right)":"\\\\end{pmatrix}'
-HTML += b'",i}},k=class r{constructor(){this.root=null,this.src="",thi'
-HTML += b's.token="",this.skippedWhiteSpace=!1,this.pos=0}clone(){let '
-HTML += b'e=new r;return e.root=this.root.clone(),e}getVars(e,t="",i=n'
-HTML += b'ull){if(i==null&&(i=this.root),i.op.startsWith("var:")){let '
-HTML += b's=i.op.substring(4);(t.length==0||t.length>0&&s.startsWith(t'
-HTML += b'))&&e.add(s)}for(let s of i.c)this.getVars(e,t,s)}setVars(e,'
-HTML += b't=null){t==null&&(t=this.root);for(let i of t.c)this.setVars'
-HTML += b'(e,i);if(t.op.startsWith("var:")){let i=t.op.substring(4);if'
-HTML += b'(i in e){let s=e[i].clone();t.op=s.op,t.c=s.c,t.re=s.re,t.im'
-HTML += b'=s.im}}}renameVar(e,t,i=null){i==null&&(i=this.root);for(let'
-HTML += b' s of i.c)this.renameVar(e,t,s);i.op.startsWith("var:")&&i.o'
-HTML += b'p.substring(4)===e&&(i.op="var:"+t)}eval(e,t=null){let s=f.c'
-HTML += b'onst(),l=0,a=0,h=null;switch(t==null&&(t=this.root),t.op){ca'
-HTML += b'se"const":s=t;break;case"+":case"-":case"*":case"/":case"^":'
-HTML += b'{let n=this.eval(e,t.c[0]),o=this.eval(e,t.c[1]);switch(t.op'
-HTML += b'){case"+":s.re=n.re+o.re,s.im=n.im+o.im;break;case"-":s.re=n'
-HTML += b'.re-o.re,s.im=n.im-o.im;break;case"*":s.re=n.re*o.re-n.im*o.'
-HTML += b'im,s.im=n.re*o.im+n.im*o.re;break;case"/":l=o.re*o.re+o.im*o'
-HTML += b'.im,s.re=(n.re*o.re+n.im*o.im)/l,s.im=(n.im*o.re-n.re*o.im)/'
-HTML += b'l;break;case"^":h=new f("exp",[new f("*",[o,new f("ln",[n])]'
-HTML += b')]),s=this.eval(e,h);break}break}case".-":case"abs":case"sin'
-HTML += b'":case"sinc":case"cos":case"tan":case"cot":case"exp":case"ln'
-HTML += b'":case"log":case"sqrt":{let n=this.eval(e,t.c[0]);switch(t.o'
-HTML += b'p){case".-":s.re=-n.re,s.im=-n.im;break;case"abs":s.re=Math.'
-HTML += b'sqrt(n.re*n.re+n.im*n.im),s.im=0;break;case"sin":s.re=Math.s'
-HTML += b'in(n.re)*Math.cosh(n.im),s.im=Math.cos(n.re)*Math.sinh(n.im)'
-HTML += b';break;case"sinc":h=new f("/",[new f("sin",[n]),n]),s=this.e'
-HTML += b'val(e,h);break;case"cos":s.re=Math.cos(n.re)*Math.cosh(n.im)'
-HTML += b',s.im=-Math.sin(n.re)*Math.sinh(n.im);break;case"tan":l=Math'
-HTML += b'.cos(n.re)*Math.cos(n.re)+Math.sinh(n.im)*Math.sinh(n.im),s.'
-HTML += b're=Math.sin(n.re)*Math.cos(n.re)/l,s.im=Math.sinh(n.im)*Math'
-HTML += b'.cosh(n.im)/l;break;case"cot":l=Math.sin(n.re)*Math.sin(n.re'
-HTML += b')+Math.sinh(n.im)*Math.sinh(n.im),s.re=Math.sin(n.re)*Math.c'
-HTML += b'os(n.re)/l,s.im=-(Math.sinh(n.im)*Math.cosh(n.im))/l;break;c'
-HTML += b'ase"exp":s.re=Math.exp(n.re)*Math.cos(n.im),s.im=Math.exp(n.'
-HTML += b're)*Math.sin(n.im);break;case"ln":case"log":s.re=Math.log(Ma'
-HTML += b'th.sqrt(n.re*n.re+n.im*n.im)),l=Math.abs(n.im)<1e-9?0:n.im,s'
-HTML += b'.im=Math.atan2(l,n.re);break;case"sqrt":h=new f("^",[n,f.con'
-HTML += b'st(.5)]),s=this.eval(e,h);break}break}default:if(t.op.starts'
-HTML += b'With("var:")){let n=t.op.substring(4);if(n==="pi")return f.c'
-HTML += b'onst(Math.PI);if(n==="e")return f.const(Math.E);if(n==="i")r'
-HTML += b'eturn f.const(0,1);if(n in e)return e[n];throw new Error("ev'
-HTML += b'al-error: unknown variable \'"+n+"\'")}else throw new Error("U'
-HTML += b'NIMPLEMENTED eval \'"+t.op+"\'")}return s}static parse(e){let '
-HTML += b't=new r;if(t.src=e,t.token="",t.skippedWhiteSpace=!1,t.pos=0'
-HTML += b',t.next(),t.root=t.parseExpr(!1),t.token!=="")throw new Erro'
-HTML += b'r("remaining tokens: "+t.token+"...");return t}parseExpr(e){'
-HTML += b'return this.parseAdd(e)}parseAdd(e){let t=this.parseMul(e);f'
-HTML += b'or(;["+","-"].includes(this.token)&&!(e&&this.skippedWhiteSp'
-HTML += b'ace);){let i=this.token;this.next(),t=new f(i,[t,this.parseM'
-HTML += b'ul(e)])}return t}parseMul(e){let t=this.parsePow(e);for(;!(e'
-HTML += b'&&this.skippedWhiteSpace);){let i="*";if(["*","/"].includes('
-HTML += b'this.token))i=this.token,this.next();else if(!e&&this.token='
-HTML += b'=="(")i="*";else if(this.token.length>0&&(this.isAlpha(this.'
-HTML += b'token[0])||this.isNum(this.token[0])))i="*";else break;t=new'
-HTML += b' f(i,[t,this.parsePow(e)])}return t}parsePow(e){let t=this.p'
-HTML += b'arseUnary(e);for(;["^"].includes(this.token)&&!(e&&this.skip'
-HTML += b'pedWhiteSpace);){let i=this.token;this.next(),t=new f(i,[t,t'
-HTML += b'his.parseUnary(e)])}return t}parseUnary(e){return this.token'
-HTML += b'==="-"?(this.next(),new f(".-",[this.parseMul(e)])):this.par'
-HTML += b'seInfix(e)}parseInfix(e){if(this.token.length==0)throw new E'
-HTML += b'rror("expected unary");if(this.isNum(this.token[0])){let t=t'
-HTML += b'his.token;return this.next(),this.token==="."&&(t+=".",this.'
-HTML += b'next(),this.token.length>0&&(t+=this.token,this.next())),new'
-HTML += b' f("const",[],parseFloat(t))}else if(this.fun1().length>0){l'
-HTML += b'et t=this.fun1();this.next(t.length);let i=null;if(this.toke'
-HTML += b'n==="(")if(this.next(),i=this.parseExpr(e),this.token+="",th'
-HTML += b'is.token===")")this.next();else throw Error("expected \')\'");'
-HTML += b'else i=this.parseMul(!0);return new f(t,[i])}else if(this.to'
-HTML += b'ken==="("){this.next();let t=this.parseExpr(e);if(this.token'
-HTML += b'+="",this.token===")")this.next();else throw Error("expected'
-HTML += b' \')\'");return t.explicitParentheses=!0,t}else if(this.token='
-HTML += b'=="|"){this.next();let t=this.parseExpr(e);if(this.token+=""'
-HTML += b',this.token==="|")this.next();else throw Error("expected \'|\''
-HTML += b'");return new f("abs",[t])}else if(this.isAlpha(this.token[0'
-HTML += b'])){let t="";return this.token.startsWith("pi")?t="pi":this.'
-HTML += b'token.startsWith("C1")?t="C1":this.token.startsWith("C2")?t='
-HTML += b'"C2":t=this.token[0],t==="I"&&(t="i"),this.next(t.length),ne'
-HTML += b'w f("var:"+t,[])}else throw new Error("expected unary")}stat'
-HTML += b'ic compare(e,t,i={}){let a=new Set;e.getVars(a),t.getVars(a)'
-HTML += b';for(let h=0;h<10;h++){let n={};for(let m of a)m in i?n[m]=i'
-HTML += b'[m]:n[m]=f.const(Math.random(),Math.random());let o=e.eval(n'
-HTML += b'),c=t.eval(n),u=o.re-c.re,d=o.im-c.im;if(Math.sqrt(u*u+d*d)>'
-HTML += b'1e-9)return!1}return!0}fun1(){let e=["abs","sinc","sin","cos'
-HTML += b'","tan","cot","exp","ln","sqrt"];for(let t of e)if(this.toke'
-HTML += b'n.toLowerCase().startsWith(t))return t;return""}next(e=-1){i'
-HTML += b'f(e>0&&this.token.length>e){this.token=this.token.substring('
-HTML += b'e),this.skippedWhiteSpace=!1;return}this.token="";let t=!1,i'
-HTML += b'=this.src.length;for(this.skippedWhiteSpace=!1;this.pos<i&&`'
-HTML += b'\t\n `.includes(this.src[this.pos]);)this.skippedWhiteSpace=!0'
-HTML += b',this.pos++;for(;!t&&this.pos<i;){let s=this.src[this.pos];i'
-HTML += b'f(this.token.length>0&&(this.isNum(this.token[0])&&this.isAl'
-HTML += b'pha(s)||this.isAlpha(this.token[0])&&this.isNum(s))&&this.to'
-HTML += b'ken!="C")return;if(`^%#*$()[]{},.:;+-*/_!<>=?|\t\n `.includes('
-HTML += b's)){if(this.token.length>0)return;t=!0}`\t\n `.includes(s)==!1'
-HTML += b'&&(this.token+=s),this.pos++}}isNum(e){return e.charCodeAt(0'
-HTML += b')>=48&&e.charCodeAt(0)<=57}isAlpha(e){return e.charCodeAt(0)'
-HTML += b'>=65&&e.charCodeAt(0)<=90||e.charCodeAt(0)>=97&&e.charCodeAt'
-HTML += b'(0)<=122||e==="_"}toString(){return this.root==null?"":this.'
-HTML += b'root.toString()}toTexString(){return this.root==null?"":this'
-HTML += b'.root.toTexString()}},f=class r{constructor(e,t,i=0,s=0){thi'
-HTML += b's.op=e,this.c=t,this.re=i,this.im=s,this.explicitParentheses'
-HTML += b'=!1}clone(){let e=new r(this.op,this.c.map(t=>t.clone()),thi'
-HTML += b's.re,this.im);return e.explicitParentheses=this.explicitPare'
-HTML += b'ntheses,e}static const(e=0,t=0){return new r("const",[],e,t)'
-HTML += b'}compare(e,t=0,i=1e-9){let s=this.re-e,l=this.im-t;return Ma'
-HTML += b'th.sqrt(s*s+l*l)<i}toString(){let e="";if(this.op==="const")'
-HTML += b'{let t=Math.abs(this.re)>1e-14,i=Math.abs(this.im)>1e-14;t&&'
-HTML += b'i&&this.im>=0?e="("+this.re+"+"+this.im+"i)":t&&i&&this.im<0'
-HTML += b'?e="("+this.re+"-"+-this.im+"i)":t&&this.re>0?e=""+this.re:t'
-HTML += b'&&this.re<0?e="("+this.re+")":i?e="("+this.im+"i)":e="0"}els'
-HTML += b'e this.op.startsWith("var")?e=this.op.split(":")[1]:this.c.l'
-HTML += b'ength==1?e=(this.op===".-"?"-":this.op)+"("+this.c.toString('
-HTML += b')+")":e="("+this.c.map(t=>t.toString()).join(this.op)+")";re'
-HTML += b'turn e}toTexString(e=!1){let i="";switch(this.op){case"const'
-HTML += b'":{let s=Math.abs(this.re)>1e-9,l=Math.abs(this.im)>1e-9,a=s'
-HTML += b'?""+this.re:"",h=l?""+this.im+"i":"";h==="1i"?h="i":h==="-1i'
-HTML += b'"&&(h="-i"),!s&&!l?i="0":(l&&this.im>=0&&s&&(h="+"+h),i=a+h)'
-HTML += b';break}case".-":i="-"+this.c[0].toTexString();break;case"+":'
-HTML += b'case"-":case"*":case"^":{let s=this.c[0].toTexString(),l=thi'
-HTML += b's.c[1].toTexString(),a=this.op==="*"?"\\\\cdot ":this.op;i="{"'
-HTML += b'+s+"}"+a+"{"+l+"}";break}case"/":{let s=this.c[0].toTexStrin'
-HTML += b'g(!0),l=this.c[1].toTexString(!0);i="\\\\frac{"+s+"}{"+l+"}";b'
-HTML += b'reak}case"sin":case"sinc":case"cos":case"tan":case"cot":case'
-HTML += b'"exp":case"ln":{let s=this.c[0].toTexString(!0);i+="\\\\"+this'
-HTML += b'.op+"\\\\left("+s+"\\\\right)";break}case"sqrt":{let s=this.c[0]'
-HTML += b'.toTexString(!0);i+="\\\\"+this.op+"{"+s+"}";break}case"abs":{'
-HTML += b'let s=this.c[0].toTexString(!0);i+="\\\\left|"+s+"\\\\right|";br'
-HTML += b'eak}default:if(this.op.startsWith("var:")){let s=this.op.sub'
-HTML += b'string(4);switch(s){case"pi":s="\\\\pi";break}i=" "+s+" "}else'
-HTML += b'{let s="warning: Node.toString(..):";s+=" unimplemented oper'
-HTML += b'ator \'"+this.op+"\'",console.log(s),i=this.op,this.c.length>0'
-HTML += b'&&(i+="\\\\left({"+this.c.map(l=>l.toTexString(!0)).join(",")+'
-HTML += b'"}\\\\right)")}}return!e&&this.explicitParentheses&&(i="\\\\left'
-HTML += b'({"+i+"}\\\\right)"),i}};function ie(r,e){let t=1e-9;if(k.comp'
-HTML += b'are(r,e))return!0;r=r.clone(),e=e.clone(),N(r.root),N(e.root'
-HTML += b');let i=new Set;r.getVars(i),e.getVars(i);let s=[],l=[];for('
-HTML += b'let n of i.keys())n.startsWith("C")?s.push(n):l.push(n);let '
-HTML += b'a=s.length;for(let n=0;n<a;n++){let o=s[n];r.renameVar(o,"_C'
-HTML += b'"+n),e.renameVar(o,"_C"+n)}for(let n=0;n<a;n++)r.renameVar("'
-HTML += b'_C"+n,"C"+n),e.renameVar("_C"+n,"C"+n);s=[];for(let n=0;n<a;'
-HTML += b'n++)s.push("C"+n);let h=[];_(P(a),h);for(let n of h){let o=r'
-HTML += b'.clone(),c=e.clone();for(let d=0;d<a;d++)c.renameVar("C"+d,"'
-HTML += b'__C"+n[d]);for(let d=0;d<a;d++)c.renameVar("__C"+d,"C"+d);le'
-HTML += b't u=!0;for(let d=0;d<a;d++){let p="C"+d,m={};m[p]=new f("*",'
-HTML += b'[new f("var:C"+d,[]),new f("var:K",[])]),c.setVars(m);let g='
-HTML += b'{};g[p]=f.const(Math.random(),Math.random());for(let w=0;w<a'
-HTML += b';w++)d!=w&&(g["C"+w]=f.const(0,0));let M=new f("abs",[new f('
-HTML += b'"-",[o.root,c.root])]),y=new k;y.root=M;for(let w of l)g[w]='
-HTML += b'f.const(Math.random(),Math.random());let C=ce(y,"K",g)[0];c.'
-HTML += b'setVars({K:f.const(C,0)}),g={};for(let w=0;w<a;w++)d!=w&&(g['
-HTML += b'"C"+w]=f.const(0,0));if(k.compare(o,c,g)==!1){u=!1;break}}if'
-HTML += b'(u&&k.compare(o,c))return!0}return!1}function ce(r,e,t){let '
-HTML += b'i=1e-11,s=1e3,l=0,a=0,h=1,n=888;for(;l<s;){t[e]=f.const(a);l'
-HTML += b'et c=r.eval(t).re;t[e]=f.const(a+h);let u=r.eval(t).re;t[e]='
-HTML += b'f.const(a-h);let d=r.eval(t).re,p=0;if(u<c&&(c=u,p=1),d<c&&('
-HTML += b'c=d,p=-1),p==1&&(a+=h),p==-1&&(a-=h),c<i)break;(p==0||p!=n)&'
-HTML += b'&(h/=2),n=p,l++}t[e]=f.const(a);let o=r.eval(t).re;return[a,'
-HTML += b'o]}function N(r){for(let e of r.c)N(e);switch(r.op){case"+":'
-HTML += b'case"-":case"*":case"/":case"^":{let e=[r.c[0].op,r.c[1].op]'
-HTML += b',t=[e[0]==="const",e[1]==="const"],i=[e[0].startsWith("var:C'
-HTML += b'"),e[1].startsWith("var:C")];i[0]&&t[1]?(r.op=r.c[0].op,r.c='
-HTML += b'[]):i[1]&&t[0]?(r.op=r.c[1].op,r.c=[]):i[0]&&i[1]&&e[0]==e[1'
-HTML += b']&&(r.op=r.c[0].op,r.c=[]);break}case".-":case"abs":case"sin'
-HTML += b'":case"sinc":case"cos":case"tan":case"cot":case"exp":case"ln'
-HTML += b'":case"log":case"sqrt":r.c[0].op.startsWith("var:C")&&(r.op='
-HTML += b'r.c[0].op,r.c=[]);break}}function se(r){r.feedbackSpan.inner'
-HTML += b'HTML="",r.numChecked=0,r.numCorrect=0;let e=!0;for(let s in '
-HTML += b'r.expected){let l=r.types[s],a=r.student[s],h=r.expected[s];'
-HTML += b'switch(a!=null&&a.length==0&&(e=!1),l){case"bool":r.numCheck'
-HTML += b'ed++,a===h&&r.numCorrect++;break;case"string":{r.numChecked+'
-HTML += b'+;let n=r.gapInputs[s],o=a.trim().toUpperCase(),c=h.trim().t'
-HTML += b'oUpperCase().split("|"),u=!1;for(let d of c)if(Y(o,d)<=1){u='
-HTML += b'!0,r.numCorrect++,r.gapInputs[s].value=d,r.student[s]=d;brea'
-HTML += b'k}n.style.color=u?"black":"white",n.style.backgroundColor=u?'
-HTML += b'"transparent":"maroon";break}case"int":r.numChecked++,Math.a'
-HTML += b'bs(parseFloat(a)-parseFloat(h))<1e-9&&r.numCorrect++;break;c'
-HTML += b'ase"float":case"term":{r.numChecked++;try{let n=k.parse(h),o'
-HTML += b'=k.parse(a),c=!1;r.src.is_ode?c=ie(n,o):c=k.compare(n,o),c&&'
-HTML += b'r.numCorrect++}catch(n){r.debug&&(console.log("term invalid"'
-HTML += b'),console.log(n))}break}case"vector":case"complex":case"set"'
-HTML += b':{let n=h.split(",");r.numChecked+=n.length;let o=[];for(let'
-HTML += b' c=0;c<n.length;c++){let u=r.student[s+"-"+c];u.length==0&&('
-HTML += b'e=!1),o.push(u)}if(l==="set")for(let c=0;c<n.length;c++)try{'
-HTML += b'let u=k.parse(n[c]);for(let d=0;d<o.length;d++){let p=k.pars'
-HTML += b'e(o[d]);if(k.compare(u,p)){r.numCorrect++;break}}}catch(u){r'
-HTML += b'.debug&&console.log(u)}else for(let c=0;c<n.length;c++)try{l'
-HTML += b'et u=k.parse(o[c]),d=k.parse(n[c]);k.compare(u,d)&&r.numCorr'
-HTML += b'ect++}catch(u){r.debug&&console.log(u)}break}case"matrix":{l'
-HTML += b'et n=new E(0,0);n.fromString(h),r.numChecked+=n.m*n.n;for(le'
-HTML += b't o=0;o<n.m;o++)for(let c=0;c<n.n;c++){let u=o*n.n+c;a=r.stu'
-HTML += b'dent[s+"-"+u],a!=null&&a.length==0&&(e=!1);let d=n.v[u];try{'
-HTML += b'let p=k.parse(d),m=k.parse(a);k.compare(p,m)&&r.numCorrect++'
-HTML += b'}catch(p){r.debug&&console.log(p)}}break}default:r.feedbackS'
-HTML += b'pan.innerHTML="UNIMPLEMENTED EVAL OF TYPE "+l}}e==!1?r.state'
-HTML += b'=x.incomplete:r.state=r.numCorrect==r.numChecked?x.passed:x.'
-HTML += b'errors,r.updateVisualQuestionState();let t=[];switch(r.state'
-HTML += b'){case x.passed:t=X[r.language];break;case x.incomplete:t=Z['
-HTML += b'r.language];break;case x.errors:t=q[r.language];break}let i='
-HTML += b't[Math.floor(Math.random()*t.length)];r.feedbackPopupDiv.inn'
-HTML += b'erHTML=i,r.feedbackPopupDiv.style.color=r.state===x.passed?"'
-HTML += b'green":"maroon",r.feedbackPopupDiv.style.display="block",set'
-HTML += b'Timeout(()=>{r.feedbackPopupDiv.style.display="none"},500),r'
-HTML += b'.state===x.passed?r.src.instances.length>0?r.checkAndRepeatB'
-HTML += b'tn.innerHTML=te:r.checkAndRepeatBtn.style.display="none":r.c'
-HTML += b'heckAndRepeatBtn.innerHTML=I}var A=class{constructor(e,t,i,s'
-HTML += b'){this.question=t,this.inputId=i,i.length==0&&(this.inputId='
-HTML += b'i="gap-"+t.gapIdx,t.types[this.inputId]="string",t.expected['
-HTML += b'this.inputId]=s,t.gapIdx++),i in t.student||(t.student[i]=""'
-HTML += b');let l=s.split("|"),a=0;for(let c=0;c<l.length;c++){let u=l'
-HTML += b'[c];u.length>a&&(a=u.length)}let h=v("");e.appendChild(h);le'
-HTML += b't n=Math.max(a*15,24),o=R(n);if(t.gapInputs[this.inputId]=o,'
-HTML += b'o.addEventListener("keyup",()=>{this.question.editedQuestion'
-HTML += b'(),o.value=o.value.toUpperCase(),this.question.student[this.'
-HTML += b'inputId]=o.value.trim()}),h.appendChild(o),this.question.sho'
-HTML += b'wSolution&&(this.question.student[this.inputId]=o.value=l[0]'
-HTML += b',l.length>1)){let c=v("["+l.join("|")+"]");c.style.fontSize='
-HTML += b'"small",c.style.textDecoration="underline",h.appendChild(c)}'
-HTML += b'}},D=class{constructor(e,t,i,s,l,a,h=!1){i in t.student||(t.'
-HTML += b'student[i]=""),this.question=t,this.inputId=i,this.outerSpan'
-HTML += b'=v(""),this.outerSpan.style.position="relative",e.appendChil'
-HTML += b'd(this.outerSpan),this.inputElement=R(Math.max(s*12,48)),thi'
-HTML += b's.outerSpan.appendChild(this.inputElement),this.equationPrev'
-HTML += b'iewDiv=b(),this.equationPreviewDiv.classList.add("equationPr'
-HTML += b'eview"),this.equationPreviewDiv.style.display="none",this.ou'
-HTML += b'terSpan.appendChild(this.equationPreviewDiv),this.inputEleme'
-HTML += b'nt.addEventListener("click",()=>{this.question.editedQuestio'
-HTML += b'n(),this.edited()}),this.inputElement.addEventListener("keyu'
-HTML += b'p",()=>{this.question.editedQuestion(),this.edited()}),this.'
-HTML += b'inputElement.addEventListener("focusout",()=>{this.equationP'
-HTML += b'reviewDiv.innerHTML="",this.equationPreviewDiv.style.display'
-HTML += b'="none"}),this.inputElement.addEventListener("keydown",n=>{l'
-HTML += b'et o="abcdefghijklmnopqrstuvwxyz";o+="ABCDEFGHIJKLMNOPQRSTUV'
-HTML += b'WXYZ",o+="0123456789",o+="+-*/^(). <>=|",a&&(o="-0123456789"'
-HTML += b'),n.key.length<3&&o.includes(n.key)==!1&&n.preventDefault();'
-HTML += b'let c=this.inputElement.value.length*12;this.inputElement.of'
-HTML += b'fsetWidth<c&&(this.inputElement.style.width=""+c+"px")}),(h|'
-HTML += b'|this.question.showSolution)&&(t.student[i]=this.inputElemen'
-HTML += b't.value=l)}edited(){let e=this.inputElement.value.trim(),t="'
-HTML += b'",i=!1;try{let s=k.parse(e);i=s.root.op==="const",t=s.toTexS'
-HTML += b'tring(),this.inputElement.style.color="black",this.equationP'
-HTML += b'reviewDiv.style.backgroundColor="green"}catch{t=e.replaceAll'
-HTML += b'("^","\\\\hat{~}").replaceAll("_","\\\\_"),this.inputElement.sty'
-HTML += b'le.color="maroon",this.equationPreviewDiv.style.backgroundCo'
-HTML += b'lor="maroon"}W(this.equationPreviewDiv,t,!0),this.equationPr'
-HTML += b'eviewDiv.style.display=e.length>0&&!i?"block":"none",this.qu'
-HTML += b'estion.student[this.inputId]=e}},V=class{constructor(e,t,i,s'
-HTML += b'){this.parent=e,this.question=t,this.inputId=i,this.matExpec'
-HTML += b'ted=new E(0,0),this.matExpected.fromString(s),this.matStuden'
-HTML += b't=new E(this.matExpected.m==1?1:3,this.matExpected.n==1?1:3)'
-HTML += b',t.showSolution&&this.matStudent.fromMatrix(this.matExpected'
-HTML += b'),this.genMatrixDom(!0)}genMatrixDom(e){let t=b();this.paren'
-HTML += b't.innerHTML="",this.parent.appendChild(t),t.style.position="'
-HTML += b'relative",t.style.display="inline-block";let i=document.crea'
-HTML += b'teElement("table");t.appendChild(i);let s=this.matExpected.g'
-HTML += b'etMaxCellStrlen();for(let p=0;p<this.matStudent.m;p++){let m'
-HTML += b'=document.createElement("tr");i.appendChild(m),p==0&&m.appen'
-HTML += b'dChild(this.generateMatrixParenthesis(!0,this.matStudent.m))'
-HTML += b';for(let g=0;g<this.matStudent.n;g++){let M=p*this.matStuden'
-HTML += b't.n+g,y=document.createElement("td");m.appendChild(y);let C='
-HTML += b'this.inputId+"-"+M;new D(y,this.question,C,s,this.matStudent'
-HTML += b'.v[M],!1,!e)}p==0&&m.appendChild(this.generateMatrixParenthe'
-HTML += b'sis(!1,this.matStudent.m))}let l=["+","-","+","-"],a=[0,0,1,'
-HTML += b'-1],h=[1,-1,0,0],n=[0,22,888,888],o=[888,888,-22,-22],c=[-22'
-HTML += b',-22,0,22],u=[this.matExpected.n!=1,this.matExpected.n!=1,th'
-HTML += b'is.matExpected.m!=1,this.matExpected.m!=1],d=[this.matStuden'
-HTML += b't.n>=10,this.matStudent.n<=1,this.matStudent.m>=10,this.matS'
-HTML += b'tudent.m<=1];for(let p=0;p<4;p++){if(u[p]==!1)continue;let m'
-HTML += b'=v(l[p]);n[p]!=888&&(m.style.top=""+n[p]+"px"),o[p]!=888&&(m'
-HTML += b'.style.bottom=""+o[p]+"px"),c[p]!=888&&(m.style.right=""+c[p'
-HTML += b']+"px"),m.classList.add("matrixResizeButton"),t.appendChild('
-HTML += b'm),d[p]?m.style.opacity="0.5":m.addEventListener("click",()='
-HTML += b'>{for(let g=0;g<this.matStudent.m;g++)for(let M=0;M<this.mat'
-HTML += b'Student.n;M++){let y=g*this.matStudent.n+M,C=this.inputId+"-'
-HTML += b'"+y,S=this.question.student[C];this.matStudent.v[y]=S,delete'
-HTML += b' this.question.student[C]}this.matStudent.resize(this.matStu'
-HTML += b'dent.m+a[p],this.matStudent.n+h[p],""),this.genMatrixDom(!1)'
-HTML += b'})}}generateMatrixParenthesis(e,t){let i=document.createElem'
-HTML += b'ent("td");i.style.width="3px";for(let s of["Top",e?"Left":"R'
-HTML += b'ight","Bottom"])i.style["border"+s+"Width"]="2px",i.style["b'
-HTML += b'order"+s+"Style"]="solid";return this.question.language=="de'
-HTML += b'"&&(e?i.style.borderTopLeftRadius="5px":i.style.borderTopRig'
-HTML += b'htRadius="5px",e?i.style.borderBottomLeftRadius="5px":i.styl'
-HTML += b'e.borderBottomRightRadius="5px"),i.rowSpan=t,i}};var x={init'
-HTML += b':0,errors:1,passed:2,incomplete:3},H=class{constructor(e,t,i'
-HTML += b',s){this.state=x.init,this.language=i,this.src=t,this.debug='
-HTML += b's,this.instanceOrder=P(t.instances.length,!0),this.instanceI'
-HTML += b'dx=0,this.choiceIdx=0,this.includesSingleChoice=!1,this.gapI'
-HTML += b'dx=0,this.expected={},this.types={},this.student={},this.gap'
-HTML += b'Inputs={},this.parentDiv=e,this.questionDiv=null,this.feedba'
-HTML += b'ckPopupDiv=null,this.titleDiv=null,this.checkAndRepeatBtn=nu'
-HTML += b'll,this.showSolution=!1,this.feedbackSpan=null,this.numCorre'
-HTML += b'ct=0,this.numChecked=0,this.hasCheckButton=!0}reset(){this.i'
-HTML += b'nstanceIdx=(this.instanceIdx+1)%this.src.instances.length}ge'
-HTML += b'tCurrentInstance(){let e=this.instanceOrder[this.instanceIdx'
-HTML += b'];return this.src.instances[e]}editedQuestion(){this.state=x'
-HTML += b'.init,this.updateVisualQuestionState(),this.questionDiv.styl'
-HTML += b'e.color="black",this.checkAndRepeatBtn.innerHTML=I,this.chec'
-HTML += b'kAndRepeatBtn.style.display="block",this.checkAndRepeatBtn.s'
-HTML += b'tyle.color="black"}updateVisualQuestionState(){let e="black"'
-HTML += b',t="transparent";switch(this.state){case x.init:case x.incom'
-HTML += b'plete:e="rgb(0,0,0)",t="transparent";break;case x.passed:e="'
-HTML += b'rgb(0,150,0)",t="rgba(0,150,0, 0.025)";break;case x.errors:e'
-HTML += b'="rgb(150,0,0)",t="rgba(150,0,0, 0.025)",this.includesSingle'
-HTML += b'Choice==!1&&this.numChecked>=5&&(this.feedbackSpan.innerHTML'
-HTML += b'=""+this.numCorrect+" / "+this.numChecked);break}this.questi'
-HTML += b'onDiv.style.color=this.feedbackSpan.style.color=this.titleDi'
-HTML += b'v.style.color=this.checkAndRepeatBtn.style.backgroundColor=t'
-HTML += b'his.questionDiv.style.borderColor=e,this.questionDiv.style.b'
-HTML += b'ackgroundColor=t}populateDom(){if(this.parentDiv.innerHTML="'
-HTML += b'",this.questionDiv=b(),this.parentDiv.appendChild(this.quest'
-HTML += b'ionDiv),this.questionDiv.classList.add("question"),this.feed'
-HTML += b'backPopupDiv=b(),this.feedbackPopupDiv.classList.add("questi'
-HTML += b'onFeedback"),this.questionDiv.appendChild(this.feedbackPopup'
-HTML += b'Div),this.feedbackPopupDiv.innerHTML="awesome",this.debug&&"'
-HTML += b'src_line"in this.src){let s=b();s.classList.add("debugInfo")'
-HTML += b',s.innerHTML="Source code: lines "+this.src.src_line+"..",th'
-HTML += b'is.questionDiv.appendChild(s)}if(this.titleDiv=b(),this.ques'
-HTML += b'tionDiv.appendChild(this.titleDiv),this.titleDiv.classList.a'
-HTML += b'dd("questionTitle"),this.titleDiv.innerHTML=this.src.title,t'
-HTML += b'his.src.error.length>0){let s=v(this.src.error);this.questio'
-HTML += b'nDiv.appendChild(s),s.style.color="red";return}let e=this.ge'
-HTML += b'tCurrentInstance();if(e!=null&&"__svg_image"in e){let s=e.__'
-HTML += b'svg_image.v,l=b();this.questionDiv.appendChild(l);let a=docu'
-HTML += b'ment.createElement("img");l.appendChild(a),a.classList.add("'
-HTML += b'img"),a.src="data:image/svg+xml;base64,"+s}for(let s of this'
-HTML += b'.src.text.c)this.questionDiv.appendChild(this.generateText(s'
-HTML += b'));let t=b();this.questionDiv.appendChild(t),t.classList.add'
-HTML += b'("buttonRow"),this.hasCheckButton=Object.keys(this.expected)'
-HTML += b'.length>0,this.hasCheckButton&&(this.checkAndRepeatBtn=j(),t'
-HTML += b'.appendChild(this.checkAndRepeatBtn),this.checkAndRepeatBtn.'
-HTML += b'innerHTML=I,this.checkAndRepeatBtn.style.backgroundColor="bl'
-HTML += b'ack");let i=v("&nbsp;&nbsp;&nbsp;");if(t.appendChild(i),this'
-HTML += b'.feedbackSpan=v(""),t.appendChild(this.feedbackSpan),this.de'
-HTML += b'bug){if(this.src.variables.length>0){let a=b();a.classList.a'
-HTML += b'dd("debugInfo"),a.innerHTML="Variables generated by Python C'
-HTML += b'ode",this.questionDiv.appendChild(a);let h=b();h.classList.a'
-HTML += b'dd("debugCode"),this.questionDiv.appendChild(h);let n=this.g'
-HTML += b'etCurrentInstance(),o="",c=[...this.src.variables];c.sort();'
-HTML += b'for(let u of c){let d=n[u].t,p=n[u].v;switch(d){case"vector"'
-HTML += b':p="["+p+"]";break;case"set":p="{"+p+"}";break}o+=d+" "+u+" '
-HTML += b'= "+p+"<br/>"}h.innerHTML=o}let s=["python_src_html","text_s'
-HTML += b'rc_html"],l=["Python Source Code","Text Source Code"];for(le'
-HTML += b't a=0;a<s.length;a++){let h=s[a];if(h in this.src&&this.src['
-HTML += b'h].length>0){let n=b();n.classList.add("debugInfo"),n.innerH'
-HTML += b'TML=l[a],this.questionDiv.appendChild(n);let o=b();o.classLi'
-HTML += b'st.add("debugCode"),this.questionDiv.append(o),o.innerHTML=t'
-HTML += b'his.src[h]}}}this.hasCheckButton&&this.checkAndRepeatBtn.add'
-HTML += b'EventListener("click",()=>{this.state==x.passed?(this.state='
-HTML += b'x.init,this.reset(),this.populateDom()):se(this)})}generateM'
-HTML += b'athString(e){let t="";switch(e.t){case"math":case"display-ma'
-HTML += b'th":for(let i of e.c){let s=this.generateMathString(i);i.t=='
-HTML += b'="var"&&t.includes("!PM")&&(s.startsWith("{-")?(s="{"+s.subs'
-HTML += b'tring(2),t=t.replaceAll("!PM","-")):t=t.replaceAll("!PM","+"'
-HTML += b')),t+=s}break;case"text":return e.d;case"plus_minus":{t+=" !'
-HTML += b'PM ";break}case"var":{let i=this.getCurrentInstance(),s=i[e.'
-HTML += b'd].t,l=i[e.d].v;switch(s){case"vector":return"\\\\left["+l+"\\\\'
-HTML += b'right]";case"set":return"\\\\left\\\\{"+l+"\\\\right\\\\}";case"comp'
-HTML += b'lex":{let a=l.split(","),h=parseFloat(a[0]),n=parseFloat(a[1'
-HTML += b']);return f.const(h,n).toTexString()}case"matrix":{let a=new'
-HTML += b' E(0,0);return a.fromString(l),t=a.toTeXString(e.d.includes('
-HTML += b'"augmented"),this.language!="de"),t}case"term":{try{t=k.pars'
-HTML += b'e(l).toTexString()}catch{}break}default:t=l}}}return e.t==="'
-HTML += b'plus_minus"?t:"{"+t+"}"}generateText(e,t=!1){switch(e.t){cas'
-HTML += b'e"paragraph":case"span":{let i=document.createElement(e.t=="'
-HTML += b'span"||t?"span":"p");for(let s of e.c)i.appendChild(this.gen'
-HTML += b'erateText(s));return i}case"text":return v(e.d);case"code":{'
-HTML += b'let i=v(e.d);return i.classList.add("code"),i}case"italic":c'
-HTML += b'ase"bold":{let i=v("");return i.append(...e.c.map(s=>this.ge'
-HTML += b'nerateText(s))),e.t==="bold"?i.style.fontWeight="bold":i.sty'
-HTML += b'le.fontStyle="italic",i}case"math":case"display-math":{let i'
-HTML += b'=this.generateMathString(e);return T(i,e.t==="display-math")'
-HTML += b'}case"string_var":{let i=v(""),s=this.getCurrentInstance(),l'
-HTML += b'=s[e.d].t,a=s[e.d].v;return l==="string"?i.innerHTML=a:(i.in'
-HTML += b'nerHTML="EXPECTED VARIABLE OF TYPE STRING",i.style.color="re'
-HTML += b'd"),i}case"gap":{let i=v("");return new A(i,this,"",e.d),i}c'
-HTML += b'ase"input":case"input2":{let i=e.t==="input2",s=v("");s.styl'
-HTML += b'e.verticalAlign="text-bottom";let l=e.d,a=this.getCurrentIns'
-HTML += b'tance()[l];if(this.expected[l]=a.v,this.types[l]=a.t,!i)swit'
-HTML += b'ch(a.t){case"set":s.append(T("\\\\{"),v(" "));break;case"vecto'
-HTML += b'r":s.append(T("["),v(" "));break}if(a.t==="string")new A(s,t'
-HTML += b'his,l,this.expected[l]);else if(a.t==="vector"||a.t==="set")'
-HTML += b'{let h=a.v.split(","),n=h.length;for(let o=0;o<n;o++){o>0&&s'
-HTML += b'.appendChild(v(" , "));let c=l+"-"+o;new D(s,this,c,h[o].len'
-HTML += b'gth,h[o],!1)}}else if(a.t==="matrix"){let h=b();s.appendChil'
-HTML += b'd(h),new V(h,this,l,a.v)}else if(a.t==="complex"){let h=a.v.'
-HTML += b'split(",");new D(s,this,l+"-0",h[0].length,h[0],!1),s.append'
-HTML += b'(v(" "),T("+"),v(" ")),new D(s,this,l+"-1",h[1].length,h[1],'
-HTML += b'!1),s.append(v(" "),T("i"))}else{let h=a.t==="int";new D(s,t'
-HTML += b'his,l,a.v.length,a.v,h)}if(!i)switch(a.t){case"set":s.append'
-HTML += b'(v(" "),T("\\\\}"));break;case"vector":s.append(v(" "),T("]"))'
-HTML += b';break}return s}case"itemize":return z(e.c.map(i=>U(this.gen'
-HTML += b'erateText(i))));case"single-choice":case"multi-choice":{let '
-HTML += b'i=e.t=="multi-choice";i||(this.includesSingleChoice=!0);let '
-HTML += b's=document.createElement("table"),l=e.c.length,a=this.debug='
-HTML += b'=!1,h=P(l,a),n=i?J:ee,o=i?G:$,c=[],u=[];for(let d=0;d<l;d++)'
-HTML += b'{let p=h[d],m=e.c[p],g="mc-"+this.choiceIdx+"-"+p;u.push(g);'
-HTML += b'let M=m.c[0].t=="bool"?m.c[0].d:this.getCurrentInstance()[m.'
-HTML += b'c[0].d].v;this.expected[g]=M,this.types[g]="bool",this.stude'
-HTML += b'nt[g]=this.showSolution?M:"false";let y=this.generateText(m.'
-HTML += b'c[1],!0),C=document.createElement("tr");s.appendChild(C),C.s'
-HTML += b'tyle.cursor="pointer";let S=document.createElement("td");c.p'
-HTML += b'ush(S),C.appendChild(S),S.innerHTML=this.student[g]=="true"?'
-HTML += b'n:o;let w=document.createElement("td");C.appendChild(w),w.ap'
-HTML += b'pendChild(y),i?C.addEventListener("click",()=>{this.editedQu'
-HTML += b'estion(),this.student[g]=this.student[g]==="true"?"false":"t'
-HTML += b'rue",this.student[g]==="true"?S.innerHTML=n:S.innerHTML=o}):'
-HTML += b'C.addEventListener("click",()=>{this.editedQuestion();for(le'
-HTML += b't L of u)this.student[L]="false";this.student[g]="true";for('
-HTML += b'let L=0;L<u.length;L++){let Q=h[L];c[Q].innerHTML=this.stude'
-HTML += b'nt[u[Q]]=="true"?n:o}})}return this.choiceIdx++,s}case"image'
-HTML += b'":{let i=b(),l=e.d.split("."),a=l[l.length-1],h=e.c[0].d,n=e'
-HTML += b'.c[1].d,o=document.createElement("img");i.appendChild(o),o.c'
-HTML += b'lassList.add("img"),o.style.width=h+"%";let c={svg:"svg+xml"'
-HTML += b',png:"png",jpg:"jpeg"};return o.src="data:image/"+c[a]+";bas'
-HTML += b'e64,"+n,i}default:{let i=v("UNIMPLEMENTED("+e.t+")");return '
-HTML += b'i.style.color="red",i}}}};function pe(r,e){["en","de","es","'
-HTML += b'it","fr"].includes(r.lang)==!1&&(r.lang="en"),e&&(document.g'
-HTML += b'etElementById("debug").style.display="block"),document.getEl'
-HTML += b'ementById("date").innerHTML=r.date,document.getElementById("'
-HTML += b'title").innerHTML=r.title,document.getElementById("author").'
-HTML += b'innerHTML=r.author,document.getElementById("courseInfo1").in'
-HTML += b'nerHTML=O[r.lang];let t=\'<span onclick="location.reload()" s'
-HTML += b'tyle="text-decoration: underline; font-weight: bold; cursor:'
-HTML += b' pointer">\'+K[r.lang]+"</span>";document.getElementById("cou'
-HTML += b'rseInfo2").innerHTML=F[r.lang].replace("*",t);let i=[],s=doc'
-HTML += b'ument.getElementById("questions"),l=1;for(let a of r.questio'
-HTML += b'ns){a.title=""+l+". "+a.title;let h=b();s.appendChild(h);let'
-HTML += b' n=new H(h,a,r.lang,e);n.showSolution=e,i.push(n),n.populate'
-HTML += b'Dom(),e&&a.error.length==0&&n.hasCheckButton&&n.checkAndRepe'
-HTML += b'atBtn.click(),l++}}return he(de);})();sell.init(quizSrc,debu'
-HTML += b'g);</script></body> </html> '
-HTML = HTML.decode('utf-8')
+HTML: bytes = zlib.decompress(
+    base64.b64decode(
+        b'eNrVvct628jSIPgqMLqPihBBgqQulkhBHllS2SrLkizJLlfJPG4QBElIJEADIHXvdb9Gz+5fzHYW'
+        b'8/WuXqwjIi9IXCjLrnNm/vFnEUBmZGREZGRk5H3rxd7x7vkfJ/vaKJmMt7Ut8fCcPjwmXuJo7siJ'
+        b'Yi+x9Y/nv9Y2dM2CiMRPxt729PZs//BQ+zDz77YsFsTTBM7Es/W5711PwyjRNTcMEi8AHNd+PxnZ'
+        b'fW/uu16NPkzND/zEd8a12HXGnt2sN1geYz+40iJvbOs+JNe15HYKOP2JM/SsmxoLG0XewNb7TuK0'
+        b'1YhOz4m99VVzZ2fn9c7O/s4+/OLzYOd1iK+/DuFnF392PuDPwY6IF/8+7JT/2/327Vtknexdb1iN'
+        b'T7+eDqxPzf5nS/nX2DzpWUnUO7ZWkpffrM1r9/Ct5X5+07BWju6+nVT9MH5rrR2fR2qiy9XqiXUN'
+        b'6E823u0OI+tmY/CWR12tHUdW783txLpdnV2dbFz99tuedeC/O7VuD/yr+cblwdpb692uf2I1X38I'
+        b'Tqzfbvt3LOXa7geAf73z4a21t3P93gLQ2xPrZdWaW+7b3RDTX1ob49/+PLHenU1OrbvV6niwufPh'
+        b't7fWob/+wbr9OBb4z/dvHWvTGqyfVD9cQf47H/ZfW9fX7/dOrMPbjci6dQMH6bucM3xHe2cfrbXq'
+        b'4JpYm+NrbL1crzbmm4dnawPrt7Pfz6zbPyZXJ9Wzqyiyrn7b/cD5f7+3c2fduSuH1prz+/xkwz8I'
+        b'Levg7M0Ha2XTigfI2Esr/y9Yq760bt9fXpJ83lq9yfpU5X93GL6z1s+uppjf1LI+f2odWVBwvmW9'
+        b'vdn8XMC3OfjcxPwixHfw0vpt9+zUaq3Nphn+QasGG8d7w5fWr68/nFs3Hz/tWxujg1PE33Stjflh'
+        b'48Q6uD2aW+M/f39pNadOcLIRvVvbs37znXMU2uW82pu8nHP+CR8IAfDDPy4P8f0Wv99ZG86bydw6'
+        b'3L09tm4/XF1ioa4dojzPSR9ONvuf/7SsdS+Yqfy//vDxV6tx8/78ZBNIObdO7jaPrOuPv35C/G/u'
+        b'AP/rmXXzx++jAce3e3Zi3f3RurI2W/1vL63V472QSaZQ/gcgdgsRWq3xdDrY+PPNHwNrZ/jbNdL7'
+        b'p7Xhvn17aP05ca6stVlvDqJpVs8taw5qqPxT+KfyB9H8Rvo22Fg7/vMcMjk+ta7dt38iva9fWh8/'
+        b'/fonlfoJr3T9t33rpb96O6hW5/FL66W3csf5J/kx/X95fDew/mgdn1jvL999wEoG+rr/ej9i8m7e'
+        b'uL/PGT6QX2I1ksPxAMs/QPhDC+pka67y7759bW1C6Ny6DNfPsb5Aof+2+/kS5emz8tr0PgeXaA/O'
+        b'rNZNPJ1vBL9BfQJ+zq3G9N3EsiZrs7uny3/3LeK7wu/eAOh9u4fp31u3V1NRP+Eb6lMcXZ5Ur6bv'
+        b'uVDW3pxeDTZ2d4aHqr6SPuwMD/at6/Ad6NOfb36/xPRvSB8toG/Vst7v7Z6hvkwG1fHUPbGq82id'
+        b'F9XJ3QaU159vTpl8mTyIfjBqV1b1On5nWXfxy0/WxuFua1AdhocrVui8qVobJ3utEyy0u0J92/m3'
+        b'/LNtXYv9Oy+29eb6TXM936zEye3Yi0eel4iGZJQk07htWW4/qF/GfW/sz6N64CVWMJ1YV07i3fwf'
+        b'jXpzvb5p9f04YSH1iR/U3TjWoR1LvGHkJ7eAeuSsbKzWgo33n/qrp/HRwcdGsjNfdZNGcO7s9PZ+'
+        b'uz757W5v3/l2ttcM+wfV3/vJ59M3vyetq/P5m1+d+O307Hbl7BM0nFEYx2HkD/3A1p0gDG4n4Sxm'
+        b'nMRu5E8TLY7cv0H5ZSnhny/f3R4fj99cu5dH5zsHH94eTIfHQdh4O27+8eHb3cfj/bF3fLhzOJl9'
+        b'80aB9/FNdR68cZPJx17jzz8a443FhG9vWYxuZAALYJtcD+1eG4CPUBs4E39829Z2IvAITO2tN557'
+        b'ie86phY7QVyLvcgfdLRHrRf2byHNxLlhXkRbazZaq9ObDgRFkGdt7A2StubMklAGATEjGTZ1+n0/'
+        b'GHK4NUwpgjgchT1qoybkA9JKas7YHwZtzQXj4EUdRi/qV1trbUyTjnYdRv3adeRM21ov8pyrGgYg'
+        b'Cn8yBBySzsY/OhqUwnTsAKO9cehePZvqR60OL6Mw+j5NTaIJErjhDPy3g2AQCiFzgFUEYAFYEG3N'
+        b'TwCd29GsZZ53L0yScAL8oWSXrdIsIYdvMy9O/DAA/NMw9vG1jVXMSfy5h+jg49vMj7w+ZBdpA8/r'
+        b'9xz3SgvnXgRCiDVA7YbjMEJxOCgOjB5G4Szo13jE9chPAFcPROpFguA4HPt9GRg5fX8W84LjYVzo'
+        b'K0pQNide6G1tQ1GeJIQybDWUECkJCqxde70rP4HQmxrUmH543dZARNo6/AEerdaEn2jYcyoNU+P/'
+        b'65srBtLwAymakABlNBiH17UbRQeEwH8VkrzX7mp+0PduUL8U7YJ6B0JLC8XpgchmCYVhrY9q3hzK'
+        b'MRaQTP+aqKEkg5UVeOMy3MBQa3nkMYUkPV6gE2rVIC0jIME3iJD+mhslPK+QlArFT2CttTVTS39Q'
+        b'PKLOKiUmgrJFZi0/pTqcxdWimkDGlVYDSBM/BjKd07jm+iKtyPC6VsLv+npOK56XQlGCc+x4Zas2'
+        b'EzrV/b6XN636LhgE34u0I+9aNzX+ZWqTMAjjqeOCGnyvMpJQVrAc+I+hVKQWo7u8WrLqBBIDoBYz'
+        b'sPW+15sNd3+OUpnrakllZVQUqOdslRqWDLEh5AGtIpRJfWMtWxWhDQvH45R8bl7VyuAF/axBbmCh'
+        b'ZCwMZqKIFHqsGvujEp6NqYVL4Ru5diKj7iyIKTtQ5QfTWfKr7437C6yysIxEhKjUrAktNBJPVZ2c'
+        b'rnzXFDfqrWe3vuEsAXfNq31PH5MInIOpE4H5yahYThLtQejOYpBHDi+kCMOAgKGdclBSJ5GHoxcZ'
+        b'2aXGk0qj2UKDyEviH3meNkp4yoQRjtUyg7VarraoIc3WBrMCRrmo1ZJrYclllVxVzzhxIgCQ7Uar'
+        b'kVH4zTWSR28GNFHD/hPcrZVxV05nObvAaXONs/uUH8Aar5xAVlXFXiEL7YInhEh446dweBpiWct2'
+        b'czD2AJwkVYP8JoAOh5RQabJVuCmM2MRJIv/m1EOmXguhcZVnlfJ7hui/DAaDTmlzmmOMnJkytUx9'
+        b'AKVGN0oZz1nKFcaFAzRnaSNy+p4bRg7LDcgHp43k8KiBL89c+C2LjxiiX47jh03N79s6jQnq4PKP'
+        b'mhDY9+eaO3Zi6I8xJ1YnIP4OUAAAYFMKTb3Wpi5SpWEIPS2BbT0By2kicy3BZNsDXUVkBUJU30nf'
+        b'3tt//fGN9mn/9Ozg+EhhBFGJFjhWiedoFA3fWORnF8ta39bOR36sgbd8p107MXSjPOiq9bVZDHVI'
+        b'23JyHdWhn4xmPWjmJ5YT9AEWukju6NoLrqzpLejrWOeDtFuWs21qycjTtvztk1uQOBQ+aHRfO/Mn'
+        b'U/Af9muHnhMFmMuhEwxnztDbsnxIcw0dw8QLtN6ttsOy0M5YFqb25uRwvrLVi7A7CvJMtNm0D+Rq'
+        b'oPxbYI8DJnAIQQFhAGrKVHZdt8deolEJaLY2cMYxeaAJcX8WuRB4/9iZO5GGnNiVimFv3w9mgUt9'
+        b'jaEX7Pnzijvyx0BVYF90jXvC58/tPtj5CQi0zsQHnVX8qkDZznWjA791ZzqF9rlSr9cFAqMTecks'
+        b'ChBB51HN5uO4mMtsvDCT2RjymI2fymI2zuZw6LMcGO6xvxD32AfcY5/j3sU0PKVAPfazqA9k61ch'
+        b'a8SyoDZxYS4UCxnRsx5PQfruyHOvbFZGLJgNx6MK6zyEqtShHyd1MPkcC+WcokL9r7M5APqt6tMb'
+        b'XZBOMFnqmSWtMKKZpV5INYuGvNgLJ5CHisAcjTINJ4F9Z2k4A72t+EHgRW/P3x+aBVVAvV5IFEYi'
+        b'+wOpQvWxFwyT0XbDwLhSLfFAyoS2LrO15ZsgFeMVQlnNe+8kI5G3x54mFJHJjdoZ2SYqReOejQFB'
+        b'hmDQKwgkEtwnoyi8Pg72owhaAoIWCN6DpWyryMyJgyM97Xv9y5fTU70ND2gJR73e/emjbsLX0ZEa'
+        b'eMQCP3xQAz+wwD//VAP/ZIG7u2rgLgQ+mo9GtoCQaSqkRZw+t5SKMsSIggCNbBEgdqW1su+9oK2T'
+        b'FZ+CEdWiWRCDamu3AKL1QLAxdGjAWGv90IuhkQHSkjDyIOhWw4ksNJ4AAn2NuK6bIG59z/dAH848'
+        b'cETAo4j6iO0A2oGJ9lqgm8VDb/DX/xpFCTbQQJjnQ42FrysPmmptz0EL7swGgAUxB4DZi9v6PjiB'
+        b'2vSv/wmugAOZat6l584gCIDjmRY4c28IndJIuwU6wRuCsvYAEBuJv/6fAKkNEXQcxkSxD6AeEu0n'
+        b'bf0Dto0OigBxgy8NZAAbw5mP04PeWIrCw4ZWm3iTMPLv7hzIxp1x3PHM56IApIOore960BQxsUJ7'
+        b'SgoAaPvg/GvzMAEhAsn+EJgFUUOpQBzI1r0C4c4AKUAC/F//AaEQ3/cY1QCLND92suXYYuX4RzjT'
+        b'XGjIlqHtFCUK4ieHDLoBoH6YzbUGHZB+OIHmvq8lTnwliu7M97Srv/5voBLblbQYl01tNoGEM0+k'
+        b'jKFnCxE7s8HQ6QH03UzzopEzhoLjhXUy85DmZc1TSw16PaAyPQADgoKZN4f2GTx7bKadMSg5SNUR'
+        b'ZfLX/0C3MfZ7PjT4y9q3TBFNIX2YEB6Q4yyc+yCNyRScTMncHfiArCA+hdCPmoazuXcHiNy0WKao'
+        b'5USOjyKGsgWY8RjoTv76P0Elkaq//gPI8kFVilJfYVKHXmro9JkInatkBj4SyscLmCQizwX31YkY'
+        b'V5EPX/jnMdogdgTR4Exx9GK88fgdYb/QnWsvDicArg/RDsDzGmhE7cCwwHfxAfVVG0Lt9DF+GIZ9'
+        b'vYv0XOjxbIq49eEsgeKHOjFiGKBcwVMJ4R2oGSX+EBIAtRc6OFjALOiqAy4eJgThOGN4Aa8aiE0w'
+        b'SQ8qCPjs7iiEVMDVhT4AaHCpfDckOqEIPJEkYUkgxcDB9y7yfaEP//oPjliQyDMQ+AcOMNPNSeUg'
+        b'wGKGEI9LZ+CDLBz4G2DbHQu2e+gGYjiW4SwGawOvgeBxiuO6zjyMTBxiGGNtT8K+ZIY0aQxFpCUz'
+        b'hWKwYVMoWgAFWca/+GMN9WhcRiY0Rpy+JLrVnKHjB8hogsRiYWpQhRLnCpVKv45CcGPBKlyTFIJQ'
+        b'8DD2fKy32Cy4I1bUo0QTxWXqaHRn7ugXtMvuaAKyFEUYJCBccNtDUmqoZlgCwKEz/+v/Qps1nAVg'
+        b'BT1sMYkE+J2y6uUHvBQcIQxwfaNw7gCUg3EOVEQHHSyenBQohooKieOeMxz7DqVlEgPzFcfOLTHm'
+        b'YXKPLBkkRUMGgRNnNnd8sDQAOoW+iUeilO3lGAd841EC7cIeSixwvcrMnBv3LsAmOJICft5OFDm3'
+        b'lTl3VapNo45KUQlm47EBPd0pueIMaFYKZHQGYVQhT9NudPwtW4B1/KrdNCiXi0b3wu/avgS9BNDL'
+        b'LVtk27lMQS+7AG1fKqDNIuh9mmezmCdnEHrIYCvALNqzC7/W7Nq2Pb+4hJdXjXazI3MDwtAPwCmy'
+        b'ShoIYNWmyb/hA8By3wghswA/5ZG7CgxG0Nu9ELR1O4+cLnicgSJE3seAnG2vb/+yFc+H2s1kHMSs'
+        b'ywc9vuvr6/r1Sj2Mhlar0WhYAKHzzr6ttzZ0bGqvX4c3tt7QGtrq6oa21mxB92sK3GjQG3u/srGq'
+        b'bTTcjfoGxDfXtZf1Fj6a659Wm+tuQ4OIGgurUfDb9VW3RtDwjTE1ivm0CcAUzoIY/FvAfvd+fVVb'
+        b'ae22Nuov4Qm5rDfgraFtiixW1uorGkUDJP3HdC4FA/RqjcfV1ldZNhhDgTUKhP9A1Z1uYa9yPtz+'
+        b'pZOX4e6/U4LrJEApk1QAqQRTqWpMKFLeqWylBFOh1kjcd+9RVrtcbkKMJNSsnBQZKpJVpKeRoNwa'
+        b'S1Hjkq0Jyd69X1mBDBqbh/Cnwbtb26yvavBXa63W1+llZaW+qTXGLA3Fyz+CaRBEjO+UmMOvvtRW'
+        b'Xx6uNFa05ss1l6fQclCxCANuMARLVC3LXT9yx//S+gAlmS/NVZTj2vpOq7Gh4R8UEhb7BgY6uUAo'
+        b'zgaWDkWtreOTopqEuLGTDSO4ci1lnO3+O/lCOlY3MhwIHnJhNQi7m0DU+mqGgwZ7c7JhlBlozvom'
+        b'ao4s2rxC1ERZSw1qNiG3ZrO2+hL+uxktUuDiWk4pxqTGLs9DE4rJVeiQ07FAzDRq8ePiXcuJF20m'
+        b'ilfDFs7WaQxalfXLFW1l0601V6Eyb9abyApjbnWjvlarb55BbW0RRxuNT6srLaipzZecIYRFrtag'
+        b'aEBu8PkSLEhT40mBwabW2nzpAvKVGtbs1grKrIXP1WaMQbWVFlgQ+j4kUsqlcepNwdu1/9vfFofQ'
+        b'tkXiAMVprTIeX2pIN9ov+h+vtGo8oIZiqK2taKsrtU0oUlACsJStxpyJpwWl+xJsJpV3cxPfNuvr'
+        b'cWsNJQDcr6zWN2vrpB5omAB+rYY/Gr2BQNA4r4LdU0xXi/5agBqUEX4EjjPIFvNoaviy0voEZrO5'
+        b'3th92YS8Qf0gEiwoFh/wdTdB9gEh2H7gj9ipETvwP4Y/jYdoxMgalMoK4w5+3zY3W59W1pBz5BAs'
+        b'/warAMhhjTisIYs1LFAkT0MWmSV3Ff7ojTGpEZOikrQ0/EMWNWRREzhiyqC5zoVJWX2Ctu0tErOx'
+        b'UScm1xs1Yhlf4C/Vov+W+o/QERl6lcCMR7PBYAzGSxljccBHx84w8wyDvBMYgCNWNQCIuX3+oCKQ'
+        b'GGWAbJyVuWGDcQgQ9Mo6oxVjGfAjxPy7EImNec66Hfagrzn7mnftpCN8NAhQBpZGnjONd8ZD6EAn'
+        b'o0kFuimJCV79bJyYV3ZN8TahqzWZJTQ9ooUDlu4kDYtZ0ivDuGfJ69NZPKpc1Ot1JWUXfUWR9/Ii'
+        b'HJQvyO1qq2Fc2RgmXVwItNHLvaUpX4zio1TAUka4V0y4BLcwI8inw/zsq3+0bLvxym83uCwRAJzh'
+        b'Dn+yb0jAQ/ANZfpII63ae5oWY753NIO+blSZmIFxj6Mp9Yk96dBLYAfsZa7ozwTKj3Up9IYO4hl6'
+        b'iRiW881LkoO/1Xh48Ldthu3h4RK/L/l3YDAB6HKAmWVx4S+z+Cpw8RjRjB0SZeI69HOQBaGebDUf'
+        b'Hibba4AwwNcAXjlCPlWB4piAPUWKGZvEWgfC6nNGuMSYqwkIMqFyyPZ9MDyAzkzVICRAKYUAoYyl'
+        b'nAiYzAZROBH5O4kcnARxe1D22UgpdyKAy57lyuWPekmZd1niM0gbDCuxTBrXY+izJxXoVuqGUD+e'
+        b'OK5HHnTfXW8HS+0CeqMAogZ1WRDHgAioN+lBd9KrQ05Qaw1BFsPJc7BY7qQF752bXW88Bsogjs8N'
+        b'TEB+QpZzH+shS05lOffFoPvEmNjyS1Z8QJuE595nzqszG6KIhW0ze9h385LYRpHy0WQbtAowiygj'
+        b'rtoy2Sv9yxecJr/48qXnDf3g3kF9fqSBbBbQY7PFjzof6i9JXFmYeCoTAwEyHVKg3+tV3dVR4tDQ'
+        b'V5gcoSpX9QcXwLM6yAVKxiCrhSwdqSFK7xKnKgD5kk4q7y1Qxej23rNR2etT3C8CZVpHod5woUIF'
+        b'hj6xO4Lw+0dAB7qJSL/AP73z+JQovaDPhfDlCy016JIwMPg7ciykNGTKVIhiLB9NFrlKRx/f203u'
+        b'Nu0cnrzdsVv86/e3B+f79ir/2ts/PHgPAaf2Bg/BccddNHteTFbhox8kG8yYNVsbqRHAVVkgaXxs'
+        b'QQS9iAbPHdlMYlSvdxEjxFYQhE8jbYMTpi8tuaMtW9/UDSXTC4TqPtjAAYIy2B0B+6duPDywMEeE'
+        b'3WEYZGnb+tdSVCQARKZ/Sb4Eml73A3c863sxIDLKEpCMKME///Fflv9rxbjo3j+a9XanWlu2vr7Y'
+        b'2rZfPTwTlRSw0ipLMCaRe156QpSvCmig3eLl+uvHo+bX0/03+59t658Vpxc/xEAB/jy4YfyQOPhM'
+        b'Hryb6cM4eIi/RYlh+anjw0ZJb3Z6cSXyTH/CXR7mfTgUytrMXhoEUFRJt5pec62xtNQTLxVnu+nV'
+        b'mti69OSbU+1BU2uIVoawIBkVZxmilnvStFPM6HYaQpTZw5pFbS1WvkxLy212FIbQSs3GY2ZZab24'
+        b'zt6T8MoL5Fd85U+nXv939OfPcH0dn/ClyGkYg84yqwoVfNeBXrmCVYadZnObRuEwcibFkBQOyA8D'
+        b'jxtyl2oOsgImw2W0Sy7qHFIIwqX24BNkXYnNaeQNfOih6GaA9YvGIZmxTnBM84JCKfiVRNjGwG4H'
+        b'ejBjr0Jw6fQspQ1sFjoNpxUqy6AeTuu0dir+HRzDig6Mt3WDT6v3bRY/68XM7K1SIkYaRw1lDE5L'
+        b'X0XC4g0jpllpv2+oTltQd3nKWrMDzg4Y71rN4GShKwkA4FGjA8mFceYlFTLdudIi5h8eiuX1wk5l'
+        b'zJVGKWMoD8LYEYafBJ6FMsq0QOKULW0WCOx+MHfGPs66UkBcKeZerkmPMSej77uJWuAEWkTb+c+h'
+        b'CD5N3iLNDO7GxvcLv9+Vqo3p7Bv4gTcXXlx4Rp6NM/Xw5k/gzQeH5RFbvPuf0hIoDNyfCeKrhOP+'
+        b'EbyaUMbs+Z9HkEtLBQlCM8UJNkhKDLLKie/8lDCkLOIKvsT/f9MlIjorDgxBlfpJI+IBv4VqRR1d'
+        b'VgGJYIh5waJkteRm+4R9EwhbypJqaV865qqlMgDhC84OZr6LTZgTgCu4tCSqBxQ9rjwc+AG4urQ+'
+        b'habdaYlKRcdUNZo9wwWKV0F4HWggDN/pjT3tF73q96v6L2wZTsaUqAZRaZZKzOEiLvH9CDitx7iM'
+        b'zh/cVtKURrG9UyyiwKjCsMUkgc0/yQyKzgr53sH8lBnkX8ehk6yvypEWHnswKY3N+vfctee6peZF'
+        b'/XrsQTnjmSdNE4qNhfxLCoGYwJEDwolmjQhPQ3wmhwtys7qSwGgWVCitSfBmU7oBshDI+QFH7KLR'
+        b'haTwC/oc48iGq7FOCfg+jPEEkqieBn6TZwR/7CN1jShqkWtEHR7mGuFr4N0kAh3zXWSPaP9mGlXY'
+        b'aBkposwE1A06xQV5Rt7E8WlBJkHFbU2vpomqOnTU04VrGAE6JfOJk3C6kxCl0klmmoYgO+BlqBA8'
+        b'ZT6YGSs0AmnS97NxNikzcxfQ8zT1mt5NvfrUwTTIGVFSLS2V+5sG7ZsjFQR7liLgQwJMtswq8aLD'
+        b'Yq+EU5MMsbmYTNQELgaE5AznocoYPgmvyxhmYwE/w5a+TD33C3iaurVQYosFQE2/hkazmDfTWlCo'
+        b'ik4oMDMJn0LIBgm6IqyVi3fG05GjgGDt4abRj49mk1yUkUV/z1h8fFbh5EVaXjh5qLLC+Rg40W25'
+        b'Pv7zP40uFoksZ7gId58pNCzWms4bJE6AwKKSoNdrunnxrLqQAh0E0AMpMwrFCCoI6Bc3mVTwrZK2'
+        b'rap+YXf2vthQ3Ew9lxa1I8O6kVPQUm27Z0P9C4qhICawjPfzKj4XwylOGYAuqmuPpRKmhgaE3DVJ'
+        b'RtTeVuaGwgpKJef2gRphqIIfvDoGwhpwJxqy3k2Bn0qu2BEyLbuCxVc691U+UpnFZ2B7k6Ijolk5'
+        b'5cvoF+MXUUL32VxRrcgKdkplhBUBEnSNMvtTxhNzff7f5CqoQ8DYd/3khPaOgXfvsVFeWa8WEf9Q'
+        b'QvzfLZSH55P/8Iu+oO47vVgvF3y5iZd+YJ6iTH9k6kNvBIHgpVPSnKiwu00OCy/fhW0J2JaA7dsZ'
+        b'AllPB8VzoBOkr1Zpvy8rUKk0WI/I70NNFeJ4hjniLiOO+IFeVJKZmcxxeIm7vrt4mNFNYt8/ikVl'
+        b'+ydndtOrbXbkCPLX8/2zcwhscH86iuU4SjLL9n46ue7RPBtNfQAxLMSmREs6HTPW5eAzoiUAcw4A'
+        b'4pzhmjdDnSZiZAezybkXJ7FNWeK0GM78NduSnbRvEAPzOboxEVhSiqUe20WxJ8IzMMzFUd20a1uQ'
+        b'uIoeVIPNsRWgaDQFB2MV4OaTwDhM+0hdLzZ1jMKniTDkiVKCe13BArC3XywkrjDdzVnKTrEwYaX5'
+        b'5HiSCw/FJHaWi2I0p5tmloHomTnvsjk1Km57W+25F3qvqc4s6FmWdESXZVE91el8OmEmFiSz77gj'
+        b'lK95iRQTLfUYtD8jGvNSwUDZ5mGaWZhHaRQWdSEzsKzL2YSOY7Nrc4GiAWLhLQhvpeHN7pOljRM1'
+        b'6nxBEwquBkjggfjxC9DhgMs22I7svPJjdgKXvKt7Np0j5j4Ua+ryGaKdpNIwjCWarzHQ75KT33ye'
+        b'2h3Z6QwINHyeq3rFQlIMkA1o6XqbPrGqJeFheO1Fu06MY5SPZHyBZZyfisWqBPGNvYqimyViebvJ'
+        b'Wj21WZDDWxLy6VkJsbwhO5HBxubQ1SIgbtlsMfORmbBehJn38Pisx1aAk2UZ0SMiRfACEuRP01+c'
+        b'xSJ6KlIBXa2y4Z6BH8UJIQdFYllTx44LkSiQc4Mi+wsRxwZs3HFsP5fGzsKeYCUlZQmMPrA9jrlG'
+        b'PTyokRTGogHOMHIdlRfQnuuGKB+sCwAoZ/NywKmTzBNQ6THlJ62HtEyq1JtY1M1QpAgpMr6WO+JK'
+        b'woX+yHoY7kiMjCg1yx3laxQy+AJK5lH4T89Mx+RGKZNQTIJnhmJofEhWtXSSKwVn6xJufjB1ZtJd'
+        b'LC/H3cXQWKFXEPMlKzj4zGLf73z+enAEZXO0v/f16HhvHz0X+Md8cqjrB5T8oI+z1nKuEXFl5hvB'
+        b'5XfNyLMbYONYzw+IgsIMp6w8XNtlLwAT8YoAkD5fiVLmjCsTkL6godbMThmy+U3V7+MZY/+M52fy'
+        b'zMDQoZBK/f4FNLAhADrJCoixqeaJWgdEQAiiFOP9ErAw5p/GsHF/NtvJcPAg0aQEtIIFjDuv936W'
+        b'vcDnzMELsAa/yJjrl7IVlAZ3wDiwgX/XZ1MQvpwhQJIVYml2AIAEpSLRo+wbswFt6TWzMVipBd/p'
+        b'QLPJdKxeNO7/CZtzNsOuJBaaZNs8JTeOEY5JR2IMB5LYqE2CFKYxBbVEkV55t6CWVehzVV3mLwFL'
+        b'9jbIUKiZUb8M/YAWKXUAuor9s2rluHcJnQXoSyGJtYbxSq819DZ6m2Uw/iSFQSblCFamOqK/X4Hk'
+        b'hphZyYyz0zq3DDh65tt2sc4aWTB37DnRojEqV8gdY9OqpdZ1MJW5fBmZJpvZyQ5gcYnL/gbBiAl9'
+        b'GppXpFzsnkCwIYbaCBxMBvC9YGIwNxlWmDZiJWxnAi9yibqFyQOuLYpqXmHtumLdA2qpw3EfZzNs'
+        b'V2k1wyltCJ3iapMYiRZQ0D7WvbkX3aa6pWow73lH3ByzeYg6Tb7dP5qF8jKMZxCM22+BZHwQ0fG1'
+        b'j0uuwil0VMFz06t6m57LepuPSHnYkQATlrqzLtkel/mwnGRAIEBZ/cft6mAw+CBFNo5sA2EHUwPe'
+        b'oYwV/agQhBEC4hepLKiwCZxLdkum4v17pkuiNBcjVQTc+RH5SuVBOcf284VMaoq5LoNRokDVkKXL'
+        b'eSKmHS8KICx1VccNaIbBpTAL4pE/QDuKnZO8dFL//iltyCDuFHE0BQ4Wjn2dBUhBQAyGVvGBAtXA'
+        b'noF6YL96AbsuH7vB5yKYAu00cI1Yu0aHDb9TbhZX238uyLVZyJWx/k9c5vYEjU/IrpkhoC74BV4Y'
+        b'aghR86xTxnwOZLEQXbKd1GZTBNZRMcrEmzxTjCXx00wiPmfsQfexw843sXljB11IuRAq7Wz2I7Pv'
+        b'G1uAJuN4qqtWC60pix458annjNPlazxng1aorXY4zMHEGeZggBEOA9g5mqUlDisb523Q2hjHfasc'
+        b'cRWUs8ojq7pvpMOFC3FsFVDU9GrtaRwcdJuSypQL4YpZZJEiPSpEJt8YF2fmBl6LrRgaf+5wYiRb'
+        b'DQ1NGw4rZNO6Sm2FJGrRgQq+worIg4yqpMhVuhBEPRu+V2jO+TwpOPd6UpyYOl0iq3Yu4tkU97XH'
+        b'BXe9MCoqdY+3RwI7a5SYCrZTFSxRQNRmqX4lyifiwcsjFK/Scm7zQQGoXJRaRlG56W1WJch11Ju+'
+        b'bsCbrgxys4iaiKn5BP6CcllaekEoDVbqJGShI6rWkxqfeoQANB6qbQxOKz4fucmQVibGKT5eRmzc'
+        b'Re3NKSZJNOW1tEkXNpJvnFmERJlJI+NYjBXznaJdw7XUbj9MNKlswAAuNp9V9Ue9in40fMzxo6My'
+        b'ZH2HFjZ79BQ9DCLGdeKDyHF5lqWZxX7ARYDLevmrG8b8DRp3GZbwN+gX8bdx8CxS2Yp1Xj7INl+r'
+        b'T2TJNeZZsr5Fyc/hFvLNoMPpnedjQ+IeVOIeJDboXjizcdJebKTUBWgSRF2Dxmuz3+cVeQq1CWdo'
+        b'vnzBWSKeD5Sdxtb+aMIO0YBkPLT1a3bgWFujZlIaoXrdaOsdgAAetFlA55OxRf3M00zCCNcTSUH9'
+        b'otMwRjj26uNwWIGEqDJCU/OWFHu3qXQq91mLeAMG8aYoT6UzCEWSljT0gWkdRtEU8vpf0vVGO67k'
+        b'HmcRFrYj7H/aOfyam2DK9Gxs3t9kZxqx8xc62b4PFk3Xzi2TIit6clCA9RaA7hcgS5A20HNiRB6f'
+        b'fN09Pjo7p50OPODTzqncWwGfO3t7cnMFfJ59fG2vpJ/vPx7KzRbwuXfwyV5LP0+Of7fX08+j/Tf2'
+        b'SwXz6zO5LQMxHxzZm5nPXZybUwgF+SqEne8c2c2WGn9uNxXS9j+f2E2FtkMAV2g7+3AK8II63jcs'
+        b'LSce5sSxP0QXkSBN3MfTZvLBRVVtJhsTjTyTCy4cajOZmGjymTxMakKYMEywFG0mCBMMYptxja8u'
+        b'f9+FTg+BAPMmlGib8Q2hCQs9N0F724xbc0zxh0cmVDH+hqatzbnFQ7nSkUE+v5QZHGSLKeX2lws2'
+        b'hHYVpa/QPMKrXP8twiNv6MeJF6nDljTzNPETm4vMxH0Q9vY9vrNeKA+nAL6FbJWgOsqWERmDQ4r8'
+        b'KCI8qMaz2QAGnz4DCmxJBY3WBGI7DgS/UEdrZGdvmB/O4Ja01M6+yplW7pSoLjpuGdDKRzpcWwV8'
+        b'hRm2szUVF3GCpHn/nCZHQdrik0ZFgUUUaEXUWhPhxYphs6EsJpBz7mJo0+/f2LLU6nQE6fGApqsJ'
+        b'+gYc6iwI5QvxIHU1XzAOJgBmMsuMruBw4NDmRVRhw0q0yJOPm6neMg7MvKDur3hbxh4bz40jvAin'
+        b'2J8fYpbZw2My6GhOb2HaHD1+VywDKq58+nh08P7kcP/9/tH5/h4VJTZkrA2jETWhYzHXMcxAaiwq'
+        b'1aMYQMdpSCkKNo/L2jGsXAdBstKiiVjaRcZ3j1E8Vjh1ppYBXEUyHmphSTzqiBhxTbdk+GI3RmFi'
+        b'VfQBXLleD9+4QaSlBZVMBTSWA9lSR9mdKlIPX9iYUGxqKpmtpuiUsvJoPl8uutWib8BTSTWYutBu'
+        b'Td0thUr4rNqrvF9uY8QFhDS7QDrbCiaCWiKoJ4NWMIg7TDysy9wm2U62QbvZKgVRUBcpwq7ZN/vV'
+        b'AFR9osL4kzIYxWHkjW5bsHUFXF1tBZ0rnKWGHPrVq67NVmQ78AroZdDBhAU9pr0O3mY/jS1iqKrw'
+        b'7KkofYYPuj0sPIcXGrhn4a0twFtbgBday3K85ERHAi1bWuMLbKxXQrE9+Umx9ClomkXL86g285fn'
+        b'vqQHw/wqhkV5WqC5/tfTwrblz5GS6pwoEdRViDwixTesRFJYIeJqRCiG56gET+JfTyVtw7axL3w0'
+        b'm/S8qO7HONEw9KLKPDKWlmSfHr62VlosM2UoAII7bCkL2Gd68eV0OQ7tYMfbW2ry1f32NFqeRbWp'
+        b'vzzzOwCJn34VP6MOYEiYFUiwrGZUfgAGrLSWMQBeEcTb3oas0L+fR1sNBfE0QkxTHzFNI5AfZABZ'
+        b'WbTNjUl4GklhA1za7UmajCPspyhjdrPInIkZkKTFmYamu1WR/M9wTI93BV412jPfnHGJJCtY+Emz'
+        b'BoWftFjQKgW1UB8SJi4+agIeXSVZMaSKTJYpGDzBSoLbiiaZ4BiHglZxqi+rIeBfPl1Xa1HOntT8'
+        b'Bdbk9dnTmDLLaAiFyVGl1DYKtuTg6Gc0WOQpeQcRS/mMsAhkllJqEgTgGUiRlt2frU5CXcppUbWl'
+        b'nBSuHqTlVabl0jYkTQxMQOXRBqykxgGDohpGs4gcP9Bb+NuyzVBbkG2tyPMi4UJ/ZTExcZRKj1PF'
+        b'Z92jlIxMROzbaXZSzfgUfEpsJga8sGjZjaqxvxwr4o0xMGN0AcAtM7fQ0fr/ngcgN/4+D7WFTEAX'
+        b'8WeVXLFMaNJKLJOqHIplKtGHw79f7xeY5kzFf5ZtztsB6CX/tB1YsRv1teXvNh2rKdizm4+/1zBw'
+        b'V5M51bbSNwF3l3VbLsCrhb4tncNRicwIHFSw4PmgrnL8kVh4fby3z9ZeMxHJMTBokemckcz6bCOz'
+        b'oDmZ2clMbqlO5nYyl1/TyOPYxaTvLiHy4zBIF1I/DSVWUwN4yf5giF6wa9gZjz/xLZGxurFeLgmv'
+        b'qBCEqTxCnQ1PMfIRkyAMdsvi5AE5OMOv4qtfebdAIjssJ7tAXzeMQj6sAz/ns/9luUkIUowju4hC'
+        b'2dVKG5YzC8ppRe0RdbvZbuZCeuhmd3GVYdVH4eU3cZPgioHuU0JRM13AMeXHZH/nRWFx7FMZRvju'
+        b'qWDsILUjgw+yJ/Nd1E9VUVM0Hm16XyijDNAFUcmEoxABAuvwPFTJZJLyBmTmul7M98FkDdZRarDc'
+        b'q4M+5XHFZ6Vd3BDRoT3DGNfNLjnCzY4Xxb0ZmB73ZpjFqHc6RXQNSbZ65IOsAXwnRoe/8rzLxq/F'
+        b'knkz85XfHH1Em6PxOLUX9qUhsCKjl10bS53V4158Wlh1yPfeZMNoKx4zKqaUP64XJNY4LnUnMnyy'
+        b'tZ08j7TWOtEBbR4oq3CSUoL6MQEg8nf2xA98PMAeT8YxdZA+x2jgyoZ8Edy/a+dyeAfK/2h0lBL5'
+        b'Gbni9Vtju2jdKXdJEbYADFJMOAudZctFRaOEGz1ZxNLSApzZZuMxuxBfNkhSNrjN2uzPD/om2+6S'
+        b'meiWEwjnx4f7pztHu/sU2lIX2Z5DxPnB8RFbYMtj3hwf7u0f2ZVmNT3zZ80wLNaZc4PEZitxe16c'
+        b'fFbe/7Bxc2bgJ7esDs7zxY67R6L4Agnu2v05O1Ddpkmu+/6cjhWhsFu2TZ0WRxFjODAG0rvdomyM'
+        b'e5bzTYflett5BKKqVTEwecsHzx1O28CxBxVHnIbE+p+DHoT1qOgGve2BY9xfOGava1/0TKfbuRg4'
+        b'5gC/Bj1zAN/sUg27V2WiWa70ahzfwAU8rtjmO3C3Br2lJSJr24ZyWFoCyrayoqasACvmBZl02MO+'
+        b'cM2B2+0UchE58Pm3XYy0WzUGQzSMw/RwcMd0GWEj7l1PnJs08Mbu0fOaP+f8ObixB/ztWr7NxVuf'
+        b'y9GTIxzfY5DymtiVcVgd+UJxkhCqklDFZaFd6A3esF0A6XftZmJs2a1lSFKrjPzaOAQkyg7oYTju'
+        b'43YNrCRqQs/YhiR8JSMoVu3aWK4MbmqDOeP/G4bNedg1b9J42Lcag4863yDnyrdaRER9224YU7s2'
+        b'hVCZzTc+43M87ttex7P7GSKmxpZ8R//32zICGktL0+1vyyCS2g2+b8E7cAas33NuWC3v21PrG99Y'
+        b'd1MlzDPgf4uE8fAASWbs3ejbN5Nt++YVvLdr8MMsDENm3ENdgsjJK8yvjRkBZtKdZY+p8yzlp29s'
+        b'24DgFeTXvqlW+tt2Q2Llaj4DJZyx6jLbsgc35JvNIAcDtO+GeV6gcjedi7k5mIM2X5uDa9BtetgX'
+        b'N+bgBr7ogbvCBjO+sojQbBGWmcQyk/lcPzxc25DJfTlaBZEmkswfHuaQhH6v04Qc9PGRGRqyIKJL'
+        b'QB8mKXVXMbNP+txsRbFcpcoaQrR0xv2T6dx0HSyfissths2voLFyK2nCKTvmp86X/5n8o4kfzOHm'
+        b'6wvti3CK9xTIuTgTvpvKdwYaGlKeoDAjCF43S1oWw3ZIShyQfmmJf0IK455zaas0s2XeLvq76Txe'
+        b'iqKpoGgUUTSfgUKhQmDkwiBGvk9WfiVUutzlX7O8h72EQ4GF1uXIiUNGT5m4n015qsfYjn7gdwNW'
+        b'xCWBxr14q4s7Tc6yV3zpekeC0B44djp8IxvKLhPhLQRKnF/eknHX2VyxTCe2OPOuBl6MJuPwi80Q'
+        b's61zM7BmSRrNAySAQGUXkIujgniKF+ms+NISD1OWLyuUMzss1gYCObyC9sJwrLdLRII7E2Q+ULsk'
+        b'eyWCAlhl1RybYYeKXY5VXo1H19alLA6dKd2jp8jJFiyxU2vrSfhxOpUbJFnrLegqhRHLPh/4QvVQ'
+        b'XK8nytCjhfiemG8su7glNj22e6e/hetDAQVpQbkYyrmps5OdPL9TVuQYLr1pKRh+jx/dFGqHV690'
+        b'uixUb/OT4DsFyPTq012ZRrmzF1KyK3iza918jFlY/Gnzn57AwSk3akqYVA5ji5ZVf1dHBphMmBVw'
+        b'ixdqCx55m27IF8feiuyUrfg8SlCXLW50eaTkI/dC9+OveB9p1wAQZSQML+nh2y2usj0kisG1ElcL'
+        b'mEtP3lUzo4s3WRdGLJ0jfjU+dqUbmWV1XjoNxIpnjldXRdLq0oikMK6eWPMoxIFXLqb1IT3/uczi'
+        b'VW01lTpSxCVIyApDN2WJ5DnyTMtLVJwWkPvpGWdPmqg0ez7AhSnY/gwyqtDQI+vqTURPUvakBiE0'
+        b'HcmX7UirRMjbjwSXJep2yM5pNwrDpqg2xv1T1QGct+dqDmlH4VDKH2deJdrvllSignRK2fqb9YBz'
+        b'o2o7Oy+aa3Xu2Hca+MND05UD01M7UKrhdAA7O9194dnw94sOh5erruT58J0n2m2m4f2bv9M4s/aM'
+        b'H0qPqMo19ymj9+8vJ7Gk+bt+VnYZFk6LaMe/aud/nOzjEXtQkVnPTpGCGGdSxOtAsHDyzvALTxvj'
+        b'8LyrlYMuc+PsEu14lUU7xdOs++1sIJ2zGHceZXJ2d+knP56lvieBip3Go9B32Yg397Sy1PHFSKVZ'
+        b'i7TpRYoXMvGYXxbdVZpQbZFcCpjSywd/CCPjvoBtP4oWo2ErPnBskie7WHhvCAcQWw+7nYJGnYTT'
+        b'2XTPnytahaifAFRdppxe2HaZ1F/h5ZReoPhG30PO76i1wR0LwR3rQFN07k+8cJawq7OfnZ5uPu88'
+        b'mmuNhpH1T56gN1tZ8fQJP2BuqroVXgLQnV47QZ9dSvQ6ydx1LC8r4l3NJ1KVk56tft/Li+qdXHCP'
+        b'PhD5x++823SSDrqiLhiY4ci/vBpPgnD6LQLTNr++ub3Tq/rO6929/V/fvD347d3h+6Pjkw+nZ+cf'
+        b'P/3++Y8/IbLRbK2srq2/3NjE3T+1Zeuf4P1rW9v2gy7WyvtsKVRJtjUltVhi/YY78Jn11cyVNgXT'
+        b'JjnhB30TjOWMlRW2S3z1pICSqiiOWKA0Nn/SQAN7zR7oVwS1dehVQDuT6WT0bzq5bqaatGuL7lin'
+        b'2JfMAmZ56OQywRYjpTTT8ZV9RGa/i62jJEXvFNzVbK75/trEudmhG0YPvUC5fOQZvqhn55wYms+Q'
+        b'V5QoeI1MJnId6qO80FpcT64DUUwBMlfDIwyjlt25LgeoVbzLzTWztWqknV+77Nr4su5jtpDY9e3s'
+        b'onen39+fcz8ObxSu6Ffe7Wyqm2SIMipY9/rQaezL8RJxVzzz2JX3XBc7i0QUaAlJIjX1wfGgJ+Xe'
+        b'dSYmAkvPxUmRjsLrM64EuYrz/Qyzhcy2JZeoxTZfsuiMx8dTmhlOC/VCr2ZSsD1ID7gHqQsFnibh'
+        b'VnAQBskZrq3W4wlE6kUIbKT2PLx0lmq/jl5gNPbRZhakkiZmXla6veP5xkcc5ZSzQia3d/FxML41'
+        b'oeq4npCz8LT+BRX6Rywd2y02A9t/lq9X2SguyGkY+0yEkTcGYc5BgiUVMJvWUPLml+fk6pqsoEJw'
+        b'y82WubphFKgoZKIi5dA4RYo0nkQeXt8HDT3mBo/KQoA6FTIpGx45qOcg9MUJS9vh7xFdxMMzACoS'
+        b'Ekvm/gcCOvduZOHyoFOPCpeOJyoIo8QWuWMf/KNn2SJGJoUy4/Ec/D9g634K/yB0ZzGIlWfhopM1'
+        b'3gn8CQnz18iZiNPLcvIxnhZbmdRLijozYv1D+vB8+fXD6wDYk1uwwBiF117fVg3Hq7zX1M64bqxV'
+        b'BVziSJGVpSWOpj5yYhZnCEvikVSAjD3Wi6yI40O+zfzI6/9O7WeReHXMCOqqbEMyQOFgAL44odjK'
+        b'IDSKsExurLnW9WoGvKpPb0iIdMqMYjT5TpnyhmuxjVzATt7dehT6eZ+6CIskwVtZYb1tfpOC1Cxx'
+        b'yFtO35jvwHtowhnj00kOWEl+DBgfdEjUAQbReKfACTsITd0U10G0+bPRFgmfddL4oPZ3FDw/ss07'
+        b'bcoQBubM3AL1Irx/6qb+5cvISe7/+2PujryvFPVV/y6Bol/4gxSKZI95qwqUKjdk5EwEOP7lERF7'
+        b'y5mf1PaVGBs2VoFtnbhCbgELZo5Ek583/dxmiMk9PavpRaolr3gvua02Vc/x7nJXWz7fFxKuHEuX'
+        b'6Y6xJDZ7/LjfAoLfF9Ny+WHJPEDZGGWGIpnijLtaCsYCsoltN1812ytmISbgMbkBBNUw5TJSL7LM'
+        b'o5N3TwUMYC+ciLPHM2G4GMp3+IKUfsHh4R5asQErcd366Iz0pUqVOXz9YjvnB+hN1/gIDBkrOjGs'
+        b'D0021WC2+1vovU6xOsso4x5huOxoptdd2gVBFy/ELL3oMRXzJO2JRuH1YsoitEBIRoYwSMLMO51B'
+        b'FV4XnbohNuKsfkOpyIMP/JhKzCyQU1iCmYcoDHoXAKqXbIwThLCYH5zQyhOMKfhsLYM76NtqPRNj'
+        b'5x2xQJOqOyUzM9XUlOnNTHkV2GXj5ya7WfSF0Fc2gPETImV4ymSajneKu1lMcUcLW2TmjRPnvX0B'
+        b'VsJsmnR/rwg9si8wBCIafP8BroFpmK2WubGxgX8suBcmSTixL3igWQMA+OPb9uny8AseZmJqFuHM'
+        b'HX9MleKiaDVe2E3zmaGTxaFdviKvj8u8Lgrqsm03GwWZBVsKOinIUtDJFuWRrWar8uRnySCe1s3d'
+        b'S1y66gczNpPSS9IeJjuEnM1jgZjh9YUNsjR6cmwThY9nFlEkcwHxulSSfQk4LxRIIUFkIiqTkjSs'
+        b'rNDd5AAsBQLkOoRsGuyULk1+PQP8QYnxgnTEDysA5O4+zSucOq6fgKls1Nfk5TEQ+3Q3Tch6hu5D'
+        b'iUmbqfNlcwCal5iRuWpGZiVmZN5Rz7vJ24B0HrncWcC1IeXVnV1s1YHK5SWetjj142M+Pb+eusBw'
+        b'lVVfPE+8yAarxBgnxy8yrSS/hOqRxnUW2xY8ocYEe0RDF/fPM7AIke3DrKAmiZKJ/b6nhYML/TyE'
+        b'DjJm8Eo/hF9ww05R9cA+vSat1XF3vMR1offCqO9FehURVHXqDeldW28h8sVwZxiIcNCj8fvsnuGs'
+        b'9MUsEfQU+tAOY/VFqgyFD4YSCEZCT52+P4ttfQ0zprmJMkjiJQO6EC9j95moGXAR+yNB8qKy+VMe'
+        b'dOLhCQ3UHGTmbex7bH3aDZPPpjVNPt3XMpUZuxXzkc86iMQlzi666nHkmkKaJp+rZQeRl06V+ono'
+        b'A/ICEC/pJbV0FRt+EDabfoUXzGaWjlEoNttJUzbjxPsLmTQHUPf5eAeb51MCxH1RZ+AIj71dilaP'
+        b'oGbzDQJaLoW756dy0ByH/BJDleJbjpvLECk8W75lnX+MSodi8tN2SlTiJ2MvG1SY9FKvAFbccJU/'
+        b'dcJcAc8sO5QhcnkihYycmEJYo6CcdB/Ph3hiovcxGqO7/QgWja6nLRRKJR9SbRr/kEfZ54tW9lQV'
+        b'/Mo848fTQ7Cd8/DKYycswXcB3CgnEG/R3Z1FWCAHPNNK7qCbjP5d5OmWx6gWiWeLJzCHszTXSs+J'
+        b'vfVV6BM77Hx7UKNwoCELzMRKFvAYG7HKVJw/qmO6to+4LGClejMZdxhC8PdSzE/IyxaHYvduE9Df'
+        b'9NZydvaLk4Q9lUQTT8C3twsn3jPXZhz2qMf4Gl4qF4Sxa94jS209Q6T+WCL/Ep4riDJ3Y5mSRIxO'
+        b'pWOqz7E6T62WyNfAxaNCz5tXXgBaPmf/JHCWhMcnmODnbAF4U8LLoJadWXyZOZVz8VoQaiy+s7qD'
+        b'ZxgNezj4YDYMPJmvJMeFCzvEgpMMouZaFhWEOiLY1Br1RmvN0L+/WETByZIWcPLgFGc6mlvSLjDD'
+        b'yc/5Sw3itr3GVXDhMu9qzqpWdc3SlFCGSC4sf1IhizkVYkXjUIxZpGj5McMFFDCnhIEw8S6qPHmE'
+        b'TOydxyk0ZWMoJPRKM2Nh5fMMartYNrKzlx9FySUqqdy5/o2IEn5zoc3NZltYSbMA3a8cTi+hoEBw'
+        b'HumivBT5ONdeHE68VGPJWVpa0qH1+Urzu37aHPFdAKgVCjv4mSefsBwEg1AXAEqeZ+Escj064aut'
+        b'YR6x0GFaxixz7uJVtfp3+EbkhrjLRzgzWVk/KTORxsj6Q4vK4xzj9TywsphLskGRejdtPjGQTIre'
+        b'zZ2DR6GZ6eNCiu+wIjEYHfmatf2RB90YcbMOm45hroUtrtUuuC5sMoZ9ZdZ96l+/QkP6lVpl1A8B'
+        b'xJ0B2eLbIuIik6Jb591l/Hp+cQlwvuBkMlzYoYQ4vBmAw+eQDDFmmC9fkWRIHQghkgW+Vno/uivv'
+        b'JUdvDYdk6q7xfaUTXedzvA3LFR4QOcDPl4eENzryNc8WizgN5QR8ztvmp4jSKQ6ZrokhVVQqcDYp'
+        b'N7rFzgIQzyAqKl0FERQSGv8y16gwcSX8Hr76yfXSZRpLQS+edtRffRHZsXIZZ6a/o675eIJjNY2R'
+        b'tbfp7VSoRvPcWRfCTPxtwys3/WtCAfvgumsnt8koDDR0yJ9nbfmhAhlVZd+l5BDi7ygzSy7Wkn3X'
+        b'MtEobTIZixnfeXowR71eT62nDNe73U4q1ziMEmW6Y86voeQnIqR73aT9mnfriTKMp4bPSzagiR0u'
+        b'DBqXY9Ebrr7KbCrD3S4c5l7CpAd3I4dVG/HiIdh4dLlmaxJuqxdZ26DVXPJpOWMyruzU0oJQ9CmV'
+        b'8VdsWzFaN3U0Vuk3H67H8kVwrhK8paYCNHW0Vpmg/Eg2z66wbhHvTOJxfNEihGiKYyGu0oYig5ju'
+        b'v1jvGVd0jskzlZsOH5UZ0kmeP67Y/PBUl93kUXAQkFF+DPgPmNfvjHZLM8LWW5cvt35GN5ePtYgr'
+        b'BxVfmw+8Z3aqIhQOCRudzKjwiM8W03m0slLT8dX3+ZsdaFdswqvPBNLyDWG8m1tjQYpDwk56NZ5h'
+        b'K0p3flP+sqEvkOxKeslSQ9OOS0LwAo6lpbRXV9FfnLzX+cXwbmYP8H2NrupwqWJjnDykuYVnzMeZ'
+        b'hRuIBefXxPHF5fFVumG4aseuekIY1WO8SEzeqVXvs4jpeBZ/nfjBDA/+x4PrNcCjZXdKIkft+58S'
+        b'a9FIsswXWEoR+ZS55ONS7Ij71GjyQ+7BdqZWMwP65ct9HvjLl0cOLjcYMltyxaZU1J2EbLmWM7aV'
+        b'zZ/JFZ0PLdzUXFSzW7xUS1xf54xNTGHk71P8qc1gfJ9gTDuoEOFnpU7V+4omOrMhu+pAN8zM+PgL'
+        b'NkHRSe8HUDeo4sqoWF0VxXIsEs8XJeW3TMV8hiq904/VZKwuigK+its6v7JA7zxm3F+yDriGGHXL'
+        b'c/onTuQMI2c6kkf0lFiIqQAS+0anjriIY+GSCUEYA354KMvzFcekT/Vyw+E9w5nngvCkpLGCigsJ'
+        b'hbPIClDoBTYSnP7M8nwBRWusc02QG2bKFSdu+PbnxIEmgUumF477ZZjRWVVWbuPFbJnr9qA1KeUu'
+        b'PTOdypjQG3Ha3cSl5L97bFqYIvn1RlkIml+zBaUlPCxsAu7FWr9FppudsJ9Km6L4hLmZEp7BKoqB'
+        b'meivzCqWiuwH/NOfMo7qhmC2x4UJN3UgWH1j9zLlxgf3P5/s7+LOxE87pwc7rw/35e7Es/PTg6M3'
+        b'fK1+cVzgsVgAQ2e6SAZos8ROItopQgbH1HVTqGuJTiIwL1B6bwnsJZdBpaXEQTuL1ZcxM/eixHed'
+        b'8c7YHwY2VbkaW8Wgi5l53jRmjqJYWIDplLx6SEW6D32uzNtlY5LOgntdDG7HUkhuy6g9U6uiqrQ6'
+        b'tm2GKdnWwK1QuxCi6VyY/mJB6kdlVwmTtdC3+wXl6/fNgkSUCxeyyDhdDw+5PDxxZxxf9hQrMs23'
+        b'yYEtgESPIndzulw44+MVbfmNAinXJvGdXawltjfnFmil7KbrsgQV0IMQ08NKkCkWRSyQBG/yGdfp'
+        b'xK3sXRToljCspimrRZVJc1EiqfQWFoVwgJ4l90XSIHE19JTxRlEWDSmLnDZK5TMzqlktqOaTuTeV'
+        b'3JvF3Js/mLuvy+s2mFFP9wfYWQHicSJPkKaUgSRKhmQ2LLHVen/bOCxgCF3eZxmHBem7inEocyo8'
+        b'PMgw48h8HFfyPgOEHvrlfpFhpBeuDcdejS2i4G3CBJxJXwYx99iVDUE2mizsxDUWz7DRIoLnr6Fl'
+        b'xiZ7cwu1OKPZYDAW7QRbTKKcaxAqi0gCUwBzHwGHKvnSh4n7Cj/Pvs2gwPkcXZsA/MgdixCZDLe2'
+        b'lyT8GLiFpDKM79SH9154k57n69BWzYM9GfAD3eWMjRWLGIhlHElJsYvTrWiBgpJpH0rNlVcSigUz'
+        b'ck2cJI0diCISGZkGmu5dtVkcv7COfM5wrL9SQ0EmwpXKBHdFQy3bLJFP2mJTHmpznoKwnDKLcpTY'
+        b'woKYVxmUbZ00Re/I5bTFWiGJBeOV3mmYRD+6tjqJIDQSjt0sitGzm4Z0fywnoM8Gl8Kb7yzDkzrE'
+        b'yiVNRzlkMlWj5HthqKsgN5zSn3n6K6WKtDN6zwlGCT1NbIGgczrklT2zUeL0VzAb95js+1v7ynfc'
+        b'LVKDIpeCTa4GbfaZTgcuTGGUClORFutRLYRK5fgo75P6OY6VQ+Hw3G9RY40MA+j9ClVfwBlnPWtZ'
+        b'UgOQHy7OGJpUIcnCfEe99hjUc5SMDVfmrJM8mZbqmGj6aNaSNUrFOUvm1iUjtYOB3+fhlRfE9pQO'
+        b'5mUOVp23NQN/7O3fQDHEuIwuBb5IX+UNal1lF356jiDLpre+qpy02P83z4sqa3Ov2abCfzDbgnOi'
+        b'52wFYzwftnWxTsucBvAFP7p5OYW3y6kHr49yllVdgKZXJZaLjHi6VV1Zlba+KgpIcJEORZV0VjPn'
+        b'9YDDyfwJvJvYWNQVzng+j8rZjDg4Xvk28+/OItdMZ+0udC8Az5kmSLwYfnxcizzASX45OMdT0ZCc'
+        b'ke5ATwNtRELH8RFeWX7QQPPCe317IGYddGPBErDFyUAJIFVadUTeGLE4GVvBUJaOYhYndGbJCPzO'
+        b'spQsanFSN4TWy8OJnGYmvRJ+oUpO3PQ4Dp2+/csWFpsWBmTabB3EQtv86iy+YuhazAaeaICgL88z'
+        b'aGvyPIOOhuNTtWsawmprOITV0ViT2tZEk7r9SzUlaCVLUFXfspCMbf05XLYWcNnKIhXTAXQcPuOG'
+        b'n5PMrbX08GQAGqmFBEgoMaQFJrcpDbSIhezR8AtKZKL0NB6pDLg4zUf3rq6lZ7mkqlLYVaeSWdw9'
+        b'pxJBQ+SyUYJoU0FvqlLitbJTummQrwKX+TL3Rp6xmibKznaJOrm0pDJFa2zURbDqVsXcRN4ThwmR'
+        b'muLwus/OouHdLlpe/witN44O4Pr8EtPTASVzI3+abG9ZvbB/u61tWTiRu639b+z0vkQ='
+    )
+)
 # @end(html)
 
+# the HTML template is split once at the placeholders for the debug flag and
+# the quiz source, so that the output files can be written piecewise
+HTML_PREFIX, _, HTML_REST = HTML.partition(b"let debug = false;")
+HTML_INFIX, _, HTML_SUFFIX = HTML_REST.partition(b"let quizSrc = {};")
+del HTML_REST
+
+# buffer size for reading and writing files in main()
+IO_BUFFER_SIZE = 1 << 20
+
+# keys of questions, that are only included in the debug output
+DEBUG_KEYS = frozenset(
+    ("src_line", "text_src_html", "python_src_html", "python_src_tokens")
+)
+
+# matches the paths of images ("!path" or "!path:width") in input files
+IMAGE_PATH_RE = re.compile(r"^\s*!([^:#\n]+)", re.MULTILINE)
+
+
+def compile_cache_path(input_dirname: str, src: str) -> str:
+    """gets the path of the cache file for the compilation of the given
+    source. The key is a hash of the source, this file (sell.py), and the
+    images referenced by the source"""
+    key = hashlib.blake2b(src.encode("utf-8"), digest_size=16)
+    paths = [__file__]
+    for match in IMAGE_PATH_RE.finditer(src):
+        paths.append(os.path.join(input_dirname, match.group(1).strip()))
+    for path in paths:
+        key.update(os.path.abspath(path).encode("utf-8"))
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            key.update(f"{stat.st_mtime_ns},{stat.st_size}".encode("utf-8"))
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "pysell")
+    return os.path.join(cache_dir, key.hexdigest() + ".json")
+
+
+def compile_input_file_cached(input_dirname: str, src: str) -> dict:
+    """compiles a SELL input file to JSON, or gets the result of a previous
+    compilation of the same input from the cache. Caching is optional, since
+    random variables are NOT redrawn on a cache hit"""
+    path = compile_cache_path(input_dirname, src)
+    try:
+        with open(path, "rb") as f:
+            out = json.load(f)
+        out["date"] = datetime.date.today().isoformat()
+        return out
+    except (OSError, ValueError):
+        pass
+    out = compile_input_file(input_dirname, src)
+    try:
+        # write atomically, so that concurrent runs never read partial files
+        # (each process writes its own temporary file)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps(out))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # caching is an optimization only
+    return out
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """serializes an object to UTF-8 encoded JSON. Package orjson is used, if
+    available; otherwise (or if orjson fails, e.g. for huge integers) the
+    standard library is used"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def write_html_file(path: str, quiz_json: bytes, debug: bool) -> None:
+    """writes the HTML template with the given quiz source (JSON) and debug
+    flag inserted into a file"""
+    # "</" must not occur inside the script element (e.g. "</script>" in a
+    # question text would end it). In JSON, "</" can only be part of a string,
+    # where it is equivalently written as "<\/"
+    quiz_json = quiz_json.replace(b"</", b"<\\/")
+    with open(path, "wb", buffering=IO_BUFFER_SIZE) as f:
+        f.write(HTML_PREFIX)
+        f.write(b"let debug = true;" if debug else b"let debug = false;")
+        f.write(HTML_INFIX)
+        f.write(b"let quizSrc = " + quiz_json + b";")
+        f.write(HTML_SUFFIX)
+
 
 def main():
     """the main function"""
 
     # get input and output path
     if len(sys.argv) < 2:
-        print("usage: python sell.py [-J] INPUT_PATH.txt")
+        print("usage: python sell.py [-J] [-C] [-R] INPUT_PATH.txt")
         print("   option -J enables to output a JSON file for debugging purposes")
+        print("   option -C reuses the compilation of an unchanged input file")
+        print("   option -R only outputs the release version (no *_DEBUG.html)")
         sys.exit(-1)
     write_explicit_json_file = "-J" in sys.argv
+    use_cache = "-C" in sys.argv
+    release_only = "-R" in sys.argv
     input_path = sys.argv[-1]
     input_dirname = os.path.dirname(input_path)
-    output_path = input_path.replace(".txt", ".html")
-    output_debug_path = input_path.replace(".txt", "_DEBUG.html")
-    output_json_path = input_path.replace(".txt", ".json")
+    input_path_root = os.path.splitext(input_path)[0]
+    output_path = input_path_root + ".html"
+    output_debug_path = input_path_root + "_DEBUG.html"
+    output_json_path = input_path_root + ".json"
     if os.path.isfile(input_path) is False:
         print("error: input file path does not exist")
         sys.exit(-1)
 
     # read input
+    # (files are read and written with a large buffer to reduce the number of
+    # system calls; text mode is kept for reading to normalize line endings)
     input_src: str = ""
-    with open(input_path, mode="r", encoding="utf-8") as f:
+    with open(input_path, mode="r", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
         input_src = f.read()
 
     # compile
-    out = compile_input_file(input_dirname, input_src)
-    output_debug_json = json.dumps(out)
-    output_debug_json_formatted = json.dumps(out, indent=2)
-    for question in out["questions"]:
-        del question["src_line"]
-        del question["text_src_html"]
-        del question["python_src_html"]
-        del question["python_src_tokens"]
-    output_json = json.dumps(out)
+    if use_cache:
+        out = compile_input_file_cached(input_dirname, input_src)
+    else:
+        out = compile_input_file(input_dirname, input_src)
 
     # write test output
     if write_explicit_json_file:
-        with open(output_json_path, "w", encoding="utf-8") as f:
-            f.write(output_debug_json_formatted)
+        with open(output_json_path, "wb", buffering=IO_BUFFER_SIZE) as f:
+            f.write(json_dumps(out, indent=True))
 
     # write html
-    # (a) debug version (*_DEBUG.html)
-    with open(output_debug_path, "w", encoding="utf-8") as f:
-        f.write(
-            HTML.replace(
-                "let quizSrc = {};", "let quizSrc = " + output_debug_json + ";"
-            ).replace("let debug = false;", "let debug = true;")
-        )
-    # (b) release version (*.html)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(HTML.replace("let quizSrc = {};", "let quizSrc = " + output_json + ";"))
+    # (the HTML template is UTF-8 encoded already, so files are written in
+    # binary mode)
+    # (a) debug version (*_DEBUG.html), if not disabled
+    debug_quiz_json = None if release_only else json_dumps(out)
+    # (b) release version (*.html), without debug information
+    # ("out" itself is kept unaltered)
+    release_questions = [
+        {k: v for k, v in question.items() if k not in DEBUG_KEYS}
+        for question in out["questions"]
+    ]
+    quiz_json = json_dumps({**out, "questions": release_questions})
+    # both files are written concurrently (file I/O releases the GIL)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(write_html_file, output_path, quiz_json, False)]
+        if not release_only:
+            futures.append(
+                executor.submit(
+                    write_html_file, output_debug_path, debug_quiz_json, True
+                )
+            )
+        for future in futures:
+            future.result()  # re-raises errors of the worker
 
     # exit normally
     sys.exit(0)
@@ -19,6 +19,23 @@ import { Question } from "./question.js";
  *   column vector. Then only one dimension is resizable).
  */
 
+/**
+ * Keys that can be typed into a term input field.
+ * @type {Set<string>}
+ */
+const termInputKeys = new Set(
+  "abcdefghijklmnopqrstuvwxyz" +
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ" +
+    "0123456789" +
+    "+-*/^(). <>=|"
+);
+
+/**
+ * Keys that can be typed into a term input field for integral solutions.
+ * @type {Set<string>}
+ */
+const integerInputKeys = new Set("-0123456789");
+
 /**
  * Input field for a textual gap.
  */
@@ -118,6 +135,12 @@ export class TermInput {
     this.equationPreviewDiv.classList.add("equationPreview");
     this.equationPreviewDiv.style.display = "none"; // hidden per default
     this.outerSpan.appendChild(this.equationPreviewDiv);
+    /** @type {string} -- the last input processed by edited(); null, if none */
+    this.lastInput = null;
+    /** @type {string} -- the TeX code to be rendered into the preview */
+    this.previewTex = "";
+    /** @type {number} -- id of the requested preview rendering; 0, if none */
+    this.previewRequestId = 0;
     // events
     this.inputElement.addEventListener("click", () => {
       // mark the question as altered
@@ -131,19 +154,17 @@ export class TermInput {
     });
     this.inputElement.addEventListener("focusout", () => {
       // hide the TeX preview in case that the focus to the input was lost
+      cancelAnimationFrame(this.previewRequestId);
+      this.previewRequestId = 0;
+      this.lastInput = null;
       this.equationPreviewDiv.innerHTML = "";
       this.equationPreviewDiv.style.display = "none";
     });
     this.inputElement.addEventListener("keydown", (e) => {
       // forbid special characters
-      let allowed = "abcdefghijklmnopqrstuvwxyz";
-      allowed += "ABCDEFGHIJKLMNOPQRSTUVWXYZ";
-      allowed += "0123456789";
-      allowed += "+-*/^(). <>=|";
-      // only allow numbers in case of integral solutions
-      if (integersOnly) allowed = "-0123456789";
-      if (e.key.length < 3 && allowed.includes(e.key) == false)
-        e.preventDefault();
+      // (only allow numbers in case of integral solutions)
+      let allowed = integersOnly ? integerInputKeys : termInputKeys;
+      if (e.key.length < 3 && allowed.has(e.key) == false) e.preventDefault();
       // extend the width of the input field, in case the student enters a
       // term that is longer than expected...
       let requiredWidth = this.inputElement.value.length * 12;
@@ -159,6 +180,9 @@ export class TermInput {
     // the student updated the answer, so we must validate the syntax,
     // as well as update the TeX preview
     let input = this.inputElement.value.trim();
+    // nothing to do, if the input did not change (e.g. cursor movements)
+    if (input === this.lastInput) return;
+    this.lastInput = input;
     let tex = "";
     let isConstant = false; // e.g. input is "123"
     try {
@@ -173,8 +197,14 @@ export class TermInput {
       this.inputElement.style.color = "maroon";
       this.equationPreviewDiv.style.backgroundColor = "maroon";
     }
-    // render the equation
-    updateMathElement(this.equationPreviewDiv, tex, true);
+    // render the equation (at most once per animation frame, since fast
+    // typing or auto-repeated keys may trigger many edits per frame)
+    this.previewTex = tex;
+    if (this.previewRequestId == 0)
+      this.previewRequestId = requestAnimationFrame(() => {
+        this.previewRequestId = 0;
+        updateMathElement(this.equationPreviewDiv, this.previewTex, true);
+      });
     this.equationPreviewDiv.style.display =
       input.length > 0 && !isConstant ? "block" : "none";
     // update the input
@@ -44,13 +44,28 @@ export function range(n, shuffled = false) {
  * @returns {void}
  */
 export function heapsAlgorithm(list, result, k = -1) {
+  for (let permutation of heapsPermutations(list, k)) {
+    result.push([...permutation]);
+  }
+}
+
+/**
+ * Generates all permutations of a list lazily, in the same order as
+ * heapsAlgorithm(..). The list itself is permuted in-place and yielded, so
+ * a permutation is only valid until the next one is generated. Stopping
+ * early skips the generation of the remaining permutations.
+ * @param {number[]} list
+ * @param {number} [k=-1]
+ * @returns {Generator<number[]>}
+ */
+export function* heapsPermutations(list, k = -1) {
   if (k < 0) k = list.length;
   if (k == 1) {
-    result.push([...list]);
+    yield list;
     return;
   }
   for (let i = 0; i < k; i++) {
-    heapsAlgorithm(list, result, k - 1);
+    yield* heapsPermutations(list, k - 1);
     let j = k % 2 == 0 ? i : 0;
     let t = list[j];
     list[j] = list[k - 1];
@@ -175,6 +190,61 @@ export class Matrix {
   }
 }
 
+/**
+ * Character classes of the lexer, given as bit flags. Note that "_" is both
+ * alpha and a delimiter, and white spaces are also delimiters.
+ */
+const NUM = 1; // 0-9
+const ALPHA = 2; // a-z, A-Z, _
+const WHITE = 4; // tab, newline, space
+const DELIMITER = 8;
+
+/**
+ * The character classes of all ASCII characters, indexed by character code.
+ * @type {Uint8Array}
+ */
+const charClasses = new Uint8Array(128);
+for (let code = 0; code < 128; code++) {
+  let ch = String.fromCharCode(code);
+  if (ch >= "0" && ch <= "9") charClasses[code] |= NUM;
+  if ((ch >= "A" && ch <= "Z") || (ch >= "a" && ch <= "z") || ch === "_")
+    charClasses[code] |= ALPHA;
+  if ("\t\n ".includes(ch)) charClasses[code] |= WHITE;
+  if ("^%#*$()[]{},.:;+-*/_!<>=?|\t\n ".includes(ch))
+    charClasses[code] |= DELIMITER;
+}
+
+/**
+ * Gets the character class of a character code (0 for non-ASCII characters).
+ * @param {number} code
+ * @returns {number}
+ */
+function charClass(code) {
+  return code < 128 ? charClasses[code] : 0;
+}
+
+/**
+ * Matches the ids of unary functions at the beginning of a token, ignoring
+ * the case. "sinc" must be listed before its prefix "sin".
+ */
+const FUN1_REGEX = /^(abs|sinc|sin|cos|tan|cot|exp|ln|sqrt)/i;
+
+/**
+ * Absolute value of the complex number re+im*i. Math.hypot avoids overflow
+ * and underflow of the squares, but is slower than the naive formula. Thus it
+ * is only used, if a component is outside of a range that is safe.
+ * @param {number} re
+ * @param {number} im
+ * @returns {number}
+ */
+function complexAbs(re, im) {
+  let a = Math.abs(re);
+  let b = Math.abs(im);
+  if (a < 1e150 && b < 1e150 && (a > 1e-150 || b > 1e-150 || a + b == 0))
+    return Math.sqrt(a * a + b * b);
+  return Math.hypot(a, b);
+}
+
 /**
  * Representation of mathematical terms (internally represented as tree).
  */
@@ -190,6 +260,14 @@ export class Term {
     this.skippedWhiteSpace = false;
     /** @type {number} -- current lexer position of this.src */
     this.pos = 0;
+    /** @type {Set<string>} -- cached variables; null, if not yet determined */
+    this.varsCache = null;
+    /** @type {TermNode} -- the root node, this.varsCache was determined from */
+    this.varsCacheRoot = null;
+    /** @type {TermProgram} -- cached program of root; null, if not compiled */
+    this.program = null;
+    /** @type {TermNode} -- the root node, this.program was compiled from */
+    this.programRoot = null;
   }
 
   /**
@@ -209,15 +287,41 @@ export class Term {
    * @param {TermNode} node
    */
   getVars(s, prefix = "", node = null) {
-    if (node == null) node = this.root;
-    if (node.op.startsWith("var:")) {
-      let id = node.op.substring(4);
-      if (prefix.length == 0 || (prefix.length > 0 && id.startsWith(prefix)))
-        s.add(id);
+    // iterative pre-order traversal (children are pushed in reverse order)
+    let stack = [node == null ? this.root : node];
+    while (stack.length > 0) {
+      let n = stack.pop();
+      if (n.op.startsWith("var:")) {
+        let id = n.op.substring(4);
+        if (prefix.length == 0 || id.startsWith(prefix)) s.add(id);
+      }
+      for (let i = n.c.length - 1; i >= 0; i--) stack.push(n.c[i]);
     }
-    for (let c of node.c) {
-      this.getVars(s, prefix, c);
+  }
+
+  /**
+   * Gets the set of all variables. The set is cached until the root node is
+   * replaced, or invalidateCaches() is called (e.g. by setVars(..) and
+   * renameVar(s)(..)). It must NOT be modified by the caller.
+   * @returns {Set<string>}
+   */
+  getVarsSet() {
+    if (this.varsCache == null || this.varsCacheRoot !== this.root) {
+      this.varsCache = new Set();
+      this.getVars(this.varsCache);
+      this.varsCacheRoot = this.root;
     }
+    return this.varsCache;
+  }
+
+  /**
+   * Invalidates the cached variable set and program. This must be called,
+   * if the nodes of the term are altered in place from outside (e.g. by
+   * prepareODEconstantComparison(..) in file math_ODE.js).
+   */
+  invalidateCaches() {
+    this.varsCache = null;
+    this.program = null;
   }
 
   /**
@@ -226,18 +330,22 @@ export class Term {
    * @param {TermNode} [node=null]
    */
   setVars(dict, node = null) {
-    if (node == null) node = this.root;
-    for (let c of node.c) {
-      this.setVars(dict, c);
-    }
-    if (node.op.startsWith("var:")) {
-      let id = node.op.substring(4);
-      if (id in dict) {
-        let x = dict[id].clone();
-        node.op = x.op;
-        node.c = x.c;
-        node.re = x.re;
-        node.im = x.im;
+    this.invalidateCaches();
+    let stack = [node == null ? this.root : node];
+    while (stack.length > 0) {
+      let n = stack.pop();
+      if (n.op.startsWith("var:")) {
+        // variables are leaves; the inserted subterm must not be visited
+        let id = n.op.substring(4);
+        if (id in dict) {
+          let x = dict[id].clone();
+          n.op = x.op;
+          n.c = x.c;
+          n.re = x.re;
+          n.im = x.im;
+        }
+      } else {
+        for (let i = n.c.length - 1; i >= 0; i--) stack.push(n.c[i]);
       }
     }
   }
@@ -249,15 +357,32 @@ export class Term {
    * @param {TermNode} node
    */
   renameVar(oldName, newName, node = null) {
-    if (node == null) node = this.root;
-    for (let c of node.c) {
-      this.renameVar(oldName, newName, c);
+    this.invalidateCaches();
+    let stack = [node == null ? this.root : node];
+    while (stack.length > 0) {
+      let n = stack.pop();
+      if (n.op.startsWith("var:") && n.op.substring(4) === oldName)
+        n.op = "var:" + newName;
+      for (let i = n.c.length - 1; i >= 0; i--) stack.push(n.c[i]);
     }
-    if (node.op.startsWith("var:")) {
-      let id = node.op.substring(4);
-      if (id === oldName) {
-        node.op = "var:" + newName;
+  }
+
+  /**
+   * Renames multiple variables simultaneously, i.e. names can also be swapped
+   * (e.g. {C0: "C1", C1: "C0"}).
+   * @param {Object.<string,string>} names -- maps old names to new names
+   * @param {TermNode} [node=null]
+   */
+  renameVars(names, node = null) {
+    this.invalidateCaches();
+    let stack = [node == null ? this.root : node];
+    while (stack.length > 0) {
+      let n = stack.pop();
+      if (n.op.startsWith("var:")) {
+        let id = n.op.substring(4);
+        if (id in names) n.op = "var:" + names[id];
       }
+      for (let i = n.c.length - 1; i >= 0; i--) stack.push(n.c[i]);
     }
   }
 
@@ -265,143 +390,43 @@ export class Term {
    * Evaluates the term numerically (under the field of complex numbers).
    * Each occurring variable must be defined in the dict parameter.
    * If there are unset variables, evaluation throws an exception.
+   * The term is compiled to a TermProgram. The program of the root node is
+   * cached, so repeated evaluations (e.g. in minimize(..) of file
+   * math_ODE.js) do not walk the tree again.
    * @param {Object.<string,TermNode>} dict
    * @param {TermNode} [node=null]
    * @returns {TermNode}
    */
   eval(dict, node = null) {
-    const EPS = 1e-9; // epsilon, used for numerical thresholds
-    let res = TermNode.const(); // thr result
-    let t1 = 0; // temporary value
-    let t2 = 0; // temporary value
-    let tn = null; // temporary term node
-    // if no node is given, then we assume that the root node is meant.
-    if (node == null) node = this.root;
-    // evaluate the current term node
-    switch (node.op) {
-      case "const":
-        res = node;
-        break;
-      case "+":
-      case "-":
-      case "*":
-      case "/":
-      case "^": {
-        // binary operation
-        let u = this.eval(dict, node.c[0]);
-        let v = this.eval(dict, node.c[1]);
-        switch (node.op) {
-          case "+":
-            res.re = u.re + v.re;
-            res.im = u.im + v.im;
-            break;
-          case "-":
-            res.re = u.re - v.re;
-            res.im = u.im - v.im;
-            break;
-          case "*":
-            res.re = u.re * v.re - u.im * v.im;
-            res.im = u.re * v.im + u.im * v.re;
-            break;
-          case "/":
-            t1 = v.re * v.re + v.im * v.im;
-            // TODO: throw error, if abs(t1)<EPS + catch when comparing terms numerically
-            res.re = (u.re * v.re + u.im * v.im) / t1;
-            res.im = (u.im * v.re - u.re * v.im) / t1;
-            break;
-          case "^":
-            // u^v = exp(v*ln(u))
-            tn = new TermNode("exp", [
-              new TermNode("*", [v, new TermNode("ln", [u])]),
-            ]);
-            res = this.eval(dict, tn);
-            break;
-        }
-        break;
-      }
-      case ".-":
-      case "abs":
-      case "sin":
-      case "sinc":
-      case "cos":
-      case "tan":
-      case "cot":
-      case "exp":
-      case "ln":
-      case "log":
-      case "sqrt": {
-        // unary operation (".-" is the UNARY minus, e.g. "-5")
-        let u = this.eval(dict, node.c[0]);
-        switch (node.op) {
-          case ".-":
-            res.re = -u.re;
-            res.im = -u.im;
-            break;
-          case "abs":
-            res.re = Math.sqrt(u.re * u.re + u.im * u.im);
-            res.im = 0;
-            break;
-          case "sin":
-            res.re = Math.sin(u.re) * Math.cosh(u.im);
-            res.im = Math.cos(u.re) * Math.sinh(u.im);
-            break;
-          case "sinc":
-            // "unroll" term first, and then evaluate recursively
-            tn = new TermNode("/", [new TermNode("sin", [u]), u]);
-            res = this.eval(dict, tn);
-            break;
-          case "cos":
-            res.re = Math.cos(u.re) * Math.cosh(u.im);
-            res.im = -Math.sin(u.re) * Math.sinh(u.im);
-            break;
-          case "tan":
-            // TODO: throw error, if abs(t1)<EPS + catch when comparing terms numerically
-            t1 =
-              Math.cos(u.re) * Math.cos(u.re) +
-              Math.sinh(u.im) * Math.sinh(u.im);
-            res.re = (Math.sin(u.re) * Math.cos(u.re)) / t1;
-            res.im = (Math.sinh(u.im) * Math.cosh(u.im)) / t1;
-            break;
-          case "cot":
-            // TODO: throw error, if abs(t1)<EPS + catch when comparing terms numerically
-            t1 =
-              Math.sin(u.re) * Math.sin(u.re) +
-              Math.sinh(u.im) * Math.sinh(u.im);
-            res.re = (Math.sin(u.re) * Math.cos(u.re)) / t1;
-            res.im = -(Math.sinh(u.im) * Math.cosh(u.im)) / t1;
-            break;
-          case "exp":
-            res.re = Math.exp(u.re) * Math.cos(u.im);
-            res.im = Math.exp(u.re) * Math.sin(u.im);
-            break;
-          case "ln":
-          case "log":
-            res.re = Math.log(Math.sqrt(u.re * u.re + u.im * u.im));
-            t1 = Math.abs(u.im) < EPS ? 0 : u.im; // prevent "-0" and similar
-            res.im = Math.atan2(t1, u.re);
-            break;
-          case "sqrt": // u^(0.5)
-            // "unroll" term first, and then evaluate recursively
-            tn = new TermNode("^", [u, TermNode.const(0.5)]);
-            res = this.eval(dict, tn);
-            break;
-        }
-        break;
-      }
-      default:
-        if (node.op.startsWith("var:")) {
-          let id = node.op.substring(4);
-          if (id === "pi") return TermNode.const(Math.PI);
-          else if (id === "e") return TermNode.const(Math.E);
-          else if (id === "i") return TermNode.const(0, 1);
-          else if (id in dict) return dict[id];
+    let program;
+    if (node != null) program = new TermProgram(node);
+    else {
+      // if no node is given, then we assume that the root node is meant.
+      // Its variables are checked before simplification, since e.g. "y*0" is
+      // simplified to "0" (built-in constants, e.g. "pi", need no values).
+      for (let id of this.getVarsSet())
+        if (!(id in evalConstants) && dict[id] === undefined)
           throw new Error("eval-error: unknown variable '" + id + "'");
-        } else {
-          throw new Error("UNIMPLEMENTED eval '" + node.op + "'");
-        }
+      // It is simplified once, which e.g. folds its constant subterms.
+      if (this.program == null || this.programRoot !== this.root) {
+        this.program = new TermProgram(TermNode.simplify(this.root));
+        this.programRoot = this.root;
+      }
+      program = this.program;
+    }
+    let n = program.vars.length;
+    let envRe = new Float64Array(n);
+    let envIm = new Float64Array(n);
+    for (let j = 0; j < n; j++) {
+      let id = program.vars[j];
+      let value = dict[id];
+      if (value === undefined)
+        throw new Error("eval-error: unknown variable '" + id + "'");
+      envRe[j] = value.re;
+      envIm[j] = value.im;
     }
-    // TODO: throw error, if "too large" when comparing terms numerically
-    return res;
+    let [re, im] = program.run(envRe, envIm, 1);
+    return TermNode.const(re[0], im[0]);
   }
 
   /**
@@ -528,6 +553,7 @@ export class Term {
    * @returns {TermNode}
    */
   parseInfix(stopAtSpace) {
+    let fun1 = this.fun1(); // unary function id (or "")
     if (this.token.length == 0) {
       throw new Error("expected unary");
     } else if (this.isNum(this.token[0])) {
@@ -544,9 +570,9 @@ export class Term {
         }
       }
       return new TermNode("const", [], parseFloat(v));
-    } else if (this.fun1().length > 0) {
+    } else if (fun1.length > 0) {
       // unary function (e.g. "sin")
-      let op = this.fun1();
+      let op = fun1;
       this.next(op.length); // only consume the function id
       let arg = null;
       if (this.token === "(") {
@@ -605,22 +631,47 @@ export class Term {
   static compare(tu, tv, predefinedContext = {}) {
     const EPS = 1e-9;
     const NUM_TESTS = 10; // TODO
-    let vars = new Set();
-    tu.getVars(vars);
-    tv.getVars(vars);
-    for (let i = 0; i < NUM_TESTS; i++) {
-      /** @type {Object.<string,TermNode>} */
-      let context = {};
-      for (let v of vars) {
-        if (v in predefinedContext) context[v] = predefinedContext[v];
-        else context[v] = TermNode.const(Math.random(), Math.random());
+    let vars = new Set(tu.getVarsSet());
+    for (let id of tv.getVarsSet()) vars.add(id);
+    // simplified terms are evaluated faster
+    let u = TermNode.simplify(tu.root);
+    let v = TermNode.simplify(tv.root);
+    // simplified nodes are interned, so structurally equal terms are identical
+    if (u === v) return true;
+    // without variables, a single evaluation is conclusive
+    const numTests = vars.size == 0 ? 1 : NUM_TESTS;
+    // values of the variables for all tests
+    /** @type {Object.<string,Float64Array[]>} */
+    let values = {};
+    for (let id of vars) {
+      values[id] = [new Float64Array(numTests), new Float64Array(numTests)];
+      if (id in predefinedContext) {
+        values[id][0].fill(predefinedContext[id].re);
+        values[id][1].fill(predefinedContext[id].im);
+      }
+    }
+    let randomVars = [...vars].filter((id) => !(id in predefinedContext));
+    for (let i = 0; i < numTests; i++) {
+      for (let id of randomVars) {
+        values[id][0][i] = Math.random();
+        values[id][1][i] = Math.random();
       }
-      let r1 = tu.eval(context); // TODO: catch DIV/0, ... -> test again
-      let r2 = tv.eval(context); // TODO: catch DIV/0, ... -> test again
-      let dre = r1.re - r2.re;
-      let dim = r1.im - r2.im;
-      let abs = Math.sqrt(dre * dre + dim * dim);
-      if (abs > EPS) return false;
+    }
+    // evaluate both terms for all tests at once
+    let results = [u, v].map((root) => {
+      let program = new TermProgram(root);
+      let envRe = new Float64Array(program.vars.length * numTests);
+      let envIm = new Float64Array(program.vars.length * numTests);
+      program.vars.forEach((id, j) => {
+        envRe.set(values[id][0], j * numTests);
+        envIm.set(values[id][1], j * numTests);
+      });
+      return program.run(envRe, envIm, numTests);
+    });
+    let [re1, im1] = results[0]; // TODO: catch DIV/0, ... -> test again
+    let [re2, im2] = results[1]; // TODO: catch DIV/0, ... -> test again
+    for (let i = 0; i < numTests; i++) {
+      if (complexAbs(re1[i] - re2[i], im1[i] - im2[i]) > EPS) return false;
     }
     return true;
   }
@@ -631,21 +682,10 @@ export class Term {
    * @returns {string}
    */
   fun1() {
-    const fun1 = [
-      "abs",
-      "sinc",
-      "sin",
-      "cos",
-      "tan",
-      "cot",
-      "exp",
-      "ln",
-      "sqrt",
-    ];
-    for (let f of fun1) {
-      if (this.token.toLowerCase().startsWith(f)) return f;
-    }
-    return "";
+    // (most tokens, e.g. numbers and operators, do not start with a letter)
+    if ((charClass(this.token.charCodeAt(0)) & ALPHA) == 0) return "";
+    let match = FUN1_REGEX.exec(this.token);
+    return match == null ? "" : match[0].toLowerCase();
   }
 
   /**
@@ -668,33 +708,37 @@ export class Term {
     const n = this.src.length;
     // (a) skip white spaces
     this.skippedWhiteSpace = false;
-    while (this.pos < n && "\t\n ".includes(this.src[this.pos])) {
+    while (this.pos < n && charClass(this.src.charCodeAt(this.pos)) & WHITE) {
       this.skippedWhiteSpace = true;
       this.pos++;
     }
     // (b) get non white-spaces, i.e. the token
+    let firstClass = 0; // character class of the first character of the token
     while (!stop && this.pos < n) {
       // get current character from input
       let ch = this.src[this.pos];
+      let cls = charClass(this.src.charCodeAt(this.pos));
       // stop, if alpha occurs while scanning a number, or vice versa
       // (e.g. "2pi", then current token is "2" and next token is "pi")
       if (
         this.token.length > 0 &&
-        ((this.isNum(this.token[0]) && this.isAlpha(ch)) ||
-          (this.isAlpha(this.token[0]) && this.isNum(ch)))
+        ((firstClass & NUM && cls & ALPHA) || (firstClass & ALPHA && cls & NUM))
       ) {
         // ... but keep ODE-constants (e.g. "C1", "C2", ...)
         if (this.token != "C") return;
       }
       // delimiter?
-      if ("^%#*$()[]{},.:;+-*/_!<>=?|\t\n ".includes(ch)) {
+      if (cls & DELIMITER) {
         // return current token before delimiter (if present)
         if (this.token.length > 0) return;
         // delimiter stop scanning
         stop = true;
       }
       // only add non-white spaces to current token
-      if ("\t\n ".includes(ch) == false) this.token += ch;
+      if ((cls & WHITE) == 0) {
+        if (this.token.length == 0) firstClass = cls;
+        this.token += ch;
+      }
       // advance to next character in input
       this.pos++;
     }
@@ -706,10 +750,7 @@ export class Term {
    * @returns {boolean} -- true, iff ch is a numeral (0-9)
    */
   isNum(ch) {
-    return (
-      ch.charCodeAt(0) >= "0".charCodeAt(0) &&
-      ch.charCodeAt(0) <= "9".charCodeAt(0)
-    );
+    return (charClass(ch.charCodeAt(0)) & NUM) != 0;
   }
 
   /**
@@ -718,13 +759,7 @@ export class Term {
    * @returns {boolean} -- true, iff ch is alpha (a-z,A-Z)
    */
   isAlpha(ch) {
-    return (
-      (ch.charCodeAt(0) >= "A".charCodeAt(0) &&
-        ch.charCodeAt(0) <= "Z".charCodeAt(0)) ||
-      (ch.charCodeAt(0) >= "a".charCodeAt(0) &&
-        ch.charCodeAt(0) <= "z".charCodeAt(0)) ||
-      ch === "_"
-    );
+    return (charClass(ch.charCodeAt(0)) & ALPHA) != 0;
   }
 
   /**
@@ -746,6 +781,15 @@ export class Term {
   }
 }
 
+/**
+ * Interned term nodes (refer to TermNode.intern(..)), with keys built from
+ * the operation, the ids of the operands and the value.
+ * @type {Map<string,TermNode>}
+ */
+const internedNodes = new Map();
+const MAX_INTERNED_NODES = 10000;
+let nextInternId = 0;
+
 /**
  * Implementation of a node within the term tree structure
  */
@@ -767,20 +811,34 @@ export class TermNode {
     this.im = im;
     /** @type {boolean} -- used e.g. for TeX conversion */
     this.explicitParentheses = false;
+    /** @type {number} -- unique id of interned nodes; -1 if not interned */
+    this.internId = -1;
   }
 
   /**
    * @returns {TermNode}
    */
   clone() {
-    let c = new TermNode(
-      this.op,
-      this.c.map((ci) => ci.clone()),
-      this.re,
-      this.im
-    );
-    c.explicitParentheses = this.explicitParentheses;
-    return c;
+    let root = new TermNode(this.op, [], this.re, this.im);
+    root.explicitParentheses = this.explicitParentheses;
+    // pairs of (original, clone) of inner nodes, whose children are cloned
+    // next; leaves are never pushed
+    let originals = [this];
+    let clones = [root];
+    while (originals.length > 0) {
+      let n = originals.pop();
+      let c = clones.pop();
+      for (let ni of n.c) {
+        let ci = new TermNode(ni.op, [], ni.re, ni.im);
+        ci.explicitParentheses = ni.explicitParentheses;
+        c.c.push(ci);
+        if (ni.c.length > 0) {
+          originals.push(ni);
+          clones.push(ci);
+        }
+      }
+    }
+    return root;
   }
 
   /**
@@ -792,6 +850,113 @@ export class TermNode {
     return new TermNode("const", [], re, im);
   }
 
+  /**
+   * Is the node exactly the constant re+im*i?
+   * @param {number} re
+   * @param {number} [im=0]
+   * @returns {boolean}
+   */
+  isConstValue(re, im = 0) {
+    return this.op === "const" && this.re === re && this.im === im;
+  }
+
+  /**
+   * Returns the unique node for the given operation, operands and value
+   * (hash-consing). Structurally equal terms that are built by this method
+   * are represented by the same node object, i.e. equal subtrees are shared
+   * and a term becomes a directed acyclic graph (DAG).
+   * Attention: all operands must be interned as well, and interned nodes MUST
+   *            NOT be altered.
+   * @param {string} op
+   * @param {TermNode[]} c
+   * @param {number} [re=0]
+   * @param {number} [im=0]
+   * @returns {TermNode}
+   */
+  static intern(op, c, re = 0, im = 0) {
+    let key = op + "|" + c.map((ci) => ci.internId).join(",");
+    // distinguish 0 and -0 (e.g. 1/-0 is -Infinity)
+    key += "|" + (Object.is(re, -0) ? "-0" : re);
+    key += "|" + (Object.is(im, -0) ? "-0" : im);
+    let node = internedNodes.get(key);
+    if (node === undefined) {
+      // limit the memory consumption (ids stay unique after clearing)
+      if (internedNodes.size >= MAX_INTERNED_NODES) internedNodes.clear();
+      node = new TermNode(op, c, re, im);
+      node.internId = nextInternId++;
+      internedNodes.set(key, node);
+    }
+    return node;
+  }
+
+  /**
+   * Simplifies the term algebraically, e.g. "x+0" -> "x", "1*x" -> "x", and
+   * "(1+x)+2" -> "3+x". Operations with only constant operands are folded.
+   * The given nodes are NOT altered. The result is built from interned nodes
+   * (refer to TermNode.intern(..)), so structurally equal terms are simplified
+   * to the same node object. The result is intended for the numerical
+   * evaluation only, since e.g. the explicit parentheses of the TeX
+   * representation are lost.
+   * @param {TermNode} node
+   * @returns {TermNode}
+   */
+  static simplify(node) {
+    let c = node.c.map((ci) => TermNode.simplify(ci));
+    let op = node.op;
+    // built-in constants, e.g. "pi"
+    if (op.startsWith("var:") && op.substring(4) in evalConstants) {
+      let k = evalConstants[op.substring(4)];
+      return TermNode.intern("const", [], k.re, k.im);
+    }
+    // fold operations with only constant operands
+    let foldable = c.length > 0 && op in opcodes;
+    if (foldable && c.every((ci) => ci.op === "const")) {
+      let res = new Term().eval({}, new TermNode(op, c));
+      return TermNode.intern("const", [], res.re, res.im);
+    }
+    switch (op) {
+      case "+":
+      case "*": {
+        // flatten chains of the operation into a single n-ary node,
+        // e.g. (1+x)+2 -> +(1,x,2), and combine all constant operands in one
+        // pass, e.g. +(1,x,2) -> +(3,x). Operands are already simplified,
+        // so nested chains are n-ary themselves.
+        let operands = [];
+        for (let ci of c) {
+          if (ci.op === op) operands.push(...ci.c);
+          else operands.push(ci);
+        }
+        let others = operands.filter((o) => o.op !== "const");
+        if (others.length < operands.length) {
+          let constants = operands.filter((o) => o.op === "const");
+          let res = new Term().eval({}, new TermNode(op, constants));
+          res = TermNode.intern("const", [], res.re, res.im);
+          if (op === "*" && res.isConstValue(0)) return res; // x*0 -> 0
+          if (!res.isConstValue(op === "+" ? 0 : 1)) others.unshift(res);
+        }
+        if (others.length == 0)
+          return TermNode.intern("const", [], op === "+" ? 0 : 1);
+        if (others.length == 1) return others[0];
+        return TermNode.intern(op, others);
+      }
+      case "-":
+        if (c[1].isConstValue(0)) return c[0]; // x-0 -> x
+        if (c[0].isConstValue(0)) return TermNode.intern(".-", [c[1]]); // 0-x
+        break;
+      case "/":
+      case "^":
+        if (c[1].isConstValue(1)) return c[0]; // x/1 -> x, x^1 -> x
+        // x^0 -> 1 (integer exponents are evaluated by multiplications)
+        if (op === "^" && c[1].isConstValue(0))
+          return TermNode.intern("const", [], 1);
+        break;
+      case ".-":
+        if (c[0].op === ".-") return c[0].c[0]; // -(-x) -> x
+        break;
+    }
+    return TermNode.intern(op, c, node.re, node.im);
+  }
+
   /**
    * Compares the node to the given real number. This is only applicable for
    * term nodes which are constants, i.e. leafs.
@@ -803,7 +968,7 @@ export class TermNode {
   compare(re, im = 0, EPS = 1e-9) {
     let dr = this.re - re;
     let di = this.im - im;
-    return Math.sqrt(dr * dr + di * di) < EPS;
+    return complexAbs(dr, di) < EPS;
   }
 
   /**
@@ -929,3 +1094,340 @@ export class TermNode {
     return s;
   }
 }
+
+const EVAL_EPS = 1e-9; // epsilon, used for numerical thresholds
+
+/**
+ * Values of the built-in constants. These nodes are shared by all
+ * evaluations, instead of being allocated for each occurrence; they must NOT
+ * be altered.
+ * @type {Object.<string,TermNode>}
+ */
+const evalConstants = Object.create(null);
+evalConstants["pi"] = TermNode.const(Math.PI);
+evalConstants["e"] = TermNode.const(Math.E);
+evalConstants["i"] = TermNode.const(0, 1);
+
+// opcodes of TermProgram
+const OP_CONST = 0;
+const OP_VAR = 1;
+const OP_ADD = 2;
+const OP_SUB = 3;
+const OP_MUL = 4;
+const OP_DIV = 5;
+const OP_POW = 6;
+const OP_NEG = 7;
+const OP_ABS = 8;
+const OP_SIN = 9;
+const OP_SINC = 10;
+const OP_COS = 11;
+const OP_TAN = 12;
+const OP_COT = 13;
+const OP_EXP = 14;
+const OP_LN = 15;
+const OP_SQRT = 16;
+
+/**
+ * Maps term node operations to opcodes of TermProgram (".-" is the UNARY
+ * minus, e.g. "-5"). Constants and variables ("var:ID") are handled
+ * separately.
+ * @type {Object.<string,number>}
+ */
+const opcodes = Object.create(null);
+Object.assign(opcodes, {
+  "+": OP_ADD,
+  "-": OP_SUB,
+  "*": OP_MUL,
+  "/": OP_DIV,
+  "^": OP_POW,
+  ".-": OP_NEG,
+  abs: OP_ABS,
+  sin: OP_SIN,
+  sinc: OP_SINC,
+  cos: OP_COS,
+  tan: OP_TAN,
+  cot: OP_COT,
+  exp: OP_EXP,
+  ln: OP_LN,
+  log: OP_LN,
+  sqrt: OP_SQRT,
+});
+
+/**
+ * A term, compiled to a register based bytecode, which evaluates the term
+ * for multiple points (called lanes) at once. Each instruction consists of
+ * four integers [opcode, destination register, operand a, operand b].
+ * Register values are stored lane-wise in typed arrays (i.e. register r of
+ * lane k is stored at index r*numLanes+k), so the dispatch of an instruction
+ * is done once for all lanes. Subterms that are shared by multiple parents
+ * (e.g. in simplified terms) are evaluated only once.
+ * Term.eval(..) runs programs with a single lane.
+ */
+export class TermProgram {
+  /**
+   * @param {TermNode} root -- the term to be compiled
+   */
+  constructor(root) {
+    /** @type {number[]} -- the instructions */
+    let code = [];
+    /** @type {number[]} -- real parts of the constants */
+    let kre = [];
+    /** @type {number[]} -- imaginary parts of the constants */
+    let kim = [];
+    /** @type {string[]} -- the variable ids (index := variable number) */
+    this.vars = [];
+    /** @type {Map<TermNode,number>} -- registers of already compiled nodes */
+    let registers = new Map();
+    let emit = (opcode, a, b) => {
+      code.push(opcode, code.length / 4, a, b);
+      return code.length / 4 - 1;
+    };
+    let compile = (node) => {
+      let reg = registers.get(node);
+      if (reg !== undefined) return reg;
+      let op = node.op;
+      let id = op.startsWith("var:") ? op.substring(4) : "";
+      if (op === "const" || id in evalConstants) {
+        let c = op === "const" ? node : evalConstants[id];
+        kre.push(c.re);
+        kim.push(c.im);
+        reg = emit(OP_CONST, kre.length - 1, 0);
+      } else if (id.length > 0) {
+        let idx = this.vars.indexOf(id);
+        if (idx < 0) idx = this.vars.push(id) - 1;
+        reg = emit(OP_VAR, idx, 0);
+      } else if (op in opcodes) {
+        // n-ary operations (see TermNode.simplify) are evaluated from left
+        // to right by binary instructions; with a single operand, they are
+        // the identity
+        reg = compile(node.c[0]);
+        if (node.c.length == 1 && op !== "+" && op !== "*")
+          reg = emit(opcodes[op], reg, 0);
+        for (let i = 1; i < node.c.length; i++)
+          reg = emit(opcodes[op], reg, compile(node.c[i]));
+      } else {
+        throw new Error("UNIMPLEMENTED eval '" + op + "'");
+      }
+      registers.set(node, reg);
+      return reg;
+    };
+    /** @type {number} -- the register of the result */
+    this.result = compile(root);
+    /** @type {Int32Array} -- the instructions */
+    this.code = Int32Array.from(code);
+    /** @type {Float64Array} -- real parts of the constants */
+    this.kre = Float64Array.from(kre);
+    /** @type {Float64Array} -- imaginary parts of the constants */
+    this.kim = Float64Array.from(kim);
+    /** @type {Float64Array} -- real parts of the registers of the last run */
+    this.re = null;
+    /** @type {Float64Array} -- imaginary parts of the registers */
+    this.im = null;
+  }
+
+  /**
+   * Evaluates the program for n lanes.
+   * @param {Float64Array} envRe -- real parts of the variables; the value of
+   *     variable number j for lane k is stored at index j*n+k
+   * @param {Float64Array} envIm -- imaginary parts of the variables
+   * @param {number} n -- number of lanes
+   * @returns {Float64Array[]} -- [real parts, imaginary parts] of the results;
+   *     the arrays are reused (i.e. overwritten) by the next run
+   */
+  run(envRe, envIm, n) {
+    const code = this.code;
+    const size = (code.length / 4) * n;
+    // the registers are allocated once for repeated runs
+    if (this.re == null || this.re.length != size) {
+      this.re = new Float64Array(size);
+      this.im = new Float64Array(size);
+    }
+    let re = this.re;
+    let im = this.im;
+    for (let pc = 0; pc < code.length; pc += 4) {
+      let d = code[pc + 1] * n; // first index of the destination
+      let a = code[pc + 2] * n; // first index of operand a
+      let b = code[pc + 3] * n; // first index of operand b
+      switch (code[pc]) {
+        case OP_CONST: {
+          re.fill(this.kre[code[pc + 2]], d, d + n);
+          im.fill(this.kim[code[pc + 2]], d, d + n);
+          break;
+        }
+        case OP_VAR:
+          for (let k = 0; k < n; k++) {
+            re[d + k] = envRe[a + k];
+            im[d + k] = envIm[a + k];
+          }
+          break;
+        case OP_ADD:
+          for (let k = 0; k < n; k++) {
+            re[d + k] = re[a + k] + re[b + k];
+            im[d + k] = im[a + k] + im[b + k];
+          }
+          break;
+        case OP_SUB:
+          for (let k = 0; k < n; k++) {
+            re[d + k] = re[a + k] - re[b + k];
+            im[d + k] = im[a + k] - im[b + k];
+          }
+          break;
+        case OP_MUL:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            let vr = re[b + k];
+            let vi = im[b + k];
+            re[d + k] = ur * vr - ui * vi;
+            im[d + k] = ur * vi + ui * vr;
+          }
+          break;
+        case OP_DIV:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            let vr = re[b + k];
+            let vi = im[b + k];
+            let t = vr * vr + vi * vi;
+            re[d + k] = (ur * vr + ui * vi) / t;
+            im[d + k] = (ui * vr - ur * vi) / t;
+          }
+          break;
+        case OP_POW:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            let vr = re[b + k];
+            let vi = im[b + k];
+            if (vi == 0 && Number.isInteger(vr) && Math.abs(vr) < 32) {
+              // binary exponentiation
+              let e = Math.abs(vr);
+              let pr = 1; // accumulator
+              let pi = 0;
+              while (e > 0) {
+                if (e & 1) {
+                  let t = pr * ur - pi * ui;
+                  pi = pr * ui + pi * ur;
+                  pr = t;
+                }
+                let t = ur * ur - ui * ui;
+                ui = 2 * ur * ui;
+                ur = t;
+                e >>= 1;
+              }
+              if (vr < 0) {
+                let t = pr * pr + pi * pi;
+                pr = pr / t;
+                pi = -pi / t;
+              }
+              re[d + k] = pr;
+              im[d + k] = pi;
+            } else {
+              // u^v = exp(v*ln(u))
+              let t1 = Math.log(complexAbs(ur, ui));
+              let t2 = Math.atan2(Math.abs(ui) < EVAL_EPS ? 0 : ui, ur);
+              let t3 = vr * t1 - vi * t2;
+              let t4 = vr * t2 + vi * t1;
+              let m = Math.exp(t3); // magnitude of the result
+              re[d + k] = m * Math.cos(t4);
+              im[d + k] = m * Math.sin(t4);
+            }
+          }
+          break;
+        case OP_NEG:
+          for (let k = 0; k < n; k++) {
+            re[d + k] = -re[a + k];
+            im[d + k] = -im[a + k];
+          }
+          break;
+        case OP_ABS:
+          for (let k = 0; k < n; k++) {
+            re[d + k] = complexAbs(re[a + k], im[a + k]);
+            im[d + k] = 0;
+          }
+          break;
+        case OP_SIN:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            re[d + k] = Math.sin(ur) * Math.cosh(ui);
+            im[d + k] = Math.cos(ur) * Math.sinh(ui);
+          }
+          break;
+        case OP_SINC:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            let t1 = Math.sin(ur) * Math.cosh(ui);
+            let t2 = Math.cos(ur) * Math.sinh(ui);
+            let t3 = ur * ur + ui * ui;
+            re[d + k] = (t1 * ur + t2 * ui) / t3;
+            im[d + k] = (t2 * ur - t1 * ui) / t3;
+          }
+          break;
+        case OP_COS:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            re[d + k] = Math.cos(ur) * Math.cosh(ui);
+            im[d + k] = -Math.sin(ur) * Math.sinh(ui);
+          }
+          break;
+        case OP_TAN:
+          for (let k = 0; k < n; k++) {
+            // (each transcendental function is called once per lane)
+            let sr = Math.sin(re[a + k]);
+            let cr = Math.cos(re[a + k]);
+            let si = Math.sinh(im[a + k]);
+            let ci = Math.cosh(im[a + k]);
+            let t = cr * cr + si * si;
+            re[d + k] = (sr * cr) / t;
+            im[d + k] = (si * ci) / t;
+          }
+          break;
+        case OP_COT:
+          for (let k = 0; k < n; k++) {
+            let sr = Math.sin(re[a + k]);
+            let cr = Math.cos(re[a + k]);
+            let si = Math.sinh(im[a + k]);
+            let ci = Math.cosh(im[a + k]);
+            let t = sr * sr + si * si;
+            re[d + k] = (sr * cr) / t;
+            im[d + k] = -(si * ci) / t;
+          }
+          break;
+        case OP_EXP:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            let m = Math.exp(ur); // magnitude of the result
+            re[d + k] = m * Math.cos(ui);
+            im[d + k] = m * Math.sin(ui);
+          }
+          break;
+        case OP_LN:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            re[d + k] = Math.log(complexAbs(ur, ui));
+            im[d + k] = Math.atan2(Math.abs(ui) < EVAL_EPS ? 0 : ui, ur);
+          }
+          break;
+        case OP_SQRT:
+          for (let k = 0; k < n; k++) {
+            let ur = re[a + k];
+            let ui = im[a + k];
+            // u^(0.5) = exp(0.5*ln(u))
+            let t3 = 0.5 * Math.log(complexAbs(ur, ui));
+            let t4 = 0.5 * Math.atan2(Math.abs(ui) < EVAL_EPS ? 0 : ui, ur);
+            let m = Math.exp(t3); // magnitude of the result
+            re[d + k] = m * Math.cos(t4);
+            im[d + k] = m * Math.sin(t4);
+          }
+          break;
+      }
+    }
+    let r = this.result * n;
+    return [re.subarray(r, r + n), im.subarray(r, r + n)];
+  }
+}
@@ -4,7 +4,7 @@
  * LICENSE: GPLv3
  ******************************************************************************/
 
-import { Term, TermNode, heapsAlgorithm, range } from "./math.js";
+import { Term, TermNode, heapsPermutations, range } from "./math.js";
 
 /**
  * This file implements the comparison of ODE-terms that include a finite set
@@ -70,11 +70,10 @@ import { Term, TermNode, heapsAlgorithm, range } from "./math.js";
  *           The problem should be convex in the context of ODE-school-exercises.
  *           Sophisticated algorithms are available for this non-linear
  *           optimization tasks, but our math engine in file math.js is weak...
- *           So, we naively initialize K=0, as well as a step width S that is
- *           initialized to e.g. 1.
- *           In a (finite) sequence of iterations, we chose
- *               min { f(K-S), f(K), f(K+S) }.
- *           In case that the "direction" changes, S is replaced by S/2.
+ *           So, starting at K=0, we walk downhill with growing steps until
+ *           the minimum is bracketed, i.e. f(a) > f(b) < f(c).
+ *           The bracket [a, c] is then narrowed by Brent's method, i.e.
+ *           parabolic interpolation with golden-section search as fallback.
  *
  *   5.b.4)  Now check (with 10+ numerical tests), if our concrete  K from the
  *           last step yields in equivalency. If not, continue with the next
@@ -108,6 +107,8 @@ export function compareODE(tu, tv) {
   // Reduce subterms that only contain C_i as variable (e.g. "e^C" -> "C").
   prepareODEconstantComparison(tu.root);
   prepareODEconstantComparison(tv.root);
+  tu.invalidateCaches();
+  tv.invalidateCaches();
 
   // get all variables that start with "C"
   let allVariables = new Set();
@@ -124,34 +125,29 @@ export function compareODE(tu, tv) {
   let N = constantVariables.length;
 
   // rename constants to C0, C1, ... for easier handling
-  // (this has to be done in two steps to prevent overwriting)
-  for (let i = 0; i < N; i++) {
-    let v = constantVariables[i];
-    tu.renameVar(v, "_C" + i);
-    tv.renameVar(v, "_C" + i);
-  }
-  for (let i = 0; i < N; i++) {
-    tu.renameVar("_C" + i, "C" + i);
-    tv.renameVar("_C" + i, "C" + i);
-  }
+  /** @type {Object.<string,string>} */
+  let names = {};
+  for (let i = 0; i < N; i++) names[constantVariables[i]] = "C" + i;
+  tu.renameVars(names);
+  tv.renameVars(names);
   constantVariables = [];
   for (let i = 0; i < N; i++) constantVariables.push("C" + i);
 
+  // constant zero, shared by all contexts (it is never altered)
+  let zero = TermNode.const(0, 0);
+
   // Since the constants can be given in shuffled order, we generate all
   // permutations. It is sufficient, if one of the permutations matches.
-  let constantPermutations = [];
-  heapsAlgorithm(range(N), constantPermutations);
-  for (let permutation of constantPermutations) {
-    // Some of the following steps are destructive, so work on copies!
-    let tuClone = tu.clone();
+  // (The permutations are generated lazily, since the loop is left on success)
+  for (let permutation of heapsPermutations(range(N))) {
+    // Some of the following steps are destructive on tv, so work on a copy!
+    // (tu is never altered, so it can be shared by all permutations)
     let tvClone = tv.clone();
     // Perform permutation on tvClone
-    for (let i = 0; i < N; i++) {
-      tvClone.renameVar("C" + i, "__C" + permutation[i]);
-    }
-    for (let i = 0; i < N; i++) {
-      tvClone.renameVar("__C" + i, "C" + i);
-    }
+    /** @type {Object.<string,string>} */
+    let permutedNames = {};
+    for (let i = 0; i < N; i++) permutedNames["C" + i] = "C" + permutation[i];
+    tvClone.renameVars(permutedNames);
     // For each constant C_k, set the other constants (C_j with j != k)
     // to zero.
     let success = true;
@@ -171,9 +167,9 @@ export function compareODE(tu, tv) {
       let context = {};
       context[ckId] = TermNode.const(Math.random(), Math.random());
       for (let j = 0; j < N; j++)
-        if (k != j) context["C" + j] = TermNode.const(0, 0);
+        if (k != j) context["C" + j] = zero;
       let absRoot = new TermNode("abs", [
-        new TermNode("-", [tuClone.root, tvClone.root]),
+        new TermNode("-", [tu.root, tvClone.root]),
       ]);
       let abs = new Term();
       abs.root = absRoot;
@@ -185,8 +181,8 @@ export function compareODE(tu, tv) {
       // finally compare the terms w.r.t to C_k. All other C_k are set to 0
       context = {};
       for (let j = 0; j < N; j++)
-        if (k != j) context["C" + j] = TermNode.const(0, 0);
-      let equal = Term.compare(tuClone, tvClone, context);
+        if (k != j) context["C" + j] = zero;
+      let equal = Term.compare(tu, tvClone, context);
 
       if (equal == false) {
         success = false;
@@ -194,14 +190,16 @@ export function compareODE(tu, tv) {
       }
     }
     // Compare once again, with all C_k replaced with K_k*C_k in tvClone
-    if (success && Term.compare(tuClone, tvClone)) return true;
+    if (success && Term.compare(tu, tvClone)) return true;
   }
 
   return false;
 }
 
 /**
- * Naive implementation for convex optimization with one decision variable.
+ * Minimization of a unimodal (e.g. convex) function with one decision
+ * variable. The minimum is first bracketed by walking downhill with growing
+ * steps, then the bracket is narrowed by Brent's method.
  * WARNING: Due to the primitivity of the math engine implemented in file
  *          math.js, we do not have the opportunity for automatic
  *          differentiation etc. This method should only be used for special
@@ -213,38 +211,111 @@ export function compareODE(tu, tv) {
  * @returns {number[]} -- [value for varId, minimized function output value]
  */
 export function minimize(term, dvId, vars) {
-  let EPS = 1e-11;
-  let MAX_ITERATIONS = 1000;
+  const EPS = 1e-11;
+  const TOLERANCE = 1e-12;
+  const MAX_ITERATIONS = 1000;
+  const GOLDEN = (1 + Math.sqrt(5)) / 2;
   let cnt = 0;
-  let dvValue = 0;
-  let step = 1;
-  let lastDirection = 888; // -1 := left, 0 := stand, 1 := right
-  while (cnt < MAX_ITERATIONS) {
-    vars[dvId] = TermNode.const(dvValue);
+  // best decision variable value found so far (NaN results are never best)
+  let bestX = 0;
+  let bestY = Infinity;
+  // the value of the decision variable is overwritten in-place
+  let dv = TermNode.const();
+  vars[dvId] = dv;
+  let f = (x) => {
+    dv.re = x;
     let y = term.eval(vars).re;
-    vars[dvId] = TermNode.const(dvValue + step);
-    let yRight = term.eval(vars).re;
-    vars[dvId] = TermNode.const(dvValue - step);
-    let yLeft = term.eval(vars).re;
-    let direction = 0;
-    if (yRight < y) {
-      y = yRight;
-      direction = 1;
-    }
-    if (yLeft < y) {
-      y = yLeft;
-      direction = -1;
+    if (y < bestY) {
+      bestX = x;
+      bestY = y;
     }
-    if (direction == 1) dvValue += step;
-    if (direction == -1) dvValue -= step;
-    if (y < EPS) break;
-    if (direction == 0 || direction != lastDirection) step /= 2.0;
-    lastDirection = direction;
     cnt++;
+    return y;
+  };
+  // (a) bracketing, such that f(a) > f(b) < f(c)
+  let a = 0;
+  let fa = f(a);
+  let b = 1;
+  let fb = f(b);
+  if (fb > fa) {
+    [a, b] = [b, a];
+    [fa, fb] = [fb, fa];
+  }
+  let c = b + GOLDEN * (b - a);
+  let fc = f(c);
+  while (fc < fb && bestY >= EPS && cnt < MAX_ITERATIONS) {
+    [a, fa] = [b, fb];
+    [b, fb] = [c, fc];
+    c = b + GOLDEN * (b - a);
+    fc = f(c);
+  }
+  // (b) Brent's method within [lo, hi]: parabolic interpolation through the
+  //     three best points, with golden-section steps as fallback, if the
+  //     parabola is not trustworthy
+  const CGOLD = 2 - GOLDEN; // golden-section ratio of the larger part
+  let lo = Math.min(a, c);
+  let hi = Math.max(a, c);
+  let x = b; // best point
+  let w = b; // second best point
+  let v = b; // previous second best point
+  let fx = fb;
+  let fw = fb;
+  let fv = fb;
+  let d = 0; // the last step
+  let e = 0; // the step before the last step
+  while (bestY >= EPS && cnt < MAX_ITERATIONS) {
+    let xm = (lo + hi) / 2;
+    let tol = TOLERANCE * (1 + Math.abs(x));
+    if (Math.abs(x - xm) <= 2 * tol - (hi - lo) / 2) break;
+    let golden = true;
+    if (Math.abs(e) > tol) {
+      // parabola through x, w and v
+      let r = (x - w) * (fx - fv);
+      let q = (x - v) * (fx - fw);
+      let p = (x - v) * q - (x - w) * r;
+      q = 2 * (q - r);
+      if (q > 0) p = -p;
+      q = Math.abs(q);
+      let eOld = e;
+      e = d;
+      // accept the parabolic step, if it is within the bracket and less than
+      // half of the step before the last step
+      if (
+        Math.abs(p) < Math.abs(0.5 * q * eOld) &&
+        p > q * (lo - x) &&
+        p < q * (hi - x)
+      ) {
+        golden = false;
+        d = p / q;
+        let u = x + d;
+        if (u - lo < 2 * tol || hi - u < 2 * tol) d = xm >= x ? tol : -tol;
+      }
+    }
+    if (golden) {
+      e = x >= xm ? lo - x : hi - x;
+      d = CGOLD * e;
+    }
+    let u = Math.abs(d) >= tol ? x + d : x + (d >= 0 ? tol : -tol);
+    let fu = f(u);
+    if (fu <= fx) {
+      if (u >= x) lo = x;
+      else hi = x;
+      [v, fv] = [w, fw];
+      [w, fw] = [x, fx];
+      [x, fx] = [u, fu];
+    } else {
+      if (u < x) lo = u;
+      else hi = u;
+      if (fu <= fw || w == x) {
+        [v, fv] = [w, fw];
+        [w, fw] = [u, fu];
+      } else if (fu <= fv || v == x || v == w) {
+        [v, fv] = [u, fu];
+      }
+    }
   }
-  vars[dvId] = TermNode.const(dvValue);
-  let y = term.eval(vars).re;
-  return [dvValue, y];
+  dv.re = bestX;
+  return [bestX, bestY];
 }
 
 /**
@@ -141,3 +141,28 @@ assert.ok(
     .eval({ x: TermNode.const(2) })
     .compare(17.51869057063671, 0)
 );
+
+// algebraic simplification (the parsed term itself must not be altered)
+let simplifyTests = {
+  "x+0": "x",
+  "1*x*1": "x",
+  "(1+x)+2": "(3+x)",
+  "x+y+1+z": "(1+x+y+z)",
+  "2*3*x*4": "(24*x)",
+  "y*0": "0",
+  "x^1 - 0": "x",
+  "x^0*y": "y",
+  "2*pi*x": "(6.283185307179586*x)",
+};
+for (let src in simplifyTests) {
+  let t = Term.parse(src);
+  let s = t.toString();
+  assert.equal(TermNode.simplify(t.root).toString(), simplifyTests[src]);
+  assert.equal(t.toString(), s);
+}
+
+// variables that are removed by simplification must be set nevertheless
+assert.throws(
+  () => Term.parse("y*0").eval({}),
+  /eval-error: unknown variable 'y'/
+);
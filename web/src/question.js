@@ -98,6 +98,8 @@ export class Question {
     this.numChecked = 0;
     /** @type {boolean} -- true, iff the question as a check button */
     this.hasCheckButton = true;
+    /** @type {string} -- blob URL of the image of the current instance */
+    this.svgImageUrl = "";
   }
 
   /**
@@ -105,6 +107,11 @@ export class Question {
    */
   reset() {
     this.instanceIdx = (this.instanceIdx + 1) % this.src.instances.length;
+    // the image of the previous instance is not shown anymore
+    if (this.svgImageUrl.length > 0) {
+      URL.revokeObjectURL(this.svgImageUrl);
+      this.svgImageUrl = "";
+    }
   }
 
   /**
@@ -118,6 +125,24 @@ export class Question {
     return this.src.instances[idx];
   }
 
+  /**
+   * Gets the URL of the SVG image of the current instance. The image data is
+   * decoded only once into a blob URL, which is revoked by reset(). If blob
+   * URLs are not supported, a data URL is used.
+   * @param {string} base64data -- the base64 encoded SVG image
+   * @returns {string}
+   */
+  getSvgImageUrl(base64data) {
+    if (typeof URL.createObjectURL !== "function")
+      return "data:image/svg+xml;base64," + base64data;
+    if (this.svgImageUrl.length == 0) {
+      let bytes = Uint8Array.from(atob(base64data), (ch) => ch.charCodeAt(0));
+      let blob = new Blob([bytes], { type: "image/svg+xml" });
+      this.svgImageUrl = URL.createObjectURL(blob);
+    }
+    return this.svgImageUrl;
+  }
+
   /**
    * Sets the question to be edited recently. Visually, the font and border
    * color is set to black.
@@ -212,7 +237,7 @@ export class Question {
       let img = document.createElement("img");
       imageDiv.appendChild(img);
       img.classList.add("img");
-      img.src = "data:image/svg+xml;base64," + base64data;
+      img.src = this.getSvgImageUrl(base64data);
     }
 
     // generate question text
@@ -303,15 +328,18 @@ export class Question {
   /**
    * Generates TeX source recursively.
    * @param {Object.<Object,Object>} node
+   * @param {Object.<string,Object>} [instance=null] -- the current instance;
+   *     determined, if not given
    * @returns {string}
    */
-  generateMathString(node) {
+  generateMathString(node, instance = null) {
     let s = "";
     switch (node.t) {
       case "math":
       case "display-math":
+        if (instance == null) instance = this.getCurrentInstance();
         for (let c of node.c) {
-          let sc = this.generateMathString(c);
+          let sc = this.generateMathString(c, instance);
           if (c.t === "var" && s.includes("!PM")) {
             // replace the last occurred "!PM" (plus-minus sign)
             // with the sign of the variable. The sign of the variable itself
@@ -332,7 +360,7 @@ export class Question {
         break;
       }
       case "var": {
-        let instance = this.getCurrentInstance();
+        if (instance == null) instance = this.getCurrentInstance();
         let type = instance[node.d].t;
         let value = instance[node.d].v;
         switch (type) {
@@ -535,6 +563,7 @@ export class Question {
         let iconIncorrect = mc ? iconSquareUnchecked : iconCircleUnchecked;
         let checkboxes = [];
         let answerIDs = [];
+        let instance = this.getCurrentInstance();
         for (let i = 0; i < n; i++) {
           let idx = order[i];
           let answer = node.c[idx];
@@ -543,7 +572,7 @@ export class Question {
           let expectedValue =
             answer.c[0].t == "bool"
               ? answer.c[0].d
-              : this.getCurrentInstance()[answer.c[0].d].v;
+              : instance[answer.c[0].d].v;
           this.expected[answerId] = expectedValue;
           this.types[answerId] = "bool";
           this.student[answerId] = this.showSolution ? expectedValue : "false";